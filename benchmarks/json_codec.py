@@ -0,0 +1,69 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure how long it takes to decode torrent-get responses
+
+Usage: python3 benchmarks/json_codec.py [RESPONSE FILE ...]
+
+Without arguments, fake responses with 1k, 10k and 50k torrents are decoded.
+Response files are recorded torrent-get responses (e.g. from the debug log).
+"""
+
+import importlib
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+from stig.client.aiotransmission import jsoncodec  # noqa: E402
+from stig.client.aiotransmission.rpc import _StreamingDecoder  # noqa: E402
+
+REPEAT = 5
+
+
+def available_codecs():
+    codecs = {'json': json.loads}
+    for name in ('ujson', 'orjson'):
+        try:
+            codecs[name] = importlib.import_module(name).loads
+        except ImportError:
+            pass
+    return codecs
+
+
+def stream_decode(data, chunk_size=64 * 1024):
+    decoder = _StreamingDecoder()
+    for i in range(0, len(data), chunk_size):
+        decoder.feed(data[i:i + chunk_size])
+    return decoder.close()
+
+
+def run(name, data):
+    print('%s: %.1f MB' % (name, len(data) / 1e6))
+    funcs = {'%s.loads' % codec: loads for codec,loads in available_codecs().items()}
+    funcs['streaming'] = stream_decode
+    for fname,func in funcs.items():
+        seconds = min(timeit.repeat(lambda: func(data), number=1, repeat=REPEAT))
+        print('  %-14s %8.1f ms' % (fname, seconds * 1e3))
+
+
+if __name__ == '__main__':
+    print('Default codec: %s' % jsoncodec.NAME)
+    if len(sys.argv) > 1:
+        for filepath in sys.argv[1:]:
+            with open(filepath, 'rb') as f:
+                run(filepath, f.read())
+    else:
+        for count in (1000, 10000, 50000):
+            run('%d torrents' % count, torrent_get_response(count))
@@ -0,0 +1,93 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""Fake but realistic Transmission RPC payloads for benchmarks"""
+
+import json
+import random
+
+TRACKERS = ('http://tracker.example.org:1234/announce',
+            'udp://open.tracker.example.net:6969/announce',
+            'https://private.example.com/announce/0123456789abcdef')
+DIRS = ('/srv/torrents/complete', '/srv/torrents/incomplete', '/home/user/Downloads')
+LABELS = ('foo', 'bar', 'linux', 'music', 'movies')
+
+
+def fake_raw_tracker(trkid, url, rnd=random):
+    """Return dictionary as it is found in the "trackerStats" list of a torrent"""
+    host = url.split('/')[2]
+    return {
+        'id': trkid, 'tier': trkid, 'isBackup': False,
+        'announce': url, 'scrape': url.replace('announce', 'scrape'),
+        'host': host, 'sitename': host.split('.')[-2],
+        'announceState': 1, 'scrapeState': 1,
+        'hasAnnounced': True, 'hasScraped': True,
+        'lastAnnounceResult': 'Success', 'lastAnnounceSucceeded': True, 'lastAnnounceTimedOut': False,
+        'lastAnnounceStartTime': 1600000000, 'lastAnnounceTime': 1600000001,
+        'lastAnnouncePeerCount': rnd.randint(0, 50),
+        'lastScrapeResult': '', 'lastScrapeSucceeded': True, 'lastScrapeTimedOut': False,
+        'lastScrapeStartTime': 1600000000, 'lastScrapeTime': 1600000001,
+        'nextAnnounceTime': 1600001800, 'nextScrapeTime': 1600001800,
+        'seederCount': rnd.randint(0, 1000), 'leecherCount': rnd.randint(0, 100),
+        'downloadCount': rnd.randint(0, 10000),
+    }
+
+
+def fake_raw_torrent(tid, files=0, rnd=random):
+    """Return dictionary as it is found in the "torrents" list of a torrent-get response"""
+    size = rnd.randint(1, 50e9)
+    percent_done = rnd.choice((1, 1, 1, rnd.random()))
+    raw = {
+        'id': tid,
+        'hashString': '%040x' % rnd.getrandbits(160),
+        'name': 'Some.Torrent.Name.%d.2020.1080p.WEB-DL' % tid,
+        'status': rnd.choice((0, 4, 6)),
+        'percentDone': percent_done,
+        'metadataPercentComplete': 1,
+        'recheckProgress': 0,
+        'rateDownload': rnd.choice((0, 0, 0, rnd.randint(0, 10e6))),
+        'rateUpload': rnd.choice((0, 0, rnd.randint(0, 1e6))),
+        'peersConnected': rnd.randint(0, 50),
+        'peersSendingToUs': rnd.randint(0, 10),
+        'peersGettingFromUs': rnd.randint(0, 10),
+        'isPrivate': rnd.choice((True, False)),
+        'uploadRatio': rnd.random() * 5,
+        'downloadDir': rnd.choice(DIRS),
+        'totalSize': size,
+        'sizeWhenDone': size,
+        'leftUntilDone': int(size * (1 - percent_done)),
+        'uploadedEver': rnd.randint(0, size * 3),
+        'downloadedEver': int(size * percent_done),
+        'eta': rnd.choice((-1, rnd.randint(0, 1e5))),
+        'activityDate': rnd.randint(1.5e9, 1.6e9),
+        'addedDate': rnd.randint(1.5e9, 1.6e9),
+        'errorString': '',
+        'error': 0,
+        'labels': rnd.sample(LABELS, rnd.choice((0, 0, 1, 2))),
+        'trackerStats': [fake_raw_tracker(i, url, rnd)
+                         for i,url in enumerate(rnd.sample(TRACKERS, rnd.randint(1, 3)))],
+    }
+    if files:
+        raw['files'] = [{'name': '%s/Disc %d/file%05d.flac' % (raw['name'], i // 100, i),
+                         'length': rnd.randint(1, 1e8), 'bytesCompleted': 0}
+                        for i in range(files)]
+        raw['fileStats'] = [{'bytesCompleted': f['length'], 'wanted': True, 'priority': 0}
+                            for f in raw['files']]
+    return raw
+
+
+def torrent_get_response(count, files=0, seed=0):
+    """Return torrent-get response with `count` torrents as JSON bytes"""
+    rnd = random.Random(seed)
+    response = {'result': 'success',
+                'arguments': {'torrents': [fake_raw_torrent(tid, files=files, rnd=rnd)
+                                           for tid in range(1, count + 1)]}}
+    return json.dumps(response).encode('utf-8')
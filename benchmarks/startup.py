@@ -0,0 +1,84 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure how long it takes to run one-shot CLI commands
+
+Usage: python3 benchmarks/startup.py [NUMBER OF TORRENTS]
+
+`stig ls` and `stig help` are run in new processes.  `ls` gets its torrents
+from a fake Transmission daemon.  The fastest of several runs is reported.
+"""
+
+import http.server
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+
+RUNS = 10
+SESSION = {'version': '3.00 (bb6b5a062e)', 'rpc-version': 16, 'rpc-version-minimum': 1}
+
+
+class FakeDaemon(http.server.BaseHTTPRequestHandler):
+    torrents = None
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if request['method'] == 'session-get':
+            body = json.dumps({'result': 'success', 'arguments': SESSION}).encode('utf-8')
+        elif request['method'] == 'torrent-get':
+            body = self.torrents
+        else:
+            body = json.dumps({'result': 'success', 'arguments': {}}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(*args):
+    cmd = (sys.executable, '-c', 'import stig; stig.run()', '--no-rc-file') + args
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), '..'))
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def run(count):
+    FakeDaemon.torrents = torrent_get_response(count)
+    server = http.server.ThreadingHTTPServer(('localhost', 0), FakeDaemon)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = str(server.server_address[1])
+
+    for label, args in (('stig ls', ('set', 'connect.port', port, ';', 'ls')),
+                        ('stig help', ('help',))):
+        fastest, median = measure(*args)
+        print('%-10s %5d torrents: fastest: %6.1f ms, median: %6.1f ms' % (
+            label, count, fastest * 1e3, median * 1e3))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,87 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure how long it takes to filter torrents
+
+Usage: python3 benchmarks/torrent_filter.py [NUMBER OF TORRENTS ...]
+
+Each filter is applied to all torrents with the compiled filter function, by
+calling the filter function of each single filter like stig used to do and
+with the indexes of the torrent cache.
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+from stig.client.aiotransmission.api_torrent import _TorrentCache  # noqa: E402
+from stig.client.filters import TorrentFilter  # noqa: E402
+
+FILTERS = ('downloading',
+           'size>1G',
+           'label=foo',
+           'downloading&size>1G|label=foo',
+           '!complete&ratio<1&name~2020',
+           'name=~Name\\.1\\d+\\.|tracker~example.org&!private',
+           'name~name.4242.',
+           'path=/srv/torrents/complete&label=music',
+           'tracker=private.example.com')
+RUNS = 5
+
+
+def apply_uncompiled(tfilter, torrents):
+    for t in torrents:
+        for AND_chain in tfilter._filterchains:
+            for f in AND_chain:
+                if f._filter_func is None:
+                    if f._invert:
+                        break
+                elif not bool(f._filter_func(t)) ^ f._invert:
+                    break
+            else:
+                yield t
+                break
+
+
+def measure(func, *args):
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = tuple(func(*args))
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+
+def run(count):
+    tcache = _TorrentCache()
+    tcache.update(json.loads(torrent_get_response(count))['arguments']['torrents'])
+    torrents = tuple(tcache.get())
+    for fstr in FILTERS:
+        tfilter = TorrentFilter(fstr)
+        for key in tfilter.needed_keys:
+            for t in torrents:
+                t[key]
+        compiled, compiled_time = measure(tfilter.apply, torrents)
+        uncompiled, uncompiled_time = measure(apply_uncompiled, tfilter, torrents)
+        indexed, indexed_time = measure(tcache.filter, tfilter)
+        assert compiled == uncompiled == indexed, fstr
+        print('%6d torrents, %6d matches, %-40s compiled: %7.1f ms, uncompiled: %7.1f ms, indexed: %7.1f ms' % (
+            count, len(compiled), fstr, compiled_time * 1e3, uncompiled_time * 1e3, indexed_time * 1e3))
+
+
+if __name__ == '__main__':
+    for count in (int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (50000,):
+        run(count)
@@ -0,0 +1,77 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure memory usage of cached torrents
+
+Usage: python3 benchmarks/torrent_memory.py [NUMBER OF TORRENTS]
+
+Torrents are created from fake torrent-get responses, updated a few times
+and all values that are displayed in the default torrent list columns are
+accessed.
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+from stig.client.aiotransmission.api_torrent import _TorrentCache  # noqa: E402
+from stig.client.aiotransmission.torrent import TorrentFields  # noqa: E402
+
+KEYS = ('size-final', 'size-downloaded', 'size-uploaded', 'ratio', 'peers-seeding',
+        'peers-connected', 'status', 'timespan-eta', '%downloaded', 'rate-down',
+        'rate-up', 'name', 'path', 'id')
+UPDATES = 3
+
+
+def torrent_get_responses(count):
+    fields = set(TorrentFields(*KEYS))
+    for seed in range(UPDATES + 1):
+        response = json.loads(torrent_get_response(count, seed=seed))
+        torrents = [{k:v for k,v in t.items() if k in fields}
+                    for t in response['arguments']['torrents']]
+        yield json.dumps(torrents).encode('utf-8')
+
+
+def update_cache(responses):
+    tcache = _TorrentCache()
+    for response in responses:
+        tcache.update(json.loads(response))
+        for t in tcache.get():
+            for key in KEYS:
+                t[key]
+    return tcache
+
+
+def run(count):
+    responses = tuple(torrent_get_responses(count))
+
+    start = time.perf_counter()
+    update_cache(responses)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    tcache = update_cache(responses)  # noqa: F841
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('%d torrents: %.1f MB (peak: %.1f MB), %.2f s' % (count, current / 1e6, peak / 1e6, seconds))
+
+
+if __name__ == '__main__':
+    for count in (int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (1000, 20000):
+        run(count)
@@ -0,0 +1,87 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure how long it takes to open and update a file list
+
+Usage: python3 benchmarks/tui_filelist.py [NUMBER OF FILES ...]
+
+A file list of a single torrent is opened and rendered, then the download
+progress of 1 % of the files changes repeatedly and the list is rendered again.
+"""
+
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+from stig.client.aiotransmission.torrent import Torrent  # noqa: E402
+from stig.tui import tuiobjects  # noqa: E402
+from stig.tui.views.file_list import FileListWidget  # noqa: E402
+
+COLUMNS = ('marked', 'size', 'downloaded', '%downloaded', 'priority', 'name')
+SIZE = (200, 50)
+FRAMES = 10
+CHANGED = 0.01
+
+
+class FakeRequestPool():
+    def register(self, sid, callback, *args, **kwargs):
+        self.callback = callback
+
+    def poll(self):
+        pass
+
+
+class FakeAPI():
+    def __init__(self):
+        self.treqpool = FakeRequestPool()
+
+
+def change_progress(raw_torrent, rnd):
+    filestats = [dict(fs) for fs in raw_torrent['fileStats']]
+    for fs in rnd.sample(filestats, max(1, int(len(filestats) * CHANGED))):
+        fs['bytesCompleted'] = rnd.randint(0, 1e8)
+    raw_torrent['fileStats'] = filestats
+    return {'id': raw_torrent['id'], 'fileStats': filestats}
+
+
+def run(count):
+    rnd = random.Random(0)
+    raw = json.loads(torrent_get_response(1, files=count))['arguments']['torrents'][0]
+    torrent = Torrent(dict(raw))
+    api = FakeAPI()
+
+    start = time.perf_counter()
+    flist = FileListWidget(api, tuiobjects.keymap, tfilter=None, ffilter=None, columns=COLUMNS)
+    api.treqpool.callback((torrent,))
+    flist.render(SIZE)
+    first = time.perf_counter() - start
+
+    frames = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        torrent.update(change_progress(raw, rnd))
+        api.treqpool.callback((torrent,))
+        flist.render(SIZE)
+        frames.append(time.perf_counter() - start)
+
+    print('%7d files  first render: %8.1f ms, other renders: %8.1f ms' % (
+        count, first * 1e3, statistics.mean(frames) * 1e3))
+
+
+if __name__ == '__main__':
+    for count in (int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (1000, 10000, 100000):
+        run(count)
@@ -0,0 +1,99 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Measure how long it takes to render the torrent list
+
+Usage: python3 benchmarks/tui_render.py [NUMBER OF TORRENTS ...]
+
+The torrent list is rendered once with all torrents and then repeatedly after
+the transfer rates of 1 % of the torrents changed, like they do between two
+polls of a busy Transmission daemon.
+"""
+
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.payloads import torrent_get_response  # noqa: E402
+from stig.client.aiotransmission.api_torrent import _TorrentCache  # noqa: E402
+from stig.client.sorters import TorrentSorter  # noqa: E402
+from stig.tui import tuiobjects  # noqa: E402
+from stig.tui.views.torrent_list import TorrentListWidget  # noqa: E402
+
+COLUMNS = ('marked', 'size', 'downloaded', 'uploaded', 'ratio', 'seeds', 'peers',
+           'status', 'eta', '%downloaded', 'rate-down', 'rate-up', 'name')
+SIZE = (200, 50)
+FRAMES = 20
+CHANGED = 0.01
+
+
+class FakeRequestPool():
+    def register(self, sid, callback, *args, **kwargs):
+        self.callback = callback
+
+    def requested_keys(self, sid):
+        return ()
+
+    def poll(self):
+        pass
+
+    def remove(self, sid):
+        pass
+
+
+class FakeAPI():
+    def __init__(self):
+        self.treqpool = FakeRequestPool()
+
+
+def change_rates(raw_torrents, rnd):
+    for raw in rnd.sample(raw_torrents, max(1, int(len(raw_torrents) * CHANGED))):
+        raw['rateDownload'] = rnd.randint(0, 10e6)
+        raw['rateUpload'] = rnd.randint(0, 1e6)
+
+
+def run(count, sort):
+    rnd = random.Random(0)
+    raw_torrents = json.loads(torrent_get_response(count))['arguments']['torrents']
+    tcache = _TorrentCache()
+    api = FakeAPI()
+    tlist = TorrentListWidget(api, tuiobjects.keymap, columns=COLUMNS,
+                              sort=TorrentSorter(sort), title='all')
+
+    def render():
+        start = time.perf_counter()
+        tlist.render(SIZE)
+        return time.perf_counter() - start
+
+    changed_keys = tcache.update(raw_torrents)
+    api.treqpool.callback(tuple(tcache.get()), changed_keys=changed_keys)
+    first = render()
+
+    frames = []
+    for _ in range(FRAMES):
+        change_rates(raw_torrents, rnd)
+        changed_keys = tcache.update(raw_torrents)
+        api.treqpool.callback(tuple(tcache.get()), changed_keys=changed_keys)
+        frames.append(render())
+
+    print('%6d torrents, sorted by %-12s first render: %8.1f ms, other renders: %7.1f ms' % (
+        count, ','.join(sort), first * 1e3, statistics.mean(frames) * 1e3))
+
+
+if __name__ == '__main__':
+    for count in (int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (1000, 10000, 50000):
+        for sort in (('name',), ('!rate-down',)):
+            run(count, sort)
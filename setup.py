@@ -47,6 +47,8 @@ setup(
     extras_require = {
         'setproctitle': ['setproctitle'],
         'proxy': ['aiohttp-socks'],
+        'fastjson': ['orjson'],
+        'numpy': ['numpy'],
     },
     tests_require = [
         'pytest>=5,<6',
@@ -9,6 +9,8 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import sys
+
 __version__ = '0.14.2a0'
 __appname__ = __name__.split('.')[0]
 __url__ = 'https://github.com/rndusr/stig'
@@ -16,6 +18,13 @@ __url__ = 'https://github.com/rndusr/stig'
 
 def run():
     try:
+        # Don't set up anything we don't need to pass commands to a daemon
+        from . import cliopts
+        cliargs, clicmds = cliopts.parse()
+        if cliargs['client']:
+            from . import daemon
+            sys.exit(daemon.run_client(clicmds, path=cliargs['socket'] or daemon.DEFAULT_SOCKET))
+
         from . import main
         if main.cliargs['profile_file'] is not None:
             main.logging.start_profiling(main.run,
@@ -0,0 +1,56 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Run a stream of command lines in one process
+
+The exit code of each command line is reported as a JSON object on a single
+line, e.g. {"line": 3, "command": "start foo", "exit": 0}.  "line" is the line
+number in the input.  Empty lines and lines starting with "#" are ignored.
+"""
+
+import json
+import sys
+
+from .logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+def run(run_command, lines, status):
+    """
+    Run each command line in `lines` and report its exit code to `status`
+
+    run_command: Callable that gets a command line and returns whether it
+                 succeeded (e.g. CommandManager.run_sync)
+    lines: Iterable of command lines (e.g. sys.stdin)
+    status: Writable text stream
+
+    Return whether all command lines succeeded.
+    """
+    all_succeeded = True
+    for lineno, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        log.debug('Running batch line %d: %r', lineno, line)
+        # Ignored commands (e.g. TUI commands) return None, which is a failure
+        # because the line didn't do what it was supposed to do
+        success = bool(run_command(line))
+        if not success:
+            all_succeeded = False
+
+        # Keep output of the command before its status if both go to the same
+        # terminal
+        sys.stdout.flush()
+        status.write(json.dumps({'line': lineno, 'command': line, 'exit': 0 if success else 1}) + '\n')
+        status.flush()
+    return all_succeeded
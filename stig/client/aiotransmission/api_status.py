@@ -27,18 +27,16 @@ TorrentCount = namedtuple('TorrentCount', ('active', 'downloading', 'isolated',
 class StatusAPI():
     """Transmission daemon status information"""
 
-    # Pass poller methods through to our pollers
+    # Pass poller methods through to our poller (the torrent request pool is
+    # managed by the API class)
     async def start(self, *args, **kwargs):
         await self._poller_stats.start(*args, **kwargs)
-        await self._poller_tcount.start(*args, **kwargs)
 
     async def stop(self, *args, **kwargs):
         await self._poller_stats.stop(*args, **kwargs)
-        await self._poller_tcount.stop(*args, **kwargs)
 
     def poll(self, *args, **kwargs):
         self._poller_stats.poll(*args, **kwargs)
-        self._poller_tcount.poll(*args, **kwargs)
 
     @property
     def running(self):
@@ -51,7 +49,6 @@ class StatusAPI():
     @interval.setter
     def interval(self, interval):
         self._poller_stats.interval = interval
-        self._poller_tcount.interval = interval
 
 
     def __init__(self, srvapi, interval=1):
@@ -60,6 +57,7 @@ class StatusAPI():
         self._reset_session_stats()
         self._reset_tcounts()
         self._on_update = blinker.Signal()
+        self._rpc = srvapi.rpc
 
         self._poller_stats = RequestPoller(srvapi.rpc.session_stats,
                                            interval=interval)
@@ -67,12 +65,12 @@ class StatusAPI():
         self._poller_stats.on_error(lambda e: log.debug('Ignoring exception: %r', e),
                                     autoremove=False)
 
-        # 'session-stats' provides some counters, but not enough, so we
-        # request a minimalistic torrent list.
-        self._poller_tcount = RequestPoller(srvapi.torrent.torrents,
-                                            keys=('rate-down', 'rate-up', 'status'),
-                                            interval=interval)
-        self._poller_tcount.on_response(self._handle_torrent_list)
+        # 'session-stats' provides some counters, but not enough, so we need a
+        # minimalistic torrent list.  We get it from the torrent request pool
+        # to avoid requesting all torrents twice.
+        self._treqpool = srvapi.treqpool
+        self._treqpool.register(id(self), self._handle_torrent_list,
+                                keys=('rate-down', 'rate-up', 'status'))
 
     def _reset_session_stats(self):
         self._session_stats = None
@@ -88,11 +86,12 @@ class StatusAPI():
         self._session_stats_updated = True
         self._maybe_run_callbacks()
 
-    def _handle_torrent_list(self, response):
-        if response is None:
+    def _handle_torrent_list(self, torrents):
+        # The request pool provides an empty torrent list if the request failed
+        if not torrents and not self._rpc.connected:
             self._reset_tcounts()
         else:
-            self._torrent_list = response.torrents
+            self._torrent_list = torrents
         self._tcounts_updated = True
         self._maybe_run_callbacks()
 
@@ -9,47 +9,186 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import asyncio
 import base64
+import operator
 import os
 import time
 from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from string import hexdigits as HEXDIGITS
 
-from natsort import humansorted
-
 from .. import ClientError
 from ..base import TorrentAPIBase
 from ..constants import MAX_TORRENT_FILE_SIZE
 from ..filters import FileFilter, TorrentFilter
 from ..utils import (URL, Bandwidth, Bool, BoolOrBandwidth, Response, SizeInBytes,
                      SmartCmpPath)
-from .torrent import Torrent, TorrentFields
+from .torrent import EXPENSIVE_FIELDS, STATIC_FIELDS, Torrent, TorrentFields
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
 
 
+# Transmission reports torrents as "recently active" if there was any activity
+# in the last 60 seconds (RECENTLY_ACTIVE_SECONDS in libtransmission/rpcimpl.c)
+RECENTLY_ACTIVE_SECONDS = 60
+
+def _trigrams(string):
+    return {string[i:i + 3] for i in range(len(string) - 2)}
+
+
+class _TrigramIndex():
+    """
+    Map three-character substrings of case-folded strings to torrent IDs
+
+    Any torrent that contains a string, regardless of case, is found by
+    looking up all trigrams of the string.  Removed and changed torrents are
+    only forgotten when the index is rebuilt, so found torrents must still be
+    checked.
+    """
+
+    def __init__(self, get_value):
+        self._get_value = get_value
+        self._ids = {}     # Map trigrams to lists of torrent IDs
+        self._values = {}  # Map torrent IDs to indexed strings
+        self._stale = 0    # Number of outdated torrent IDs in self._ids
+
+    def add(self, tid, torrent):
+        value = self._get_value(torrent).casefold()
+        old_value = self._values.get(tid)
+        if value != old_value:
+            if old_value is not None:
+                self._forget()
+            self._values[tid] = value
+            ids = self._ids
+            for trigram in _trigrams(value):
+                tids = ids.get(trigram)
+                if tids is None:
+                    ids[trigram] = [tid]
+                else:
+                    tids.append(tid)
+
+    def remove(self, tid):
+        if self._values.pop(tid, None) is not None:
+            self._forget()
+
+    def _forget(self):
+        self._stale += 1
+        if self._stale > len(self._values):
+            ids = self._ids = {}
+            for tid,value in self._values.items():
+                for trigram in _trigrams(value):
+                    ids.setdefault(trigram, []).append(tid)
+            self._stale = 0
+
+    def find(self, op, user_value):
+        if op not in (operator.__contains__, operator.__eq__) or not isinstance(user_value, str):
+            return None
+        trigrams = _trigrams(user_value.casefold())
+        if not trigrams:
+            return None
+        tids = sorted((self._ids.get(trigram, ()) for trigram in trigrams), key=len)
+        if len(tids[0]) > len(self._values) // 2:
+            # Intersecting is more expensive than checking every torrent
+            return None
+        found = set(tids[0]).intersection(*tids[1:])
+        if self._stale:
+            found.intersection_update(self._values)
+        return found
+
+
+class _ValueIndex():
+    """
+    Map values of torrents to torrent IDs
+
+    This is useful for values that many torrents share (e.g. labels or download
+    paths) because filters only need to check each distinct value.
+    """
+
+    def __init__(self, get_values):
+        self._get_values = get_values
+        self._ids = {}     # Map str(value) to (value, set of torrent IDs)
+        self._values = {}  # Map torrent IDs to tuples of str(value)
+
+    def add(self, tid, torrent):
+        self.remove(tid)
+        values = {str(value):value for value in self._get_values(torrent)}
+        ids = self._ids
+        for key,value in values.items():
+            if key not in ids:
+                ids[key] = (value, {tid})
+            else:
+                ids[key][1].add(tid)
+        self._values[tid] = tuple(values)
+
+    def remove(self, tid):
+        ids = self._ids
+        for key in self._values.pop(tid, ()):
+            tids = ids[key][1]
+            tids.discard(tid)
+            if not tids:
+                del ids[key]
+
+    def find(self, op, user_value):
+        found = set()
+        for value,tids in self._ids.values():
+            if op(value, user_value):
+                found.update(tids)
+        return found
+
+
 class _TorrentCache():
+    # Map index names to the Torrent key they need and a function that creates
+    # the index (see CmpFilterSpec's "index" argument)
+    INDEXES = {
+        'name'            : ('name', lambda: _TrigramIndex(lambda t: t['name'])),
+        'path'            : ('path', lambda: _ValueIndex(lambda t: (t['path'],))),
+        'labels'          : ('labels', lambda: _ValueIndex(lambda t: t['labels'])),
+        'tracker-domains' : ('trackers', lambda: _ValueIndex(lambda t: (tracker['url-announce'].domain
+                                                                        for tracker in t['trackers']))),
+    }
+
     def __init__(self, raw_torrents=()):
         self._tdict = {}  # Map torrent IDs to Torrent objects
 
+        # Indexes are created when a filter needs them first and then updated
+        # lazily with the IDs of changed torrents
+        self._indexes = {}      # Map index names to index objects
+        self._dirty_ids = {}    # Map index names to IDs of changed torrents
+        self._missing_ids = {}  # Map index names to IDs of torrents without the needed key
+
     def update(self, raw_torrents):
+        """
+        Update or add torrents
+
+        Return dictionary that maps torrent IDs to frozensets of keys with
+        values that changed or to `None` for added torrents.
+        """
         # import time ; start = time.time()
         tdict = self._tdict
+        changes = {}
         for rt in raw_torrents:
             tid = rt['id']
             if tid in tdict:
                 # Update existing torrent
                 # log.debug('Updating torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
-                tdict[tid].update(rt)
+                changes[tid] = tdict[tid].update(rt)
             else:
                 # Add new torrent
                 # log.debug('Adding torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
                 tdict[tid] = Torrent(rt)
+                changes[tid] = None
         # log.debug('Updated %d cached with %d new torrents in %.3fms',
         #           len(tdict), len(raw_torrents), (time.time()-start)*1000)
 
+        for name,dirty_ids in self._dirty_ids.items():
+            key = self.INDEXES[name][0]
+            dirty_ids.update(tid for tid,keys in changes.items()
+                             if keys is None or key in keys)
+        return changes
+
     def purge(self, existing_tids):
         """Remove torrents with IDs that are not in `existing_ids`"""
         tdict = self._tdict
@@ -59,10 +198,143 @@ class _TorrentCache():
             log.debug('Clearing cached torrents: %r', removed_tids)
         for tid in removed_tids:
             del tdict[tid]
+            self._unindex(tid)
+
+    def remove(self, removed_tids):
+        """Remove torrents with IDs that are in `removed_tids`"""
+        tdict = self._tdict
+        for tid in removed_tids:
+            if tid in tdict:
+                log.debug('Removing cached torrent: %r', tid)
+                del tdict[tid]
+                self._unindex(tid)
+
+    def _unindex(self, tid):
+        for name,index in self._indexes.items():
+            index.remove(tid)
+            self._dirty_ids[name].discard(tid)
+            self._missing_ids[name].discard(tid)
+
+    def find(self, name, op, user_value):
+        """
+        Return IDs of torrents that may match or `None`
+
+        name:       Name of an index (see `INDEXES`)
+        op:         Operator that takes a Torrent value and `user_value`
+        user_value: Value provided by the user
+
+        `None` is returned if the index `name` doesn't exist, can't find
+        `op`/`user_value` or any torrent doesn't have the value it needs.
+        """
+        if name not in self.INDEXES:
+            return None
+        index = self._get_index(name)
+        if self._missing_ids[name]:
+            return None
+        return index.find(op, user_value)
+
+    def _get_index(self, name):
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = self.INDEXES[name][1]()
+            self._dirty_ids[name] = set(self._tdict)
+            self._missing_ids[name] = set()
+
+        dirty_ids = self._dirty_ids[name]
+        if dirty_ids:
+            key = self.INDEXES[name][0]
+            tdict = self._tdict
+            missing_ids = self._missing_ids[name]
+            for tid in dirty_ids:
+                t = tdict[tid]
+                if key in t:
+                    index.add(tid, t)
+                    missing_ids.discard(tid)
+                else:
+                    index.remove(tid)
+                    missing_ids.add(tid)
+            dirty_ids.clear()
+        return index
+
+    def filter(self, tfilter, torrents=None):
+        """
+        Return tuple of Torrents that match `tfilter`
+
+        torrents: Iterable of cached Torrents or `None` for all cached Torrents
+
+        Indexes are used to avoid checking every torrent if possible.  If
+        `torrents` is `None` and an index was used, the torrents are sorted
+        by ID.
+        """
+        tids = tfilter.candidate_ids(self)
+        if tids is None or len(tids) > len(self._tdict) // 2:
+            # Checking every torrent is faster
+            if torrents is None:
+                torrents = self._tdict.values()
+        elif torrents is None:
+            tdict = self._tdict
+            torrents = (tdict[tid] for tid in sorted(tids) if tid in tdict)
+        else:
+            torrents = (t for t in torrents if t['id'] in tids)
+        return tuple(tfilter.apply(torrents))
+
+    def has_fields(self, ids, fields):
+        """Whether all torrents with `ids` are cached with all `fields`"""
+        tdict = self._tdict
+        for tid in ids:
+            t = tdict.get(tid)
+            if t is None or any(field not in t._raw for field in fields):
+                return False
+        return True
+
+    def get_stale_ids(self, raw_torrents, fields):
+        """
+        Return IDs of torrents in `raw_torrents` that are not cached with all
+        `fields` or that changed their 'activityDate'
+        """
+        tdict = self._tdict
+        stale_tids = []
+        for rt in raw_torrents:
+            tid = rt['id']
+            t = tdict.get(tid)
+            if t is None:
+                stale_tids.append(tid)
+            else:
+                raw = t._raw
+                if (rt.get('activityDate') != raw.get('activityDate')
+                    or any(field not in raw for field in fields)):
+                    stale_tids.append(tid)
+        return stale_tids
+
+    def get_ids_without_files(self, raw_torrents):
+        """
+        Return IDs of torrents in `raw_torrents` that are not cached with
+        'files' or that have a different number of files in 'fileStats' (e.g.
+        because metadata became available)
+        """
+        tdict = self._tdict
+        tids = []
+        for rt in raw_torrents:
+            tid = rt['id']
+            t = tdict.get(tid)
+            files = None if t is None else t._raw.get('files')
+            if files is None or ('fileStats' in rt and len(rt['fileStats']) != len(files)):
+                tids.append(tid)
+        return tids
+
+    def forget_fields(self, ids, fields):
+        """Remove `fields` from cached torrents with `ids` so they are requested again"""
+        tdict = self._tdict
+        for tid in ids:
+            if tid in tdict:
+                raw = tdict[tid]._raw
+                for field in fields:
+                    raw.pop(field, None)
 
     def get(self, *ids):
         """Return tuple of Torrent objects"""
         if ids:
+            ids = frozenset(ids)
             return tuple(t for tid,t in self._tdict.items() if tid in ids)
         else:
             return tuple(self._tdict.values())
@@ -76,16 +348,196 @@ class _TorrentCache():
                                         tlist=tlist or '(empty)')
 
 
+class _ActionBatcher():
+    """
+    Merge RPC calls that apply the same arguments to different torrents
+
+    Calls of `BATCHABLE_METHODS` are collected for `delay` seconds.  Calls of
+    the same method with the same arguments are then sent as one request with
+    the combined torrent IDs, unless a different call for any of the same
+    torrents was made in between.  Requests for different torrents are sent
+    concurrently, while a request for any torrent of an earlier request waits
+    until the earlier request is finished.
+    """
+
+    # Methods that apply the same arguments to any number of torrents
+    BATCHABLE_METHODS = frozenset(('torrent_set', 'torrent_set_location', 'torrent_start',
+                                   'torrent_start_now', 'torrent_stop', 'torrent_verify',
+                                   'torrent_reannounce', 'torrent_remove'))
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self._batches = []  # [key, method, kwargs, IDs, futures] in the order of the calls
+        self._flush_handle = None
+        self._send_tasks = set()
+
+    async def call(self, method, ids, **kwargs):
+        """Call `method` with `ids` and `kwargs` now or together with similar calls"""
+        if method.__name__ not in self.BATCHABLE_METHODS:
+            return await method(ids=ids, **kwargs)
+
+        loop = asyncio.get_event_loop()
+        key = (method.__name__, repr(sorted(kwargs.items())))
+        batch = self._find_batch(key, ids)
+        if batch is None:
+            batch = [key, method, kwargs, {}, []]
+            self._batches.append(batch)
+        batch[3].update(dict.fromkeys(ids))
+        future = loop.create_future()
+        batch[4].append(future)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.delay, self._flush)
+        return await future
+
+    def _find_batch(self, key, ids):
+        # Return the latest batch with the same method and arguments or None if
+        # there is no such batch or a later batch is for any of the same torrents
+        for batch in reversed(self._batches):
+            if batch[0] == key:
+                return batch
+            elif any(tid in batch[3] for tid in ids):
+                return None
+
+    def _flush(self):
+        self._flush_handle = None
+        batches, self._batches = self._batches, []
+        task = asyncio.ensure_future(self._send(batches))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, batches):
+        # Group batches into waves of requests for different torrents
+        waves = [[]]
+        wave_ids = set()
+        for batch in batches:
+            ids = batch[3].keys()
+            if not wave_ids.isdisjoint(ids):
+                waves.append([])
+                wave_ids = set()
+            waves[-1].append(batch)
+            wave_ids.update(ids)
+
+        try:
+            for wave in waves:
+                log.debug('Sending %d merged requests', len(wave))
+                await asyncio.gather(*(self._send_batch(*batch[1:]) for batch in wave))
+        finally:
+            # Don't keep callers waiting if we were cancelled
+            for batch in batches:
+                for future in batch[4]:
+                    if not future.done():
+                        future.set_exception(ClientError('Request was cancelled'))
+
+    @staticmethod
+    async def _send_batch(method, kwargs, ids, futures):
+        # The request is sent even if all callers were cancelled in the meantime
+        try:
+            result = await method(ids=tuple(ids), **kwargs)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+
 class TorrentAPI(TorrentAPIBase):
     """High-level abstraction of the Transmission RPC protocol"""
 
-    def __init__(self, rpc):
+    def __init__(self, rpc, resync_interval=60, worker_thread=True):
         self.rpc = rpc
+        self.resync_interval = resync_interval
+        self.worker_thread = worker_thread
         self._tcache = _TorrentCache()
+        self._actions = _ActionBatcher()
+        self._reset_sync_times()
 
     def clearcache(self):
         """Remove all torrents from cache"""
         self._tcache.purge(existing_tids=())
+        self._reset_sync_times()
+
+    def _reset_sync_times(self):
+        # Map RPC fields to the last time we got them for all torrents that
+        # changed since the previous request
+        self._synced = {}
+        # Map RPC fields to the last time we got them for all torrents
+        self._resynced = {}
+
+    @property
+    def resync_interval(self):
+        """
+        Seconds between requests for all torrents
+
+        Requests for all torrents are sent as requests for recently active
+        torrents if the wanted fields of all torrents were requested less than
+        `resync_interval` seconds ago.  Torrents that don't show up in this list
+        are served from cache and torrents that were removed are purged from
+        cache.
+
+        Set this to 0 to always request all torrents.
+        """
+        return self._resync_interval
+
+    @resync_interval.setter
+    def resync_interval(self, seconds):
+        self._resync_interval = float(seconds)
+
+    @property
+    def worker_thread(self):
+        """
+        Whether to create expensive values in a separate thread
+
+        Values like file trees of torrents with many files are created after
+        they arrive and before they are needed.  This keeps the event loop
+        responsive while they are created.  Other values are created when they
+        are needed.
+        """
+        return self._executor is not None
+
+    @worker_thread.setter
+    def worker_thread(self, enabled):
+        if enabled and getattr(self, '_executor', None) is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='TorrentAPI')
+        elif not enabled:
+            if getattr(self, '_executor', None) is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _create_expensive_values(self, tids):
+        jobs = []
+        for t in self._tcache.get(*tids):
+            keys, raw = t.uncached(Torrent.EXPENSIVE_KEYS)
+            if keys:
+                jobs.append((t, keys, raw))
+        if jobs:
+            start = time.monotonic()
+
+            def create_values():
+                return tuple(t.create_values(keys, raw) for t,keys,raw in jobs)
+
+            loop = asyncio.get_event_loop()
+            for (t,keys,raw),values in zip(jobs, await loop.run_in_executor(self._executor, create_values)):
+                t.cache_values(values, raw)
+            log.debug('Created %d expensive values in worker thread in %.3fms',
+                      len(jobs), (time.monotonic() - start) * 1e3)
+
+    def _is_synced(self, fields, now):
+        """Whether requesting recently active torrents is sufficient to get `fields`"""
+        if self._resync_interval <= 0:
+            return False
+        synced = self._synced
+        resynced = self._resynced
+        for field in fields:
+            if field not in synced or field not in resynced:
+                return False
+            elif now - synced[field] >= RECENTLY_ACTIVE_SECONDS:
+                return False
+            elif now - resynced[field] >= self._resync_interval:
+                return False
+        return True
 
     @staticmethod
     async def _request(method, *args, **kwargs):
@@ -232,37 +684,108 @@ class TorrentAPI(TorrentAPIBase):
         """
         Make 'torrent-get' RPC request
 
+        If `ids` is None and all `fields` were requested recently (see
+        `resync_interval`), only recently active torrents are requested.
+
+        Static fields (see `STATIC_FIELDS`) are only requested for torrents that
+        don't have them cached yet or that had any activity since they were
+        cached.  'files' is only requested again if the number of files changed.
+
         Return a Response object with 'raw_torrents' set to a tuple of torrents
         according to the RPC spec.
         """
-        from time import time
-        start = time()
+        start = time.monotonic()
 
         if 'id' not in fields:
             fields = ('id',) + tuple(fields)
+
+        # Static fields are requested again if 'activityDate' changes
+        static_fields = STATIC_FIELDS.intersection(fields)
+        if static_fields and 'activityDate' not in fields:
+            fields = tuple(fields) + ('activityDate',)
+
+        incremental = ids is None and self._is_synced(fields, start)
+
+        # Don't request static fields if we already have them
+        if static_fields and (incremental or (ids is not None and
+                                              self._tcache.has_fields(ids, static_fields))):
+            request_fields = tuple(f for f in fields if f not in static_fields)
+        else:
+            request_fields = fields
+            static_fields = ()
+
         try:
+            removed_tids = ()
             if ids is None:
-                # Request all IDs
-                raw_tlist = await self.rpc.torrent_get(fields=fields)
+                if incremental:
+                    # Request only torrents that changed since the last request
+                    log.debug('Requesting recently active torrents')
+                    result = await self.rpc.torrent_get(fields=request_fields, ids='recently-active')
+                    if isinstance(result, abc.Mapping):
+                        raw_tlist = result['torrents']
+                        removed_tids = result['removed']
+                    else:
+                        # Removed torrents are purged during the next resync
+                        raw_tlist = result
+                else:
+                    # Request all IDs
+                    raw_tlist = await self.rpc.torrent_get(fields=request_fields)
             else:
                 if len(ids) > 0:
                     # Request given IDs
-                    raw_tlist = await self.rpc.torrent_get(fields=fields, ids=ids)
+                    raw_tlist = await self.rpc.torrent_get(fields=request_fields, ids=ids)
                 else:
                     # No IDs (i.e. empty torrent list) requested
                     raw_tlist = []
+
+            if static_fields:
+                # The progress of each file in 'files' changes with any
+                # activity, but we get it from 'fileStats', so 'files' is only
+                # requested again if the number of files changed
+                files_tids = ()
+                if 'files' in static_fields:
+                    static_fields = static_fields.difference(('files',))
+                    files_tids = self._tcache.get_ids_without_files(raw_tlist)
+                stale_tids = self._tcache.get_stale_ids(raw_tlist, static_fields) if static_fields else ()
+                self._tcache.update(raw_tlist)
+
+                requests = []
+                if stale_tids:
+                    log.debug('Requesting static fields for %d torrents', len(stale_tids))
+                    requests.append(self.rpc.torrent_get(fields=('id',) + tuple(static_fields),
+                                                         ids=stale_tids))
+                if files_tids:
+                    log.debug('Requesting files for %d torrents', len(files_tids))
+                    requests.append(self.rpc.torrent_get(fields=('id', 'files'), ids=files_tids))
+                if requests:
+                    for raw_static_tlist in await asyncio.gather(*requests):
+                        self._tcache.update(raw_static_tlist)
+            else:
+                self._tcache.update(raw_tlist)
+
+            if self._executor is not None and raw_tlist:
+                await self._create_expensive_values(tuple(t['id'] for t in raw_tlist))
         except ClientError as e:
             return Response(success=False, raw_torrents=(), errors=(str(e),))
         else:
-            self._tcache.update(raw_tlist)
-
-            # If we just got a list of all torrents, we can check for torrents
-            # that we still have cached but don't exist anymore and purge them.
             if ids is None:
-                tids = tuple(t['id'] for t in raw_tlist)
-                self._tcache.purge(existing_tids=tids)
+                if incremental:
+                    self._tcache.remove(removed_tids)
+                else:
+                    # If we just got a list of all torrents, we can check for
+                    # torrents that we still have cached but don't exist anymore
+                    # and purge them.
+                    tids = tuple(t['id'] for t in raw_tlist)
+                    self._tcache.purge(existing_tids=tids)
+                    for field in fields:
+                        self._resynced[field] = start
+
+                # All cached torrents are up to date now
+                for field in fields:
+                    self._synced[field] = start
 
-            log.debug('Requested %d torrents in %.3fms', len(raw_tlist), (time() - start) * 1e3)
+            log.debug('Requested %d %storrents in %.3fms', len(raw_tlist),
+                      'recently active ' if incremental else '', (time.monotonic() - start) * 1e3)
             return Response(success=True, raw_torrents=raw_tlist)
 
     def _get_torrents_from_cache(self, ids):
@@ -284,7 +807,7 @@ class TorrentAPI(TorrentAPIBase):
             tlist = self._tcache.get(*ids)
 
             # Provide error for requested IDs that don't exist
-            existing_ids = tuple(t['id'] for t in tlist)
+            existing_ids = frozenset(t['id'] for t in tlist)
             for tid in ids:
                 if tid not in existing_ids:
                     errors.append('No torrent with ID: %d' % tid)
@@ -349,24 +872,39 @@ class TorrentAPI(TorrentAPIBase):
 
             tlist = ()
 
-            # Request all torrents with the keys needed to filter them
-            log.debug('Requesting full list with filter keys: %s', tfilter.needed_keys)
-            response = await self._get_torrents_by_ids(keys=tfilter.needed_keys,
-                                                       from_cache=from_cache)
-            if not response.success:
-                return Response(success=False, torrents=(), errors=response.errors)
+            if (keys != 'ALL' and EXPENSIVE_FIELDS.isdisjoint(TorrentFields(*keys))
+                and self._is_synced(TorrentFields(*tfilter.needed_keys), time.monotonic())):
+                # We are polling incrementally, so requesting recently active
+                # torrents with all wanted keys is cheaper than requesting all
+                # matching torrents by ID.  Expensive keys are only requested
+                # for matching torrents.
+                all_keys = tuple(keys) + tuple(tfilter.needed_keys)
+                log.debug('Requesting full list with keys: %s', all_keys)
+                response = await self._get_torrents_by_ids(keys=all_keys, from_cache=from_cache)
+                if not response.success:
+                    return Response(success=False, torrents=(), errors=response.errors)
+                else:
+                    tlist = self._tcache.filter(tfilter)
+                    log.debug('Found %d matching torrents', len(tlist))
             else:
-                # Find IDs of torrents that match tfilter
-                wanted_ids = tuple(t['id'] for t in tfilter.apply(response.torrents))
-                log.debug('Wanted IDs: %s', wanted_ids)
-                if len(wanted_ids) > 0:
-                    # Get only wanted torrents with all wanted keys
-                    response = await self._get_torrents_by_ids(keys, wanted_ids,
-                                                               from_cache=from_cache)
-                    if not response.success:
-                        return Response(success=False, torrents=(), errors=response.errors)
-                    else:
-                        tlist = tuple(response.torrents)
+                # Request all torrents with the keys needed to filter them
+                log.debug('Requesting full list with filter keys: %s', tfilter.needed_keys)
+                response = await self._get_torrents_by_ids(keys=tfilter.needed_keys,
+                                                           from_cache=from_cache)
+                if not response.success:
+                    return Response(success=False, torrents=(), errors=response.errors)
+                else:
+                    # Find IDs of torrents that match tfilter
+                    wanted_ids = tuple(t['id'] for t in self._tcache.filter(tfilter))
+                    log.debug('Wanted IDs: %s', wanted_ids)
+                    if len(wanted_ids) > 0:
+                        # Get only wanted torrents with all wanted keys
+                        response = await self._get_torrents_by_ids(keys, wanted_ids,
+                                                                   from_cache=from_cache)
+                        if not response.success:
+                            return Response(success=False, torrents=(), errors=response.errors)
+                        else:
+                            tlist = tuple(response.torrents)
 
             success = len(tlist) > 0
             msgs = errors = ()
@@ -404,9 +942,19 @@ class TorrentAPI(TorrentAPIBase):
         else:
             raise ValueError("Invalid 'torrents' argument: %r" % (torrents,))
 
+    def filter_torrents(self, tfilter, torrents):
+        """
+        Return tuple of Torrents from `torrents` that match `tfilter`
+
+        Torrents that can't match are skipped without checking them if
+        possible.  `torrents` must be returned by a previous call to
+        `torrents`.
+        """
+        return self._tcache.filter(tfilter, torrents)
+
 
     async def _torrent_action(self, method, torrents=None, method_args={},
-                              check=None, check_keys=()):
+                              check=None, check_keys=(), from_cache=False):
         """
         Helper method that operates on torrents (start, stop, remove, etc)
 
@@ -420,6 +968,11 @@ class TorrentAPI(TorrentAPIBase):
                      otherwise not.
         check_keys:  List of Torrent keys the check function needs ('id' and
                      'name' are always included)
+        from_cache:  Whether to look up `torrents` in the cache of a previous
+                     request (see `torrents` method)
+
+        Calls of `method` with the same `method_args` within a short time are
+        sent as one request (see `_ActionBatcher`).
 
         Return Response with the following properties:
             torrents: Tuple of Torrents that `method` was applied to with the
@@ -434,7 +987,7 @@ class TorrentAPI(TorrentAPIBase):
 
         msgs = []
         errors = []
-        response = await self.torrents(torrents, keys=check_keys)
+        response = await self.torrents(torrents, keys=check_keys, from_cache=from_cache)
         if not response.success:
             return Response(success=False, torrents=(), errors=response.errors)
         else:
@@ -467,7 +1020,7 @@ class TorrentAPI(TorrentAPIBase):
                 # log.debug('Sending %s(%s) for IDs: %s', method.__qualname__,
                 #           ', '.join(('%s=%r' % (k,v) for k,v in method_args.items())),
                 #           ids)
-                await method(ids=ids, **method_args)
+                await self._actions.call(method, ids, **method_args)
             except ClientError as e:
                 errors.append(str(e))
                 return Response(success=False, torrents=(), msgs=msgs, errors=errors)
@@ -729,6 +1282,7 @@ class TorrentAPI(TorrentAPIBase):
             msgs = response.msgs
 
         # Fetch new torrent data and return final response
+        self._tcache.forget_fields((tid,), STATIC_FIELDS)
         response = await self._get_torrents_by_ids(ids=(tid,),
                                                    keys=('name', 'id', 'files'))
         if not response.success:
@@ -775,8 +1329,10 @@ class TorrentAPI(TorrentAPIBase):
                 raise ValueError("Invalid 'files' argument: %r" % (files,))
 
             torrent_ids = []
+            requests = []
             msgs = []
             errors = []
+            from natsort import humansorted
             for t in humansorted(response.torrents, key=lambda t: t['name']):
                 # Filter torrent's files
                 flist = filter_files(t['files'])
@@ -797,11 +1353,15 @@ class TorrentAPI(TorrentAPIBase):
                 # (See aiotransmission.torrent._create_TorrentFileTree())
                 findexes = tuple(f['id'][1] for f in flist)
                 if findexes:
-                    response = await self._set_files_priority(priority, t['id'], findexes)
-                    if response.success:
-                        torrent_ids.append(t['id'])
-                    msgs.extend(response.msgs)
-                    errors.extend(response.errors)
+                    torrent_ids.append(t['id'])
+                    requests.append(self._set_files_priority(priority, t['id'], findexes))
+
+            # Send requests for all torrents at once so they can be merged
+            responses = await asyncio.gather(*requests)
+            for response in responses:
+                msgs.extend(response.msgs)
+                errors.extend(response.errors)
+            torrent_ids = [tid for tid,response in zip(torrent_ids, responses) if response.success]
 
         if torrent_ids:
             response = await self.torrents(torrent_ids, keys=('id', 'name', 'files'))
@@ -816,11 +1376,11 @@ class TorrentAPI(TorrentAPIBase):
         log.debug('Setting priority of torrent #%d: %r: %s', torrent_id, priority, file_indexes)
         if priority in ('high', 'normal', 'low'):
             return await self._torrent_action(
-                self.rpc.torrent_set, (torrent_id,),
+                self.rpc.torrent_set, (torrent_id,), from_cache=True,
                 method_args={'priority-%s' % priority: fi, 'files-wanted': fi})
         elif priority == 'off':
             return await self._torrent_action(
-                self.rpc.torrent_set, (torrent_id,),
+                self.rpc.torrent_set, (torrent_id,), from_cache=True,
                 method_args={'files-unwanted': fi})
         else:
             raise ValueError('Invalid priority: {!r}'.format(priority))
@@ -894,9 +1454,11 @@ class TorrentAPI(TorrentAPIBase):
                 torrent_set_args[args] = [tid]
 
         # Send one 'torrent-set' request for each list of torrent IDs
-        for args,tids in torrent_set_args.items():
-            response = await self._torrent_action(self.rpc.torrent_set, tids,
-                                                  method_args=dict(args))
+        responses = await asyncio.gather(*(
+            self._torrent_action(self.rpc.torrent_set, tids, method_args=dict(args),
+                                 from_cache=True)
+            for args,tids in torrent_set_args.items()))
+        for response in responses:
             if not response.success:
                 return Response(success=False, torrents=(), errors=response.errors)
 
@@ -999,8 +1561,8 @@ class TorrentAPI(TorrentAPIBase):
 
         # Add trackers
         args = {'trackerAdd': [str(url) for url in new_urls]}
-        response = await self._torrent_action(self.rpc.torrent_set, torrents,
-                                              method_args=args)
+        response = await self._torrent_action(self.rpc.torrent_set, tuple(tordict),
+                                              method_args=args, from_cache=True)
         if not response.success:
             errors.extend(response.errors)
             return Response(success=False, torrents=(), msgs=msgs, errors=errors)
@@ -1026,7 +1588,7 @@ class TorrentAPI(TorrentAPIBase):
             return Response(success=False, torrents=(), errors=('No URLs given',))
 
         # Get wanted torrent IDs
-        response = await self.torrents(torrents, keys=('id',))
+        response = await self.torrents(torrents, keys=('id', 'name'))
         if not response.success:
             return Response(success=False, torrents=(), errors=response.errors)
         else:
@@ -1067,9 +1629,11 @@ class TorrentAPI(TorrentAPIBase):
 
         # Finally remove trackers from torrents
         if remove_ids:
-            for torid,trkids in remove_ids.items():
-                response = await self._torrent_action(self.rpc.torrent_set, (torid,),
-                                                      method_args={'trackerRemove': trkids})
+            responses = await asyncio.gather(*(
+                self._torrent_action(self.rpc.torrent_set, (torid,), from_cache=True,
+                                     method_args={'trackerRemove': trkids})
+                for torid,trkids in remove_ids.items()))
+            for response in responses:
                 if not response.success:
                     return Response(success=False, torrents=(), errors=response.errors)
 
@@ -1201,7 +1765,9 @@ class TorrentAPI(TorrentAPIBase):
         # to one per label set
         inv_label_dict = {}
         for tid, ls in label_dict.items():
-            inv_label_dict.setdefault(ls, []).append(tid)
+            # Don't send requests that wouldn't change anything
+            if ls != tor_dict[tid]['labels']:
+                inv_label_dict.setdefault(ls, []).append(tid)
 
         # Add/remove/set labels
         modded_any = False
@@ -1212,9 +1778,11 @@ class TorrentAPI(TorrentAPIBase):
             self.label_manage_mode.REMOVE: 'Removing',
             self.label_manage_mode.SET: 'Setting',
         }
-        for ls, tids in inv_label_dict.items():
-            args = {'labels': list(ls)}
-            response = await self._torrent_action(self.rpc.torrent_set, tids, method_args=args)
+        responses = await asyncio.gather(*(
+            self._torrent_action(self.rpc.torrent_set, tids, method_args={'labels': list(ls)},
+                                 from_cache=True)
+            for ls, tids in inv_label_dict.items()))
+        for tids, response in zip(inv_label_dict.values(), responses):
             if not response.success:
                 errors.extend(response.errors)
                 continue
@@ -0,0 +1,198 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Flat arrays of the values of all files in a torrent
+
+Files are stored in tree order, i.e. the files of any directory are next to
+each other, so the values of a directory can be summarized from a range of
+positions.  NumPy is used if it is available.
+"""
+
+from itertools import accumulate
+
+from ...logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+# Effective priority of files that are not wanted (see TorrentFilePriority)
+PRIORITY_OFF = -2
+
+
+class _FileStatsBase():
+    """
+    Sizes, progress, wanted state and priority of all files in a torrent
+
+    `order` is a sequence of Transmission file indexes in tree order and
+    `lengths` are the sizes of the files in the same order.  Positions are
+    indexes in `order`.
+    """
+
+    def __init__(self, order, lengths):
+        self._order = tuple(order)
+        if len(self._order) != len(lengths):
+            raise ValueError('Got %d file indexes and %d lengths' % (len(self._order), len(lengths)))
+
+    def __len__(self):
+        return len(self._order)
+
+    def _ordered(self, fileStats):
+        # Transmission's fileStats in tree order
+        if len(fileStats) != len(self._order):
+            raise ValueError('Expected %d fileStats, got %d' % (len(self._order), len(fileStats)))
+        return [fileStats[i] for i in self._order]
+
+    def update(self, fileStats):
+        """
+        Apply 'fileStats' list from Transmission
+
+        Return sequence of positions of files with changed values.
+        """
+        raise NotImplementedError()
+
+    def values(self, pos):
+        """Return `bytesCompleted`, `wanted` and `priority` of the file at `pos`"""
+        raise NotImplementedError()
+
+    def size_total(self, start, stop):
+        """Combined size of the files from `start` to `stop`"""
+        raise NotImplementedError()
+
+    def size_downloaded(self, start, stop):
+        """Combined number of downloaded bytes of the files from `start` to `stop`"""
+        raise NotImplementedError()
+
+    def priority(self, start, stop):
+        """
+        Priority of the files from `start` to `stop`
+
+        Unwanted files have the priority `PRIORITY_OFF`.  Return `None` if the
+        files have different priorities.
+        """
+        raise NotImplementedError()
+
+
+class ListFileStats(_FileStatsBase):
+    """FileStats that are stored in lists"""
+
+    def __init__(self, order, lengths):
+        super().__init__(order, lengths)
+        count = len(self._order)
+        self._length_sums = [0] + list(accumulate(lengths))
+        self._rows = [(0, True, 0)] * count  # (bytesCompleted, wanted, priority)
+        self._completed = [0] * count
+        self._completed_sums = None
+        self._priority = [0] * count         # Effective priority
+
+    def update(self, fileStats):
+        rows = [(fs['bytesCompleted'], fs['wanted'], fs['priority'])
+                for fs in self._ordered(fileStats)]
+        changed = [pos for pos,(new,old) in enumerate(zip(rows, self._rows)) if new != old]
+        if changed:
+            completed = self._completed
+            priority = self._priority
+            for pos in changed:
+                c, w, p = rows[pos]
+                completed[pos] = c
+                priority[pos] = p if w else PRIORITY_OFF
+            self._rows = rows
+            self._completed_sums = None
+        return changed
+
+    def values(self, pos):
+        return self._rows[pos]
+
+    def size_total(self, start, stop):
+        sums = self._length_sums
+        return sums[stop] - sums[start]
+
+    def size_downloaded(self, start, stop):
+        sums = self._completed_sums
+        if sums is None:
+            sums = self._completed_sums = [0] + list(accumulate(self._completed))
+        return sums[stop] - sums[start]
+
+    def priority(self, start, stop):
+        prios = self._priority[start:stop]
+        if prios:
+            lowest = min(prios)
+            if lowest == max(prios):
+                return lowest
+        return None
+
+
+class NumpyFileStats(_FileStatsBase):
+    """FileStats that are stored in NumPy arrays"""
+
+    def __init__(self, order, lengths):
+        import numpy
+        self._np = numpy
+        super().__init__(order, lengths)
+        count = len(self._order)
+        self._length_sums = numpy.concatenate(
+            ((0,), numpy.cumsum(numpy.asarray(lengths, dtype=numpy.int64))))
+        self._completed = numpy.zeros(count, dtype=numpy.int64)
+        self._completed_sums = None
+        self._wanted = numpy.ones(count, dtype=bool)
+        self._raw_priority = numpy.zeros(count, dtype=numpy.int8)
+        self._priority = numpy.zeros(count, dtype=numpy.int8)  # Effective priority
+
+    def update(self, fileStats):
+        np = self._np
+        stats = self._ordered(fileStats)
+        count = len(stats)
+        completed = np.fromiter((fs['bytesCompleted'] for fs in stats), dtype=np.int64, count=count)
+        wanted = np.fromiter((fs['wanted'] for fs in stats), dtype=bool, count=count)
+        priority = np.fromiter((fs['priority'] for fs in stats), dtype=np.int8, count=count)
+        changed = np.flatnonzero((completed != self._completed) |
+                                 (wanted != self._wanted) |
+                                 (priority != self._raw_priority))
+        if len(changed) > 0:
+            self._completed = completed
+            self._completed_sums = None
+            self._wanted = wanted
+            self._raw_priority = priority
+            self._priority = np.where(wanted, priority, PRIORITY_OFF).astype(np.int8)
+        return changed.tolist()
+
+    def values(self, pos):
+        return (int(self._completed[pos]), bool(self._wanted[pos]), int(self._raw_priority[pos]))
+
+    def size_total(self, start, stop):
+        sums = self._length_sums
+        return int(sums[stop] - sums[start])
+
+    def size_downloaded(self, start, stop):
+        sums = self._completed_sums
+        if sums is None:
+            sums = self._completed_sums = self._np.concatenate(((0,), self._np.cumsum(self._completed)))
+        return int(sums[stop] - sums[start])
+
+    def priority(self, start, stop):
+        prios = self._priority[start:stop]
+        if len(prios) > 0:
+            lowest = prios.min()
+            if lowest == prios.max():
+                return int(lowest)
+        return None
+
+
+def _find_implementation():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return ListFileStats
+    else:
+        return NumpyFileStats
+
+
+FileStats = _find_implementation()
+log.debug('Using %s for file values', FileStats.__name__)
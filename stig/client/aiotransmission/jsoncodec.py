@@ -0,0 +1,73 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Encode and decode JSON with the fastest available library
+
+orjson is preferred over ujson, which is preferred over the json module from
+the standard library.
+"""
+
+import json
+
+from ...logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+def _orjson_default(obj):
+    # orjson doesn't serialize subclasses of tuple and float (e.g. TorrentFields
+    # or Bandwidth)
+    if isinstance(obj, (tuple, set, frozenset)):
+        return list(obj)
+    elif isinstance(obj, float):
+        return float(obj)
+    raise TypeError('Type is not JSON serializable: %s' % type(obj).__name__)
+
+
+def _find_codec():
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        def dumps(obj):
+            return orjson.dumps(obj, default=_orjson_default)
+        return ('orjson', dumps, orjson.loads)
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+        return ('ujson', ujson.dumps, ujson.loads)
+
+    return ('json', json.dumps, json.loads)
+
+
+NAME, _dumps, _loads = _find_codec()
+log.debug('Using %s to encode and decode JSON', NAME)
+
+# Exception raised by all codecs when decoding fails
+DecodeError = ValueError
+
+
+def dumps(obj):
+    """Return JSON representation of `obj` as str or bytes"""
+    return _dumps(obj)
+
+
+def loads(data):
+    """
+    Return Python object from JSON str or bytes
+
+    Raise DecodeError if `data` is not valid JSON.
+    """
+    return _loads(data)
@@ -12,13 +12,16 @@
 """Low-level communication with the Transmission daemon"""
 
 import asyncio
+import codecs
 import json
+import re
 
 import async_timeout
 from blinker import Signal
 
 from ..errors import AuthError, ClientError, ConnectionError, RPCError, TimeoutError
 from ..utils import URL
+from . import jsoncodec
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -29,6 +32,97 @@ CSRF_ERROR_CODE = 409
 CSRF_HEADER = 'X-Transmission-Session-Id'
 TIMEOUT = 10
 
+# Responses with more bytes than this are decoded while they arrive if no fast
+# JSON codec is available (see jsoncodec)
+STREAM_THRESHOLD = 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _StreamingDecoder():
+    """
+    Decode JSON response in chunks
+
+    The items of the "torrents" list are decoded one by one as soon as they
+    are complete.  Everything else is decoded when the response is complete.
+
+    Raise ValueError (or subclass) if the response is malformed.
+    """
+
+    _TORRENTS_START = re.compile(r'"torrents"\s*:\s*\[')
+    _SEPARATORS = re.compile(r'[\s,]*')
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._head = None
+        self._torrents = []
+        self._tail = None
+        self._retry_size = 0
+
+    def feed(self, chunk):
+        """Add bytes `chunk` and decode any complete torrents"""
+        text = self._utf8.decode(chunk)
+        if self._tail is not None:
+            self._tail += text
+            return
+
+        self._buffer += text
+        if self._head is None:
+            match = self._TORRENTS_START.search(self._buffer)
+            if match is None:
+                return
+            self._head = self._buffer[:match.end()]
+            self._buffer = self._buffer[match.end():]
+
+        # Decoding an incomplete torrent is wasted work, so we wait until the
+        # buffer has grown sufficiently before we try again
+        if len(self._buffer) >= self._retry_size:
+            self._decode_torrents()
+
+    def _decode_torrents(self, final=False):
+        buffer = self._buffer
+        pos = 0
+        self._retry_size = 0
+        while True:
+            pos = self._SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            elif buffer[pos] == ']':
+                self._tail = buffer[pos:]
+                pos = len(buffer)
+                break
+            try:
+                torrent, pos = self._json.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # Torrent is incomplete
+                self._retry_size = (len(buffer) - pos) * 2
+                break
+            else:
+                self._torrents.append(torrent)
+        self._buffer = buffer[pos:]
+
+    def close(self):
+        """Return decoded response"""
+        text = self._utf8.decode(b'', final=True)
+        if self._head is None:
+            return jsoncodec.loads(self._buffer + text)
+        elif self._tail is not None:
+            self._tail += text
+        else:
+            self._buffer += text
+            self._decode_torrents(final=True)
+            if self._tail is None:
+                raise json.JSONDecodeError('Unterminated list of torrents', self._buffer, 0)
+        answer = jsoncodec.loads(self._head + self._tail)
+        try:
+            answer['arguments']['torrents'] = self._torrents
+        except (KeyError, TypeError):
+            raise ValueError('Unexpected location of torrents')
+        return answer
+
 
 class TransmissionRPC():
     """
@@ -41,7 +135,8 @@ class TransmissionRPC():
     """
 
     def __init__(self, host='localhost', port=9091, *, tls=False, user='',
-                 password='', proxy='', path='/transmission/rpc', enabled=True):
+                 password='', proxy='', path='/transmission/rpc', enabled=True,
+                 max_requests=4):
         self.host = host
         self.port = port
         self.path = path
@@ -53,7 +148,8 @@ class TransmissionRPC():
         self._session = None
         self._enabled_event = asyncio.Event()
         self.enabled = enabled
-        self._request_lock = asyncio.Lock()
+        self.max_requests = max_requests
+        self._autoconnect_lock = asyncio.Lock()
         self._connecting_lock = asyncio.Lock()
         self._connection_tested = False
         self._connection_exception = None
@@ -266,6 +362,25 @@ class TransmissionRPC():
     def timeout(self, timeout):
         self._timeout = float(timeout)
 
+    @property
+    def max_requests(self):
+        """
+        Maximum number of concurrent requests
+
+        Additional requests wait until an earlier request is finished.
+        Connecting is always done by one request while the others wait.
+        """
+        return self._max_requests
+
+    @max_requests.setter
+    def max_requests(self, max_requests):
+        max_requests = int(max_requests)
+        if max_requests < 1:
+            raise ValueError('Maximum number of requests must be at least 1: %r' % (max_requests,))
+        self._max_requests = max_requests
+        # Ongoing requests release the previous semaphore
+        self._request_slots = asyncio.Semaphore(max_requests)
+
     @property
     def enabled(self):
         """
@@ -347,7 +462,7 @@ class TransmissionRPC():
             # Check if connection works
             log.debug('Testing connection to %s', self.url)
             try:
-                test_request = json.dumps({'method':'session-get'})
+                test_request = jsoncodec.dumps({'method':'session-get'})
                 info = await self._send_request(test_request)
             except ClientError as e:
                 self._connection_exception = e
@@ -405,16 +520,36 @@ class TransmissionRPC():
                           self.url, self.user, self.password)
                 raise AuthError(self.url)
 
+            elif (jsoncodec.NAME == 'json'
+                  and (response.content_length or STREAM_THRESHOLD + 1) > STREAM_THRESHOLD):
+                # Decoding a whole response at once with orjson or ujson is
+                # faster than decoding it in pieces with the json module
+                return await self._read_streaming(response)
+
             else:
                 try:
-                    answer = await response.json()
-                except json.JSONDecodeError as e:
-                    raise RPCError('Server sent malformed JSON: %s: %s' % (e, await response.text()))
+                    answer = await response.json(loads=jsoncodec.loads)
                 except UnicodeDecodeError as e:
                     raise RPCError('Server sent malformed UTF-8: %s' % e)
+                except jsoncodec.DecodeError as e:
+                    raise RPCError('Server sent malformed JSON: %s: %s' % (e, await response.text()))
                 else:
                     return answer
 
+    async def _read_streaming(self, response):
+        # Decode large responses while they arrive and let other tasks run
+        # between chunks instead of blocking until everything is decoded
+        decoder = _StreamingDecoder()
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                decoder.feed(chunk)
+                await asyncio.sleep(0)
+            return decoder.close()
+        except UnicodeDecodeError as e:
+            raise RPCError('Server sent malformed UTF-8: %s' % e)
+        except ValueError as e:
+            raise RPCError('Server sent malformed JSON: %s' % (e,))
+
     async def _send_request(self, post_data):
         """
         Send RPC POST request to daemon
@@ -422,7 +557,8 @@ class TransmissionRPC():
         post_data: Any valid RPC request as JSON string
 
         If applicable, returns response['arguments']['torrents'] or
-        response['arguments'], otherwise response.
+        response['arguments'] (if it also contains 'removed'), otherwise
+        response.
 
         Raises ClientError.
         """
@@ -461,10 +597,13 @@ class TransmissionRPC():
                 raise RPCError(answer['result'].capitalize())
             else:
                 if 'arguments' in answer:
-                    if 'torrents' in answer['arguments']:
-                        return answer['arguments']['torrents']
+                    arguments = answer['arguments']
+                    # Requests for recently active torrents also report the
+                    # IDs of removed torrents, so we must return both.
+                    if 'torrents' in arguments and 'removed' not in arguments:
+                        return arguments['torrents']
                     else:
-                        return answer['arguments']
+                        return arguments
                 return answer
 
     def __getattr__(self, method):
@@ -483,16 +622,18 @@ class TransmissionRPC():
         async def request(arguments=None, **kwargs):
             arguments = arguments or {}
 
-            async with self._request_lock:
-                if not self.connected:
-                    log.debug('Autoconnecting for %r', method)
-                    await self.connect()
+            async with self._request_slots:
+                # Only one request may connect while the others wait for it
+                async with self._autoconnect_lock:
+                    if not self.connected:
+                        log.debug('Autoconnecting for %r', method)
+                        await self.connect()
 
                 arguments.update(**kwargs)
                 data = {'method'    : method.replace('_', '-'),
                         'arguments' : arguments}
                 try:
-                    rpc_request = json.dumps(data)
+                    rpc_request = jsoncodec.dumps(data)
                 except Exception as e:
                     raise RuntimeError('Invalid JSON data: %s: %r' % (e, data)) from None
 
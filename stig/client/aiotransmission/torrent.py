@@ -12,10 +12,12 @@
 """Torrent class and value modifiers for compatibility with ttypes"""
 
 import os
+import sys
 import time
 
 from .. import base, ttypes, utils
 from ..utils import LazyDict
+from .filestats import FileStats
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -196,75 +198,127 @@ class TorrentFileID(tuple):
         return 'TorrentFileID(torrent_id=%d, file_id=%d)' % self
 
 class TorrentFileTree(base.TorrentFileTreeBase):
+    """
+    Nested mapping of a torrent's files
+
+    All nodes of a tree share the same FileStats instance.  Each node covers a
+    range of positions in it, which makes summarizing directories cheap.
+    """
+
     @classmethod
     def create(cls, raw_torrent):
+        tid = raw_torrent['id']
+        location = raw_torrent['downloadDir']
         fileStats = raw_torrent['fileStats']
         if len(fileStats) < 1:
             # filelist is empty if torrent was added by hash and metadata isn't
             # downloaded yet.
-            filelist = [{'tid': -1, 'id': TorrentFileID(-1, -1), 'name': raw_torrent['name'],
-                         'priority': 0, 'length': 0, 'wanted': True, 'bytesCompleted': 0}]
+            paths = [(raw_torrent['name'],)]
+            ids = [TorrentFileID(-1, -1)]
+            stats = FileStats((0,), (0,))
         else:
-            # Combine 'files' and 'fileStats' fields and add the 'id' key to each
-            # file, which is a (torrent ID, file list index) tuple
-            tid = raw_torrent['id']
-            filelist = ({'id': TorrentFileID(tid, i), **f, **fS}
-                        for i,(f,fS) in enumerate(zip(raw_torrent['files'], fileStats)))
-        return cls(raw_torrent['id'], raw_torrent['downloadDir'], filelist, path=())
-
-    def __init__(self, torrent_id, torrent_location, filelist, path):
-        log.debug('Creating new TorrentFileTree for torrent %r: %r', torrent_id, path)
-        path_str = os.sep.join(path)
-        super().__init__(torrent_location, path_str)
+            # Sorting paths puts the files of each directory next to each other
+            files = raw_torrent['files']
+            paths_by_index = [tuple(f['name'].split(os.sep)) for f in files]
+            order = sorted(range(len(files)), key=paths_by_index.__getitem__)
+            paths = [paths_by_index[i] for i in order]
+            # File ID is a (torrent ID, file list index) tuple
+            ids = [TorrentFileID(tid, i) for i in order]
+            stats = FileStats(order, [files[i]['length'] for i in order])
+            stats.update(fileStats)
+
+        log.debug('Creating new TorrentFileTree for torrent %r with %d files', tid, len(paths))
+        TorrentFile = ttypes.TorrentFile
+        tfiles = []
+        for pos,path in enumerate(paths):
+            size_downloaded, is_wanted, priority = stats.values(pos)
+            tfiles.append(TorrentFile(
+                tid=tid, id=ids[pos],
+                name=path[-1], path=os.sep.join(path[:-1]), location=location,
+                size_total=stats.size_total(pos, pos + 1),
+                size_downloaded=size_downloaded,
+                is_wanted=is_wanted,
+                priority=priority))
+        return cls(location, stats, tfiles, paths, start=0, stop=len(paths), path=())
+
+    def __init__(self, torrent_location, stats, tfiles, paths, start, stop, path):
+        super().__init__(torrent_location, os.sep.join(path))
+        self._stats = stats
+        self._tfiles = tfiles
+        self._start = start
+        self._stop = stop
+        self._ids = None
 
         items = {}
-        subdirs = {}
-        for entry in filelist:
-            parts = entry['name'].split(os.sep, 1)
-            if len(parts) == 1:
-                filename = parts[0]
-                items[filename] = ttypes.TorrentFile(
-                    tid=torrent_id, id=entry['id'],
-                    name=entry['name'], path=path_str, location=torrent_location,
-                    size_total=entry['length'],
-                    size_downloaded=entry['bytesCompleted'],
-                    is_wanted=entry['wanted'],
-                    priority=entry['priority'])
-
-            elif len(parts) == 2:
-                subdir, subpath = parts
-                if subdir not in subdirs:
-                    subdirs[subdir] = []
-                entry['name'] = subpath
-                subdirs[subdir].append(entry)
+        depth = len(path)
+        pos = start
+        while pos < stop:
+            name = paths[pos][depth]
+            if len(paths[pos]) == depth + 1:
+                items[name] = tfiles[pos]
+                pos += 1
             else:
-                raise RuntimeError(parts)
-
-        for subdir,filelist in subdirs.items():
-            items[subdir] = TorrentFileTree(torrent_id, torrent_location,
-                                            filelist, path=path + (subdir,))
+                subdir_stop = pos + 1
+                while subdir_stop < stop and paths[subdir_stop][depth] == name:
+                    subdir_stop += 1
+                items[name] = TorrentFileTree(torrent_location, stats, tfiles, paths,
+                                              start=pos, stop=subdir_stop, path=path + (name,))
+                pos = subdir_stop
         self._items = items
 
+    @property
+    def files(self):
+        return iter(self._tfiles[self._start:self._stop])
+
+    @property
+    def id(self):
+        if self._ids is None:
+            self._ids = tuple(f['id'] for f in self.files)
+        return self._ids
+
+    @property
+    def size_total(self):
+        return ttypes.TorrentFile.TYPES['size-total'](self._stats.size_total(self._start, self._stop))
+
+    @property
+    def size_downloaded(self):
+        return ttypes.TorrentFile.TYPES['size-downloaded'](self._stats.size_downloaded(self._start, self._stop))
+
+    @property
+    def priority(self):
+        priority = self._stats.priority(self._start, self._stop)
+        if priority is None:
+            return ''
+        else:
+            return ttypes.TorrentFile.TYPES['priority'](priority)
+
     def update(self, raw_torrent):
-        def update_files(ftree, fileStats):
-            if not fileStats:
-                # We don't have any metadata yet, so there is nothing to update
-                return
-
-            for entry in ftree.values():
-                if isinstance(entry, ttypes.TorrentFile):
-                    # File ID is its index in the list provided by
-                    # Transmission (see _create_TorrentFileTree)
-                    index = entry['id'].file_id
-                    fstats = fileStats[index]
-                    entry.update({'size-downloaded': fstats['bytesCompleted'],
-                                  'is-wanted': fstats['wanted'],
-                                  'priority': fstats['priority'],
-                                  'location': raw_torrent['downloadDir']})
-                else:
-                    update_files(entry, fileStats)
-
-        update_files(self._items, raw_torrent['fileStats'])
+        """
+        Apply new 'fileStats' and 'downloadDir' from `raw_torrent`
+
+        This must be called on the root of the tree.  Only files with changed
+        values are updated.
+        """
+        fileStats = raw_torrent['fileStats']
+        if not fileStats:
+            # We don't have any metadata yet, so there is nothing to update
+            return
+
+        tfiles = self._tfiles
+        stats = self._stats
+        for pos in stats.update(fileStats):
+            size_downloaded, is_wanted, priority = stats.values(pos)
+            tfiles[pos].update({'size-downloaded': size_downloaded,
+                                'is-wanted': is_wanted,
+                                'priority': priority})
+
+        location = raw_torrent['downloadDir']
+        if location != self._location:
+            for tfile in tfiles:
+                tfile.update({'location': location})
+            self._location = location
+            for _,tree in self.directories:
+                tree._location = location
 
 
 class PeerList(tuple):
@@ -389,6 +443,8 @@ DEPENDENCIES = {
     'creator'                      : ('creator',),
     'magnetlink'                   : ('magnetLink',),
     'count-pieces'                 : ('pieceCount',),
+    'count-files'                  : ('wanted',),
+    'count-files-wanted'           : ('wanted',),
 
     '%downloaded'                  : ('percentDone',),
     '%uploaded'                    : ('totalSize', 'uploadedEver'),
@@ -433,6 +489,63 @@ DEPENDENCIES = {
     'labels'                       : ('labels',),
 }
 
+# RPC fields that (almost) never change after a torrent was added; they are
+# requested once per torrent or when the torrent's 'activityDate' changes,
+# except for 'files', which is requested when the number of files changes
+STATIC_FIELDS = frozenset(('hashString', 'name', 'comment', 'creator', 'files',
+                           'pieceSize', 'pieceCount', 'dateCreated', 'isPrivate'))
+
+# RPC fields that are requested every time
+VOLATILE_FIELDS = frozenset(field
+                            for fields in DEPENDENCIES.values()
+                            for field in fields
+                            if field not in STATIC_FIELDS)
+
+# Map RPC fields to the keys that depend on them
+_KEYS_BY_FIELD = {field: frozenset(key for key,fields in DEPENDENCIES.items() if field in fields)
+                  for fields in DEPENDENCIES.values()
+                  for field in fields}
+
+
+# Keys that are expensive to request for many torrents, so they are only
+# requested for the torrents that need them
+EXPENSIVE_KEYS = frozenset(('peers', 'files', 'trackers'))
+
+# RPC fields that are only needed by EXPENSIVE_KEYS
+EXPENSIVE_FIELDS = frozenset(field
+                             for key in EXPENSIVE_KEYS
+                             for field in DEPENDENCIES[key]
+                             if _KEYS_BY_FIELD[field] <= EXPENSIVE_KEYS)
+
+
+# Strings that are often the same for many torrents
+_INTERNED_FIELDS = ('downloadDir', 'errorString')
+_INTERNED_TRACKER_FIELDS = ('announce', 'scrape', 'host', 'sitename',
+                            'lastAnnounceResult', 'lastScrapeResult')
+
+def _intern_strings(raw_torrent):
+    intern = sys.intern
+    for field in _INTERNED_FIELDS:
+        value = raw_torrent.get(field)
+        if type(value) is str:
+            raw_torrent[field] = intern(value)
+    for raw_tracker in raw_torrent.get('trackerStats', ()):
+        for field in _INTERNED_TRACKER_FIELDS:
+            value = raw_tracker.get(field)
+            if type(value) is str:
+                raw_tracker[field] = intern(value)
+
+
+def _files_changed(old_files, new_files):
+    # 'files' also contains each file's progress, but we get that from
+    # 'fileStats', so only names and sizes matter
+    if old_files is None or len(old_files) != len(new_files):
+        return True
+    for old,new in zip(old_files, new_files):
+        if old['name'] != new['name'] or old['length'] != new['length']:
+            return True
+    return False
+
 
 class Torrent(base.TorrentBase):
     """
@@ -452,6 +565,10 @@ class Torrent(base.TorrentBase):
         '%available'         : _percent_available,
         'status'             : _status,
         'peers-seeding'      : _count_seeds,
+        # Without metadata, 'wanted' is empty and the file tree has a wanted
+        # placeholder file
+        'count-files'        : lambda raw: len(raw['wanted']) or 1,
+        'count-files-wanted' : lambda raw: sum(raw['wanted']) if raw['wanted'] else 1,
         'ratio'              : _modify_ratio,
         'size-available'     : _bytes_available,
 
@@ -478,57 +595,147 @@ class Torrent(base.TorrentBase):
         'files'              : TorrentFileTree.create,
     }
 
+    # Keys with values that can take a long time to create (e.g. torrents with
+    # thousands of files)
+    EXPENSIVE_KEYS = ('files',)
+
+    # Keys with values that have an update() method to apply new RPC values
+    UPDATABLE_KEYS = ('files',)
+
+    __slots__ = ('_raw', '_cache', '_version', '_changed_keys')
+
     def __init__(self, raw_torrent):
+        _intern_strings(raw_torrent)
         self._raw = raw_torrent
         self._cache = {}
+        self._version = 0
+        self._changed_keys = None
 
     def update(self, raw_torrent):
+        """
+        Merge new RPC values from `raw_torrent`
+
+        Return frozenset of keys with values that changed.
+        """
         cache = self._cache
         raw_old = self._raw
 
-        # Remove cached values if their original/raw value(s) differ
-        for k in tuple(cache):
-            # Each key depends on one or more RPC field
+        # Find keys that depend on any RPC field with a different value
+        keys_by_field = _KEYS_BY_FIELD
+        changed_keys = set()
+        changed_fields = set()
+        for field,new_value in raw_torrent.items():
+            if new_value is not None and field in keys_by_field and new_value != raw_old.get(field) \
+               and (field != 'files' or _files_changed(raw_old.get(field), new_value)):
+                # log.debug('%s changed: %r -> %r', field, raw_old.get(field), new_value)
+                changed_keys.update(keys_by_field[field])
+                changed_fields.add(field)
+
+        # Remove cached values of changed keys
+        updatable = {}
+        for k in changed_keys.intersection(cache):
+            # If we are dealing with more complex data structures (e.g. a file
+            # tree), use the update() method to update the object in cache
+            # instead of creating it again.  `raw_torrent` may not
+            # contain static fields, so we need the combined values.  If a
+            # static field changed (e.g. files were renamed or metadata became
+            # available), the value must be created again.
+            value = cache.pop(k)
             fields = DEPENDENCIES[k]
-            for field in fields:
-                new_value = raw_torrent.get(field)
-                old_value = raw_old.get(field)
-                if new_value is not None and new_value != old_value:
-                    # log.debug('Invalidating cached %s/%s: %r -> %r', k, field, old_value, new_value)
-                    # New and previous value differ - if we are dealing with
-                    # more complex data structures (e.g. a file tree), use the
-                    # update() method to update the object in cache instead of
-                    # removing it from the cache.
-                    value = cache[k]
-                    if hasattr(value, 'update') and all(field in raw_torrent for field in fields):
-                        value.update(raw_torrent)
-                    del cache[k]
-                    break
+            if k in self.UPDATABLE_KEYS and \
+               changed_fields.isdisjoint(STATIC_FIELDS.intersection(fields)) and \
+               all(field in raw_torrent or field in raw_old for field in fields):
+                updatable[k] = value
 
         # Now we can forget the old values
+        _intern_strings(raw_torrent)
         raw_old.update(raw_torrent)
+        for k,value in updatable.items():
+            value.update(raw_old)
+            cache[k] = value
+
+        changed_keys = frozenset(changed_keys)
+        if changed_keys:
+            self._version += 1
+            self._changed_keys = changed_keys
+        return changed_keys
+
+    @property
+    def version(self):
+        """Number of calls to `update` that changed any values"""
+        return self._version
+
+    @property
+    def changed_keys(self):
+        """
+        Keys that changed when `version` was last incremented
+
+        This is `None` if `version` is 0.
+        """
+        return self._changed_keys
+
+    @classmethod
+    def _create_value(cls, key, raw):
+        # Maybe modify the raw value or combine several values
+        modifier = cls._MODIFIERS.get(key)
+        if modifier is not None:
+            # Modifier gets the whole raw torrent
+            value = modifier(raw)
+        else:
+            # Copy raw value unmodified
+            fields = DEPENDENCIES[key]
+            value = raw[fields[0]]
+
+        # Maybe change the value's type
+        type = base.TorrentBase.TYPES.get(key)
+        if type is not None:
+            value = type(value)
+        return value
 
     def __getitem__(self, key):
         cache = self._cache
         value = cache.get(key)
         if value is None:
-            # Maybe modify the raw value or combine several values
-            modifier = self._MODIFIERS.get(key)
-            if modifier is not None:
-                # Modifier gets the whole raw torrent
-                value = modifier(self._raw)
-            else:
-                # Copy raw value unmodified
-                fields = DEPENDENCIES[key]
-                value = self._raw[fields[0]]
-
-            # Maybe change the value's type
-            type = base.TorrentBase.TYPES.get(key)
-            if type is not None:
-                value = type(value)
-            cache[key] = value
+            value = cache[key] = self._create_value(key, self._raw)
         return value
 
+    def uncached(self, keys):
+        """
+        Return snapshot of values for `keys` that are not created yet
+
+        The return value is a 2-tuple of available keys that are not cached and a
+        shallow copy of the raw torrent or None if there are no such keys.  It
+        can be passed to `create_values` in another thread and the result can be
+        passed to `cache_values`.
+        """
+        cache = self._cache
+        uncached = []
+        for key in keys:
+            if key not in cache and key in self:
+                uncached.append(key)
+        if uncached:
+            return (tuple(uncached), dict(self._raw))
+        return ((), None)
+
+    @classmethod
+    def create_values(cls, keys, raw):
+        """Return dictionary that maps `keys` to values created from `raw`"""
+        return {key: cls._create_value(key, raw) for key in keys}
+
+    def cache_values(self, values, raw):
+        """
+        Cache `values` returned by `create_values`
+
+        Values are ignored if any of their RPC fields changed since `raw` was
+        created by `uncached`.
+        """
+        cache = self._cache
+        raw_now = self._raw
+        for key,value in values.items():
+            if key not in cache and all(raw_now.get(field) is raw.get(field)
+                                        for field in DEPENDENCIES[key]):
+                cache[key] = value
+
     def __contains__(self, key):
         deps = DEPENDENCIES
         raw = self._raw
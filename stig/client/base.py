@@ -28,9 +28,12 @@ class TorrentBase(abc.Mapping):
     This is the base class that all API implementations should use.
 
     Derivatives of this base class must add the methods 'update',
-    '__getitem__' and '__iter__'.
+    '__getitem__' and '__iter__' and the properties 'version' and
+    'changed_keys'.
     """
 
+    __slots__ = ()
+
     TYPES = {
         'id'                           : int,
         'hash'                         : utils.SHA1,
@@ -43,6 +46,8 @@ class TorrentBase(abc.Mapping):
         'creator'                      : utils.SmartCmpStr,
         'magnetlink'                   : str,
         'count-pieces'                 : utils.Int,
+        'count-files'                  : utils.Int,
+        'count-files-wanted'           : utils.Int,
 
         '%downloaded'                  : utils.Percent,
         '%uploaded'                    : utils.Percent,
@@ -122,6 +127,10 @@ class TorrentBase(abc.Mapping):
 
 
 class TorrentAPIBase():
+    def filter_torrents(self, tfilter, torrents):
+        """Return tuple of torrents from `torrents` that match `tfilter`"""
+        return tuple(tfilter.apply(torrents))
+
     async def get_magnet_uris(self, tfilter, tracker=False, trackers=True, name=True, size=True):
         response = await self.torrents(tfilter, keys=('hash', 'name', 'size-total', 'trackers'))
         if not response.success:
@@ -191,6 +200,32 @@ class TorrentFileTreeBase(abc.Mapping):
     def id(self):
         return tuple(f['id'] for f in self.files)
 
+    @property
+    def size_total(self):
+        """Combined 'size-total' of all files"""
+        return self._sum_files('size-total')
+
+    @property
+    def size_downloaded(self):
+        """Combined 'size-downloaded' of all files"""
+        return self._sum_files('size-downloaded')
+
+    def _sum_files(self, key):
+        sizes = tuple(f[key] for f in self.files)
+        # Preserve the original type (Float)
+        first_size = sizes[0]
+        start_value = type(first_size)(0, unit=first_size.unit, prefix=first_size.prefix)
+        return sum(sizes, start_value)
+
+    @property
+    def priority(self):
+        """'priority' of all files or empty string if they have different priorities"""
+        priorities = set(f['priority'] for f in self.files)
+        if len(priorities) == 1:
+            return priorities.pop()
+        else:
+            return ''
+
     def __repr__(self):
         return '<%s path=%r: %r>' % (type(self).__name__, self._path, self._items)
 
@@ -15,6 +15,7 @@ import re
 from collections import abc
 
 from ...utils import cliparser
+from ..utils import Timedelta, Timestamp
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -24,6 +25,30 @@ BOOLEAN = 'boolean'
 COMPARATIVE = 'comparative'
 
 
+def _regex_search(string, regex):
+    return re.search(regex, string)
+
+
+# Python expressions that do the same as calling these operators with the
+# item's value and the user's value
+_OPERATOR_EXPRESSIONS = {
+    operator.__eq__       : '{item} == {value}',
+    operator.__contains__ : '{value} in {item}',
+    operator.__gt__       : '{item} > {value}',
+    operator.__lt__       : '{item} < {value}',
+    operator.__ge__       : '{item} >= {value}',
+    operator.__le__       : '{item} <= {value}',
+    _regex_search         : '{value}.search({item})',
+}
+
+
+def _add_constant(namespace, value):
+    """Store `value` in `namespace` and return its name"""
+    name = '_c%d' % len(namespace)
+    namespace[name] = value
+    return name
+
+
 class BoolFilterSpec():
     """Boolean filter specification"""
 
@@ -47,7 +72,7 @@ class CmpFilterSpec():
 
     def __init__(self, *, value_type, value_getter=None, value_matcher=None,
                  value_convert=None, as_bool=None, needed_keys=(), aliases=(),
-                 description='No description'):
+                 index=None, description='No description'):
         """
         value_type    : Subclass of `type` (i.e. something that returns an instance when
                         called and can be passed to `isinstance` as the second argument
@@ -62,16 +87,26 @@ class CmpFilterSpec():
         as_bool       : Callable that takes an item and returns True/False
         needed_keys   : Needed keys for this filter
         aliases       : Alternative names of this filter
+        index         : Name of an index that can find items with any value
+                        that matches (see `Filter.candidate_ids`)
         """
         self.value_type = value_type
         self.needed_keys = needed_keys
         self.aliases = aliases
+        self.index = index
         self.description = description
         self.value_convert = value_convert if value_convert is not None else value_type
 
+        # If we know the value is a simple lookup, compiled filters can access
+        # it directly instead of calling value_getter, value_matcher, etc.
+        self._value_key = None
+        self._inline_matcher = value_matcher is None
+        self._inline_as_bool = as_bool is None
+
         if value_getter is not None:
             self.value_getter = value_getter
         elif len(self.needed_keys) == 1:
+            self._value_key = needed_keys[0]
             self.value_getter = lambda dct, k=needed_keys[0]: dct[k]
         else:
             raise TypeError('Missing argument with needed_keys=%r: value_getter', self.needed_keys)
@@ -107,6 +142,24 @@ class CmpFilterSpec():
                 return vm(obj, op, val)
             return (f, self.needed_keys, invert)
 
+    def make_expression(self, operator, user_value, namespace):
+        """
+        Return Python expression that does the same as the filter function from
+        `make_filter` for the item `obj` or `None` if that's not possible
+
+        Any values the expression needs are added to `namespace`.
+        """
+        if self._value_key is None:
+            return None
+        item = 'obj[%r]' % (self._value_key,)
+        if operator is None and user_value is None:
+            if self._inline_as_bool:
+                return item
+        elif self._inline_matcher and operator in _OPERATOR_EXPRESSIONS:
+            value = _add_constant(namespace, user_value)
+            return _OPERATOR_EXPRESSIONS[operator].format(item=item, value=value)
+        return None
+
 
 class FilterSpecDict(abc.Mapping):
     """TODO"""
@@ -141,7 +194,7 @@ class Filter():
         '='  : operator.__eq__, '~'  : operator.__contains__,
         '>'  : operator.__gt__, '<'  : operator.__lt__,
         '>=' : operator.__ge__, '<=' : operator.__le__,
-        '=~' : lambda a, b: re.search(b, a),
+        '=~' : _regex_search,
     }
     INVERT_CHAR = '!'
     POSSIBLE_OPERATORS = tuple(itertools.chain.from_iterable((op, '!' + op)
@@ -191,7 +244,7 @@ class Filter():
     @classmethod
     def _make_filter(cls, name, op, user_value, invert):
         """
-        Return filter function, needed keys and invert
+        Return filter function, needed keys, invert and converted `user_value`
 
         Filter function takes a value and returns whether it matches
         `user_value`.
@@ -207,9 +260,9 @@ class Filter():
 
         fspec = cls._get_filter_spec(name)
         if fspec.type is BOOLEAN:
-            return (fspec.filter_function, fspec.needed_keys, invert)
+            return (fspec.filter_function, fspec.needed_keys, invert, user_value)
         elif fspec.type is COMPARATIVE:
-            return fspec.make_filter(cls.OPERATORS.get(op), user_value, invert)
+            return (*fspec.make_filter(cls.OPERATORS.get(op), user_value, invert), user_value)
 
     @classmethod
     def _validate_user_value(cls, name, op, user_value):
@@ -333,7 +386,7 @@ class Filter():
         try:
             log.debug('  Getting filter spec: name=%r, op=%r, user_value=%r', name, op, user_value)
             # Get filter spec by `name`
-            filter_func, needed_keys, invert = self._make_filter(name, op, user_value, invert)
+            filter_func, needed_keys, invert, value = self._make_filter(name, op, user_value, invert)
         except ValueError:
             # Filter spec lookup failed
             if self.DEFAULT_FILTER and user_value is op is None:
@@ -343,7 +396,7 @@ class Filter():
                 name, op, user_value = self.DEFAULT_FILTER, self.DEFAULT_OPERATOR, name
                 log.debug('  Using name as value for default filter: name=%r, op=%r, user_value=%r',
                           name, op, user_value)
-                filter_func, needed_keys, invert = self._make_filter(name, op, user_value, invert)
+                filter_func, needed_keys, invert, value = self._make_filter(name, op, user_value, invert)
             else:
                 # No DEFAULT_FILTER is set, so we can't default to it
                 raise
@@ -352,15 +405,49 @@ class Filter():
                   name, invert, op, user_value)
         self._filter_func = filter_func
         self._needed_keys = needed_keys
+        self._value = value
         self._name, self._invert, self._op, self._user_value = name, invert, op, user_value
         self._hash = hash((name, invert, op, user_value))
+        self._match = compile_filterchains(((self,),))
+
+    def _make_expression(self, namespace):
+        """
+        Return Python expression that evaluates to whether `obj` matches
+
+        Any values the expression needs are added to `namespace`.
+        """
+        if self._filter_func is None:
+            # This filter matches everything/nothing
+            return 'False' if self._invert else 'True'
+
+        expr = None
+        fspec = self._get_filter_spec(self._name)
+        if fspec.type is COMPARATIVE:
+            expr = fspec.make_expression(self.OPERATORS.get(self._op), self._value, namespace)
+        if expr is None:
+            expr = '%s(obj)' % (_add_constant(namespace, self._filter_func),)
+        return 'not ' + expr if self._invert else expr
+
+    def candidate_ids(self, index):
+        """
+        Return IDs of items that may match or `None` if any item may match
+
+        index: Object with a `find` method that takes the name of an index, an
+               operator and a user value and returns the IDs of all items with
+               any value `v` for which `operator(v, user_value)` is true or
+               `None` if it can't find them
+        """
+        if self._invert or self._filter_func is None or self._op is None:
+            return None
+        fspec = self._get_filter_spec(self._name)
+        if fspec.type is not COMPARATIVE or fspec.index is None:
+            return None
+        return index.find(fspec.index, self.OPERATORS.get(self._op), self._value)
 
     def apply(self, objs, invert=False, key=None):
         """Yield matching objects or `key` of each matching object"""
-        invert = self._invert ^ bool(invert)  # xor
-        is_wanted = self._filter_func
-        if is_wanted is None:
-            if invert:
+        if self._filter_func is None:
+            if self._invert ^ bool(invert):
                 # This filter matches nothing
                 yield from ()
             else:
@@ -371,23 +458,16 @@ class Filter():
                     for obj in objs:
                         yield obj[key]
         else:
+            matches = itertools.filterfalse if invert else filter
             if key is None:
-                for obj in objs:
-                    if bool(is_wanted(obj)) ^ invert:
-                        yield obj
+                yield from matches(self._match, objs)
             else:
-                for obj in objs:
-                    if bool(is_wanted(obj)) ^ invert:
-                        yield obj[key]
+                for obj in matches(self._match, objs):
+                    yield obj[key]
 
     def match(self, obj):
         """Return True if `obj` matches, False otherwise"""
-        is_wanted = self._filter_func
-        if is_wanted is None:
-            # This filter matches everything/nothing
-            return not self._invert
-        else:
-            return bool(is_wanted(obj)) ^ self._invert
+        return self._match(obj)
 
     def __str__(self):
         if self._name is None:
@@ -418,6 +498,11 @@ class Filter():
     def match_everything(self):
         return not self._filter_func
 
+    @property
+    def time_dependent(self):
+        """Whether objects may stop or start matching as time passes (e.g. "added<1d")"""
+        return isinstance(self._value, (Timestamp, Timedelta))
+
     @property
     def inverted(self):
         return self._invert
@@ -438,6 +523,47 @@ class Filter():
         return self._hash
 
 
+_compiled = {}
+_COMPILED_MAX = 128
+
+
+def compile_filterchains(filterchains):
+    """
+    Return function that takes an object and returns whether it matches
+
+    `filterchains` is a sequence of sequences of :class:`Filter` instances.
+    All filters in an inner sequence must match and at least one inner sequence
+    must match.
+
+    The generated code is cached so each filter combination is only compiled
+    once.
+    """
+    if not filterchains:
+        return _match_everything
+
+    namespace = {}
+    expr = ' or '.join(' and '.join(f._make_expression(namespace) for f in AND_chain)
+                       for AND_chain in filterchains)
+    source = 'def match(obj):\n    return bool(%s)\n' % (expr,)
+    code = _compiled.get(source)
+    if code is None:
+        log.debug('Compiling %r:\n%s', filterchains, source)
+        code = compile(source, '<filter>', 'exec')
+        # Forget the oldest code if we have too much
+        if len(_compiled) >= _COMPILED_MAX:
+            del _compiled[next(iter(_compiled))]
+        _compiled[source] = code
+
+    # Constants are not part of the code because they may differ between
+    # filters with the same string (e.g. relative times)
+    exec(code, namespace)
+    return namespace['match']
+
+
+def _match_everything(obj):
+    return True
+
+
 # The filter specs are specified on the Filter subclasses in each module, but we
 # only want to export the classes derived from FilterChain, so this metalcass
 # grabs attributes that are missing from FilterChain from it's 'filterclass'
@@ -512,27 +638,41 @@ class FilterChain(metaclass=_forward_attrs):
             log.debug('Chained %r and %r to %r', filters, ops, fchain)
             self._filterchains = tuple(tuple(x) for x in fchain)
 
+        # All filters in an AND_chain must match for the AND_chain to
+        # match.  At least one AND_chain must match.
+        self._match = compile_filterchains(self._filterchains)
+
     def apply(self, objects):
         """Yield matching objects from iterable `objects`"""
-        chains = self._filterchains
-        if chains:
-            for obj in objects:
-                if any(all(f.match(obj) for f in AND_chain)
-                       for AND_chain in chains):
-                    yield obj
+        if self._filterchains:
+            yield from filter(self._match, objects)
         else:
             yield from objects
 
     def match(self, obj):
         """Whether `obj` matches this filter chain"""
-        # All filters in an AND_chain must match for the AND_chain to
-        # match.  At least one AND_chain must match.
-        chains = self._filterchains
-        if not chains:
-            return True
-        else:
-            return any(all(f.match(obj) for f in AND_chain)
-                       for AND_chain in chains)
+        return self._match(obj)
+
+    def candidate_ids(self, index):
+        """
+        Return IDs of objects that may match or `None` if any object may match
+
+        See :meth:`Filter.candidate_ids`.
+        """
+        if not self._filterchains:
+            return None
+        ids = set()
+        for AND_chain in self._filterchains:
+            AND_ids = None
+            for f in AND_chain:
+                f_ids = f.candidate_ids(index)
+                if f_ids is not None:
+                    AND_ids = f_ids if AND_ids is None else AND_ids.intersection(f_ids)
+            if AND_ids is None:
+                # Any object may match this AND_chain
+                return None
+            ids.update(AND_ids)
+        return ids
 
     @property
     def needed_keys(self):
@@ -543,6 +683,11 @@ class FilterChain(metaclass=_forward_attrs):
                 keys.update(filter.needed_keys)
         return tuple(keys)
 
+    @property
+    def time_dependent(self):
+        """Whether objects may stop or start matching as time passes (e.g. "added<1d")"""
+        return any(f.time_dependent for AND_chain in self._filterchains for f in AND_chain)
+
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -89,92 +89,79 @@ class _SingleFilter(Filter):
     })
 
     COMPARATIVE_FILTERS = FilterSpecDict({
-        'id'              : CmpFilterSpec(value_getter=lambda t: t['id'],
-                                          value_type=TorrentBase.TYPES['id'],
+        'id'              : CmpFilterSpec(value_type=TorrentBase.TYPES['id'],
                                           needed_keys=('id',),
                                           description=_desc('... torrent ID')),
 
-        'infohash'        : CmpFilterSpec(value_getter=lambda t: t['hash'],
-                                          value_type=TorrentBase.TYPES['hash'],
+        'infohash'        : CmpFilterSpec(value_type=TorrentBase.TYPES['hash'],
                                           needed_keys=('hash',),
                                           aliases=('hash',),
                                           description=_desc('... torrent SHA1 hash')),
 
-        'name'            : CmpFilterSpec(value_getter=lambda t: t['name'],
-                                          value_type=TorrentBase.TYPES['name'],
+        'name'            : CmpFilterSpec(value_type=TorrentBase.TYPES['name'],
                                           needed_keys=('name',),
                                           aliases=('n',),
+                                          index='name',
                                           description=_desc('... name')),
 
-        'comment'         : CmpFilterSpec(value_getter=lambda t: t['comment'],
-                                          value_type=TorrentBase.TYPES['comment'],
+        'comment'         : CmpFilterSpec(value_type=TorrentBase.TYPES['comment'],
                                           needed_keys=('comment',),
                                           aliases=('cmnt',),
                                           description=_desc('... comment')),
 
-        'path'            : CmpFilterSpec(value_getter=lambda t: t['path'],
-                                          value_type=TorrentBase.TYPES['path'],
+        'path'            : CmpFilterSpec(value_type=TorrentBase.TYPES['path'],
                                           needed_keys=('path',),
+                                          index='path',
                                           description=_desc('... absolute path to download directory')),
 
-        'error'           : CmpFilterSpec(value_getter=lambda t: t['error'],
-                                          value_type=TorrentBase.TYPES['error'],
+        'error'           : CmpFilterSpec(value_type=TorrentBase.TYPES['error'],
                                           needed_keys=('error',),
                                           aliases=('err',),
                                           description=_desc('... error message')),
 
-        'uploaded'        : CmpFilterSpec(value_getter=lambda t: t['size-uploaded'],
-                                          value_type=TorrentBase.TYPES['size-uploaded'],
+        'uploaded'        : CmpFilterSpec(value_type=TorrentBase.TYPES['size-uploaded'],
                                           needed_keys=('size-uploaded',),
                                           aliases=('up',),
                                           description=_desc('... number of uploaded bytes')),
 
-        'downloaded'      : CmpFilterSpec(value_getter=lambda t: t['size-downloaded'],
-                                          value_type=TorrentBase.TYPES['size-downloaded'],
+        'downloaded'      : CmpFilterSpec(value_type=TorrentBase.TYPES['size-downloaded'],
                                           needed_keys=('size-downloaded',),
                                           aliases=('dn',),
                                           description=_desc('... number of downloaded bytes')),
 
-        '%downloaded'     : CmpFilterSpec(value_getter=lambda t: t['%downloaded'],
-                                          value_type=TorrentBase.TYPES['%downloaded'],
+        '%downloaded'     : CmpFilterSpec(value_type=TorrentBase.TYPES['%downloaded'],
                                           needed_keys=('%downloaded',),
                                           aliases=('%dn',),
                                           description=_desc('... percentage of downloaded bytes')),
 
-        'size'            : CmpFilterSpec(value_getter=lambda t: t['size-final'],
-                                          value_type=TorrentBase.TYPES['size-final'],
+        'size'            : CmpFilterSpec(value_type=TorrentBase.TYPES['size-final'],
                                           value_convert=convert.size,
                                           needed_keys=('size-final',),
                                           aliases=('sz',),
                                           description=_desc('... combined size of all wanted files')),
 
-        'peers'           : CmpFilterSpec(value_getter=lambda t: t['peers-connected'],
-                                          value_type=TorrentBase.TYPES['peers-connected'],
+        'peers'           : CmpFilterSpec(value_type=TorrentBase.TYPES['peers-connected'],
                                           needed_keys=('peers-connected',),
                                           aliases=('prs',),
                                           description=_desc('... number of connected peers')),
 
-        'seeds'           : CmpFilterSpec(value_getter=lambda t: t['peers-seeding'],
-                                          value_type=TorrentBase.TYPES['peers-seeding'],
+        'seeds'           : CmpFilterSpec(value_type=TorrentBase.TYPES['peers-seeding'],
                                           needed_keys=('peers-seeding',),
                                           aliases=('sds',),
                                           description=_desc('... largest number of seeds reported by any tracker')),
 
-        'ratio'           : CmpFilterSpec(value_getter=lambda t: t['ratio'],
-                                          value_type=TorrentBase.TYPES['ratio'],
+        'ratio'           : CmpFilterSpec(value_type=TorrentBase.TYPES['ratio'],
                                           needed_keys=('ratio',),
                                           aliases=('rto',),
                                           description=_desc('... uploaded/downloaded ratio')),
 
-        'rate-up'         : CmpFilterSpec(value_getter=lambda t: t['rate-up'],
-                                          value_type=TorrentBase.TYPES['rate-up'],
+        'rate-up'         : CmpFilterSpec(value_type=TorrentBase.TYPES['rate-up'],
                                           value_convert=Bandwidth,
                                           needed_keys=('rate-up',),
                                           aliases=('rup',),
                                           description=_desc('... upload rate')),
 
-        'rate-down'       : CmpFilterSpec(value_getter=lambda t: t['rate-down'],
-                                          value_type=TorrentBase.TYPES['rate-down'],
+        'rate-down'       : CmpFilterSpec(value_type=TorrentBase.TYPES['rate-down'],
                                           value_convert=Bandwidth,
                                           needed_keys=('rate-down',),
                                           aliases=('rdn',),
@@ -202,6 +189,7 @@ class _SingleFilter(Filter):
                                           value_type=str,
                                           needed_keys=('trackers',),
                                           aliases=('trk',),
+                                          index='tracker-domains',
                                           description=_desc('... domain of the announce URL of trackers')),
         'label'           : CmpFilterSpec(value_getter=lambda t: t['labels'],
                                           value_matcher=lambda t, op, v:
@@ -209,6 +197,7 @@ class _SingleFilter(Filter):
                                           value_type=str,
                                           needed_keys=('labels',),
                                           aliases=('lbl',),
+                                          index='labels',
                                           description=_desc('... labels')),
 
         'eta'             : CmpFilterSpec(value_getter=lambda t: t['timespan-eta'],
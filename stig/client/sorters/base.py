@@ -9,7 +9,7 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
-from functools import partial
+import time
 
 from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
@@ -25,18 +25,35 @@ class SortSpec():
         if not items:
             return items
 
-        for keyfunc in self._keyfuncs:
-            def key_getter(item):
-                return keyfunc(item_getter(item))
+        # The last key function is the most significant one
+        keyfuncs = tuple(reversed(self._keyfuncs))
 
-            if inplace:
-                items[:] = sorted(items, key=key_getter, reverse=reverse)
-            else:
-                items = sorted(items, key=key_getter, reverse=reverse)
+        def key_getter(item):
+            item = item_getter(item)
+            return tuple(keyfunc(item) for keyfunc in keyfuncs)
+
+        if inplace:
+            items[:] = sorted(items, key=key_getter, reverse=reverse)
+        else:
+            items = sorted(items, key=key_getter, reverse=reverse)
 
         return items
 
 
+class _Reversed():
+    """Wrapper that inverts comparisons of `value`"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 class _SorterBaseMeta(type):
     def __init__(cls, clsname, bases, attrs):
         sortspecs = getattr(cls, 'SORTSPECS', None)
@@ -58,9 +75,12 @@ class SorterBase(metaclass=_SorterBaseMeta):
     SORTSPECS = NotImplemented
     DEFAULT_SORT = None
 
+    # Keys of sorted items that are used by any sort order or `None` if unknown
+    needed_keys = None
+
     def __init__(self, sortstrings=()):
         sortspecs = []
-        sortfuncs = []
+        reverses = []
         strings = []   # String representations of sortspecs
 
         # Go through items in reverse because we want to deduplicate sort orders
@@ -80,9 +100,8 @@ class SorterBase(metaclass=_SorterBaseMeta):
             else:
                 sortspec = self.SORTSPECS[sortspecname]
                 if sortspec not in sortspecs:
-                    sortfunc = partial(sortspec, reverse=reverse)
                     sortspecs.insert(0, sortspec)
-                    sortfuncs.insert(0, sortfunc)
+                    reverses.insert(0, reverse)
                     strings.insert(0, (self.INVERT_CHARS[0] if reverse else '') + sortspecname)
         self._strings = tuple(strings)
 
@@ -90,11 +109,19 @@ class SorterBase(metaclass=_SorterBaseMeta):
         if self.DEFAULT_SORT is not None:
             default_sortspec = self.SORTSPECS[self.DEFAULT_SORT]
             if default_sortspec not in sortspecs:
-                sortfuncs.insert(0, default_sortspec)
                 sortspecs.insert(0, default_sortspec)
+                reverses.insert(0, False)
 
         self._sortspecs = sortspecs
-        self._sortfuncs = sortfuncs
+
+        # The last sort order and the last key function of each sort order are
+        # the most significant ones
+        self._keyfuncs = tuple((keyfunc, reverse)
+                               for sortspec,reverse in reversed(tuple(zip(sortspecs, reverses)))
+                               for keyfunc in reversed(sortspec._keyfuncs))
+
+        # Map id() of items to (item, item.version, key) tuples
+        self._key_cache = {}
 
     def apply(self, items, inplace=False, item_getter=lambda item: item):
         """
@@ -107,11 +134,23 @@ class SorterBase(metaclass=_SorterBaseMeta):
                      object.)
         inplace: Modify `items` if True, otherwise return a new, sorted list
         """
-        import time
         start_time = time.monotonic()
 
-        for sorter in self._sortfuncs:
-            items = sorter(items, inplace=inplace, item_getter=item_getter)
+        get_key = self.get_key
+
+        def key_getter(item):
+            return get_key(item_getter(item))
+
+        if inplace:
+            items[:] = sorted(items, key=key_getter)
+        else:
+            items = sorted(items, key=key_getter)
+
+        # Forget keys of items that are gone
+        cache = self._key_cache
+        if len(cache) > len(items):
+            ids = {id(item_getter(item)) for item in items}
+            self._key_cache = {k:v for k,v in cache.items() if k in ids}
 
         log.debug('-> Sorted %d items by %s in %.3fms',
                   len(items), self, (time.monotonic() - start_time) * 1e3)
@@ -119,6 +158,45 @@ class SorterBase(metaclass=_SorterBaseMeta):
         if not inplace:
             return items
 
+    def get_key(self, item):
+        """
+        Return sort key of `item`
+
+        Sorting items by their keys results in the same order as `apply`.  Keys
+        of items with changed values can be compared with the keys of other
+        items to move them to their new position in an already sorted list.
+
+        If `item` has a `version` attribute, its key is cached until `version`
+        changes.  If `item` also has a `changed_keys` attribute (see
+        `Torrent.changed_keys`), the cached key is kept if the item changed
+        only keys we don't need.
+        """
+        version = getattr(item, 'version', None)
+        if version is None:
+            return self._make_key(item)
+
+        cache = self._key_cache
+        cached = cache.get(id(item))
+        if cached is not None and cached[0] is item:
+            _, cached_version, key = cached
+            if cached_version == version:
+                return key
+            elif cached_version == version - 1:
+                needed_keys = self.needed_keys
+                changed_keys = getattr(item, 'changed_keys', None)
+                if needed_keys is not None and changed_keys is not None \
+                   and changed_keys.isdisjoint(needed_keys):
+                    cache[id(item)] = (item, version, key)
+                    return key
+
+        key = self._make_key(item)
+        cache[id(item)] = (item, version, key)
+        return key
+
+    def _make_key(self, item):
+        return tuple([_Reversed(keyfunc(item)) if reverse else keyfunc(item)
+                      for keyfunc,reverse in self._keyfuncs])
+
     def __add__(self, other):
         cls = type(self)
         if not isinstance(other, cls):
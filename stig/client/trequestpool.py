@@ -9,17 +9,61 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
+import asyncio
 import operator
+from collections import abc
 from functools import reduce
 
 import blinker
 
+from .aiotransmission.torrent import EXPENSIVE_KEYS
+from .filters.torrent import TorrentFilter
 from .poll import RequestPoller
+from .utils import Response
 
 from ..logging import make_logger  # isort:skip
 log = make_logger(__name__)
 
 
+class _FilterCache():
+    """
+    Remember which torrents match a filter
+
+    A torrent is only checked again if it changed and any of the changed keys
+    are needed by the filter.
+    """
+    def __init__(self, tfilter):
+        self._match = tfilter.match
+        self._needed_keys = frozenset(tfilter.needed_keys)
+        self._results = {}  # Map id(torrent) to (torrent, version, matched)
+
+    def apply(self, torrents):
+        """Return tuple of matching torrents from `torrents`"""
+        results = self._results
+        match = self._match
+        needed_keys = self._needed_keys
+        matching = []
+        for t in torrents:
+            version = t.version
+            result = results.get(id(t))
+            if result is not None and result[0] is t and (
+                    result[1] == version or
+                    (result[1] == version - 1 and needed_keys.isdisjoint(t.changed_keys))):
+                matched = result[2]
+                if result[1] != version:
+                    results[id(t)] = (t, version, matched)
+            else:
+                matched = match(t)
+                results[id(t)] = (t, version, matched)
+            if matched:
+                matching.append(t)
+
+        # Forget removed torrents
+        if len(results) > 2 * len(torrents):
+            self._results = {id(t):results[id(t)] for t in torrents}
+        return tuple(matching)
+
+
 class TorrentRequestPool(RequestPoller):
     """
     Combine multiple `TorrentAPI.torrents` requests into one
@@ -29,27 +73,70 @@ class TorrentRequestPool(RequestPoller):
 
     After the combined torrents have arrived, split it back up by using each
     subscriber's filter and provide it to its callbacks as tuples.
+
+    Keys in `EXPENSIVE_KEYS` (e.g. peers or files) are fetched in a separate
+    request that only asks for the torrents that are wanted by subscribers of
+    those keys.  If any subscriber wants all torrents, keys that are only wanted
+    by subscribers of some torrents are also fetched in a separate request for
+    those torrents.  This means any number of subscribers results in at most
+    three requests per interval.
+
+    Subscribers can also get the keys that changed for each torrent since their
+    callback was called the last time (see `register`).
+
+    Slow keys (see `register`) are only requested every `slow_interval` seconds
+    and when `poll` is called.  In between, subscribers get their previous
+    values.
+
+    Paused subscribers (see `pause`) don't contribute to the combined request and
+    their callbacks are not called until they are resumed.
     """
-    def __init__(self, srvapi, interval=1):
+    def __init__(self, srvapi, interval=1, slow_interval=10):
         self._api = srvapi.torrent
         self._tfilters = {}
         self._keys = {}
+        self._slow_keys = {}
+        self._slow_interval = slow_interval
+        self._slow_keys_due = True
+        self._slow_keys_requested = None
+        self._versions = {}
+        self._filter_caches = {}
+        self._paused = set()
         super().__init__(request=None, interval=interval)
         self.on_response(self._handle_torrent_list)
 
-    def register(self, sid, callback, keys=(), tfilter=None):
+    def register(self, sid, callback, keys=(), tfilter=None, changed_keys=False, slow_keys=()):
         """Add new request to request pool
 
         sid: Subscriber ID (any hashable)
         callback: Callable that receives a tuple of Torrents on updates
         keys: Wanted Torrent keys
-        tfilter: None for all torrents or TorrentFilter instance
+        tfilter: None for all torrents, TorrentFilter instance or sequence of
+                 torrent IDs
+        changed_keys: Whether `callback` also gets the keyword argument
+                      `changed_keys`, a dictionary that maps torrent IDs to
+                      frozensets of keys that changed since the previous call
+                      or to `None` if any key may have changed
+        slow_keys: Wanted Torrent keys that are expensive to get and change
+                   rarely (e.g. because they are derived from long lists)
         """
         log.debug('Registering subscriber: %s', sid)
+        if isinstance(tfilter, abc.Sequence) and not isinstance(tfilter, str):
+            if not tfilter:
+                raise ValueError('No torrent IDs given')
+            tfilter = TorrentFilter('|'.join('id=%d' % tid for tid in tfilter))
         event = blinker.signal(sid)
         event.connect(callback)
         self._keys[event] = set(keys)
+        self._slow_keys[event] = set(slow_keys).difference(keys)
+        if self._slow_keys[event]:
+            self._slow_keys_due = True
         self._tfilters[event] = tfilter
+        if changed_keys:
+            # Map torrent IDs to the Torrent.version the callback has seen
+            self._versions[event] = {}
+        else:
+            self._versions.pop(event, None)
 
         # TODO issue #163: Enable call to skip_ongoing_request() if calling in
         # RequestPoller.set_request() doesn't help.
@@ -65,33 +152,156 @@ class TorrentRequestPool(RequestPoller):
 
         self._combine_requests()
 
+    def poll(self):
+        """Poll immediately, including slow keys (see `register`)"""
+        self._slow_keys_due = True
+        super().poll()
+
+    @property
+    def slow_interval(self):
+        """Seconds between requests of slow keys (see `register`)"""
+        return self._slow_interval
+
+    @slow_interval.setter
+    def slow_interval(self, slow_interval):
+        self._slow_interval = float(slow_interval)
+
+    def pause(self, sid):
+        """
+        Stop requesting torrents for subscriber until `resume` is called
+
+        The subscriber stays registered, but its keys and filter are removed
+        from the combined request and its callback is not called.
+        """
+        event = blinker.signal(sid)
+        if event in self._tfilters and event not in self._paused:
+            log.debug('Pausing subscriber: %s', sid)
+            self._paused.add(event)
+            self._combine_requests()
+
+    def resume(self, sid):
+        """
+        Undo `pause` and poll immediately
+
+        The subscriber's callback gets the current torrents with the next
+        response.  If it wants changed keys, they are relative to the last call
+        before it was paused.
+        """
+        event = blinker.signal(sid)
+        if event in self._paused:
+            log.debug('Resuming subscriber: %s', sid)
+            self._paused.discard(event)
+            self._combine_requests()
+            self.poll()
+
+    def is_paused(self, sid):
+        """Whether subscriber was paused with `pause`"""
+        return blinker.signal(sid) in self._paused
+
+    @property
+    def _active_tfilters(self):
+        if not self._paused:
+            return self._tfilters
+        return {event:tfilter for event,tfilter in self._tfilters.items()
+                if event not in self._paused}
+
     def _combine_requests(self):
         """Create single request that combines keys and filters of all subscribers"""
-        if not self.has_subscribers:
+        active_tfilters = self._active_tfilters
+        if not active_tfilters:
             # Don't request anything
-            log.debug('No subscribers - setting request to None')
+            log.debug('No active subscribers - setting request to None')
             self.set_request(None)
         else:
             kwargs = {}
 
-            all_filters = tuple(self._tfilters.values())
-            if not all_filters or None in all_filters:
-                # No subscribers or at least one subscriber wants all torrents
+            # Combine keys of all requests
+            all_keys = reduce(lambda a,b: {*a,*b}, (self._keys[event] for event in active_tfilters))
+
+            all_filters = tuple(active_tfilters.values())
+            if None in all_filters:
+                # At least one subscriber wants all torrents, but we only
+                # request the keys of those subscribers for all torrents
                 kwargs['torrents'] = None
+                kwargs['keys'] = reduce(lambda a,b: {*a,*b},
+                                        (self._keys[event] for event,tfilter in active_tfilters.items()
+                                         if tfilter is None)) - EXPENSIVE_KEYS
             else:
                 kwargs['torrents'] = reduce(operator.__or__, all_filters)
-
-            # Combine keys of all requests
-            kwargs['keys'] = reduce(lambda a,b: {*a,*b}, self._keys.values())
+                kwargs['keys'] = all_keys - EXPENSIVE_KEYS
 
             # Filters also need certain keys
             for f in all_filters:
                 if f is not None:
                     kwargs['keys'].update(f.needed_keys)
 
+            # Slow keys that are also wanted by other subscribers or filters
+            # are requested every time anyway
+            slow_keys = reduce(lambda a,b: {*a,*b}, (self._slow_keys[event] for event in active_tfilters))
+            slow_keys.difference_update(kwargs['keys'], all_keys & EXPENSIVE_KEYS)
+            if slow_keys:
+                kwargs['slow_keys'] = slow_keys
+
+            # Collect filters of subscribers that want keys that are not
+            # requested for all torrents
+            narrow_keys = all_keys - EXPENSIVE_KEYS - kwargs['keys']
+            if narrow_keys:
+                kwargs['narrow_keys'] = narrow_keys
+                kwargs['narrow_filters'] = tuple(
+                    active_tfilters[event] for event in active_tfilters
+                    if self._keys[event] & narrow_keys)
+
+            # Collect filters of subscribers that want expensive keys
+            expensive_keys = all_keys & EXPENSIVE_KEYS
+            if expensive_keys or slow_keys & EXPENSIVE_KEYS:
+                kwargs['expensive_keys'] = expensive_keys
+                kwargs['expensive_filters'] = tuple(
+                    active_tfilters[event] for event in active_tfilters
+                    if (self._keys[event] | self._slow_keys[event]) & EXPENSIVE_KEYS)
+
             log.debug('Combined filters: %s', kwargs['torrents'])
             log.debug('Combined keys: %s', kwargs['keys'])
-            self.set_request(self._api.torrents, **kwargs)
+            log.debug('Combined narrow keys: %s', narrow_keys)
+            log.debug('Combined expensive keys: %s', expensive_keys)
+            log.debug('Combined slow keys: %s', slow_keys)
+            self.set_request(self._request_torrents, **kwargs)
+
+    async def _request_torrents(self, torrents, keys, narrow_keys=(), narrow_filters=(),
+                                expensive_keys=(), expensive_filters=(), slow_keys=()):
+        if slow_keys:
+            now = asyncio.get_event_loop().time()
+            if self._slow_keys_due or now - self._slow_keys_requested >= self._slow_interval:
+                log.debug('Requesting slow keys: %s', slow_keys)
+                self._slow_keys_due = False
+                self._slow_keys_requested = now
+                keys = keys | (slow_keys - EXPENSIVE_KEYS)
+                expensive_keys = expensive_keys | (slow_keys & EXPENSIVE_KEYS)
+
+        response = await self._api.torrents(torrents=torrents, keys=keys)
+        if narrow_keys:
+            response = await self._request_more_keys(response, narrow_keys, narrow_filters)
+        if expensive_keys:
+            response = await self._request_more_keys(response, expensive_keys, expensive_filters)
+        return response
+
+    async def _request_more_keys(self, response, keys, tfilters):
+        # Find IDs of torrents that match any of `tfilters`
+        if None in tfilters:
+            tlist = response.torrents
+        else:
+            tlist = (t for t in response.torrents
+                     if any(f.match(t) for f in tfilters))
+        ids = tuple(t['id'] for t in tlist)
+        if not ids:
+            return response
+
+        more_response = await self._api.torrents(torrents=ids, keys=keys)
+        more_torrents = {t['id']:t for t in more_response.torrents}
+        return Response(
+            success=response.success and more_response.success,
+            torrents=tuple(more_torrents.get(t['id'], t) for t in response.torrents),
+            msgs=response.msgs + more_response.msgs,
+            errors=response.errors + more_response.errors)
 
     def _handle_torrent_list(self, response):
         # If the request failed, response is None and tlist is empty.
@@ -104,37 +314,88 @@ class TorrentRequestPool(RequestPoller):
                 dead_subscribers.append(event.name)
             else:
                 log.debug('Running callback: %r', event.name)
-                event.send(tlist)
+                if event in self._versions:
+                    event.send(tlist, changed_keys=self._get_changed_keys(event, tlist))
+                else:
+                    event.send(tlist)
 
+        # Paused subscribers don't get any torrents, but we still want to know
+        # if they are gone
+        for event in self._paused:
+            if not bool(event.receivers):
+                dead_subscribers.append(event.name)
+
+        active_tfilters = self._active_tfilters
         log.debug('Processing %d torrents for %d subscribers',
-                  len(tlist), len(self._tfilters))
-        if len(self._tfilters) == 1:
+                  len(tlist), len(active_tfilters))
+        if len(active_tfilters) == 1:
             # If there's only one subscriber, there's no need to filter the
             # torrents again.
-            event = next(iter(self._tfilters))
+            event = next(iter(active_tfilters))
             send(event, tlist)
         else:
             # More than 1 subscriber means we have to filter the torrents
-            # again for each one.
-            for event,filter in self._tfilters.items():
+            # again for each one.  Subscribers with the same filter (e.g. the
+            # same torrent ID) get the same tuple.
+            filtered = {}
+            filter_caches = self._filter_caches
+            for event,filter in active_tfilters.items():
                 if filter is None:
                     # Subscriber wants all torrents
                     this_tlist = tlist
                 else:
                     # Subscriber wants filtered torrents
-                    this_tlist = filter.apply(tlist)
+                    fstr = str(filter)
+                    if fstr not in filtered:
+                        if filter.time_dependent:
+                            filtered[fstr] = self._api.filter_torrents(filter, tlist)
+                        else:
+                            # Only check torrents that changed since the
+                            # previous response
+                            if fstr not in filter_caches:
+                                filter_caches[fstr] = _FilterCache(filter)
+                            filtered[fstr] = filter_caches[fstr].apply(tlist)
+                    this_tlist = filtered[fstr]
                 send(event, this_tlist)
 
+            # Forget caches of filters that are not used anymore
+            for fstr in tuple(filter_caches):
+                if fstr not in filtered:
+                    del filter_caches[fstr]
+
         # Remove dead subscribers
         for eventname in dead_subscribers:
             self.remove(eventname)
 
+    def _get_changed_keys(self, event, tlist):
+        seen_versions = self._versions[event]
+        versions = {}
+        changed_keys = {}
+        empty = frozenset()
+        for t in tlist:
+            tid = t['id']
+            version = versions[tid] = t.version
+            seen_version = seen_versions.get(tid)
+            if seen_version == version:
+                changed_keys[tid] = empty
+            elif seen_version == version - 1:
+                changed_keys[tid] = t.changed_keys
+            else:
+                # Torrent is new to this subscriber or changed multiple times
+                # since the previous call
+                changed_keys[tid] = None
+        self._versions[event] = versions
+        return changed_keys
+
     def remove(self, sid):
         """Unsubscribe previously registered subscriber"""
         log.debug('Removing subscriber: %s', sid)
         event = blinker.signal(sid)
         del self._keys[event]
+        del self._slow_keys[event]
         del self._tfilters[event]
+        self._versions.pop(event, None)
+        self._paused.discard(event)
         self._combine_requests()
 
     @property
@@ -57,6 +57,26 @@ def parse():
              section='OPTIONS',
              description='Do not run commands from any rc file')
 
+    _add_arg('--daemon', action='store_true',
+             section='OPTIONS',
+             description=('Keep running in the background and execute commands '
+                          'from --client invocations'))
+    _add_arg('--client', action='store_true',
+             section='OPTIONS',
+             description='Execute commands in a running --daemon')
+    _add_arg('--socket', default=None,
+             section='OPTIONS',
+             description='Unix socket of --daemon and --client',
+             varname='FILE')
+
+    _add_arg('--batch', action='store_true',
+             section='OPTIONS',
+             description='Run commands from stdin, one command line per line')
+    _add_arg('--batch-status', default=None,
+             section='OPTIONS',
+             description='Report exit code of each --batch line to FILE instead of stderr',
+             varname='FILE')
+
     _add_arg('--debug', type=lambda mods: mods.split(','), default=[],
              section='DEVELOPER OPTIONS',
              description=('Log debug messages from comma-separated list of MODULES'
@@ -68,7 +68,7 @@ class ask_yes_no():
         import termios
         import tty
 
-        if not sys.stdout.isatty():
+        if not sys.stdout.isatty() or not sys.stdin.isatty():
             # We can't ask the user - default to None (which evaluates to False)
             return None
 
@@ -9,8 +9,6 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
-from natsort import humansorted
-
 from ... import objects
 from .. import CmdError
 from ..base import file as base
@@ -36,6 +34,7 @@ class ListFilesCmd(base.ListFilesCmdbase,
             raise CmdError()
 
         filelist = []
+        from natsort import humansorted
         for torrent in humansorted(torrents, key=lambda t: t['name']):
             files, filtered_count = self._flatten_tree(torrent['files'], ffilter)
             filelist.extend(files)
@@ -69,6 +68,7 @@ class ListFilesCmd(base.ListFilesCmdbase,
         from ...views.file import TorrentFileDirectory
         flist = []
         filtered_count = 0
+        from natsort import humansorted
         for key,value in humansorted(files.items(), key=lambda pair: pair[0]):
             if value.nodetype == 'leaf':
                 if ffilter is None or ffilter.match(value):
@@ -9,8 +9,6 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
-from natsort import humansorted
-
 from ... import objects
 from .. import CmdError
 from ..base import peer as base
@@ -42,6 +40,7 @@ class ListPeersCmd(base.ListPeersCmdbase,
                 return pfilter.apply(peers)
 
         peerlist = []
+        from natsort import humansorted
         for torrent in humansorted(torrents, key=lambda t: t['name']):
             peerlist.extend(filter_peers(torrent['peers']))
 
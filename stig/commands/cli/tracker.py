@@ -9,8 +9,6 @@
 # GNU General Public License for more details
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
-from natsort import humansorted
-
 from ... import objects
 from .. import CmdError
 from ..base import tracker as base
@@ -42,6 +40,7 @@ class ListTrackersCmd(base.ListTrackersCmdbase,
                 return trkfilter.apply(trackers)
 
         trklist = []
+        from natsort import humansorted
         for torrent in humansorted(torrents, key=lambda t: t['name']):
             trklist.extend(filter_trackers(torrent['trackers']))
 
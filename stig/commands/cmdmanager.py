@@ -24,6 +24,48 @@ from ..logging import make_logger  # isort:skip
 log = make_logger(__name__)
 
 
+# Command class attributes that are stored in command manifests
+MANIFEST_ATTRS = ('name', 'aliases', 'provides', 'category', 'description')
+
+
+class _LazyCommand():
+    """
+    Stand-in for a command class that is imported when it is needed
+
+    The attributes in `MANIFEST_ATTRS` are available without importing the
+    command class.  Anything else, including calling it, imports the command
+    class from `module`.
+    """
+
+    def __init__(self, module, clsname, name, aliases, provides, category, description):
+        self.module = module
+        self.clsname = clsname
+        self.name = name
+        self.aliases = tuple(aliases)
+        self.names = [name] + list(aliases)
+        self.provides = set(provides)
+        self.category = category
+        self.description = description
+        self._cmdcls = None
+
+    @property
+    def cmdcls(self):
+        """Imported command class"""
+        if self._cmdcls is None:
+            log.debug('Importing command %s from %s', self.clsname, self.module)
+            self._cmdcls = getattr(import_module(self.module), self.clsname)
+        return self._cmdcls
+
+    def __getattr__(self, name):
+        return getattr(self.cmdcls, name)
+
+    def __call__(self, *args, **kwargs):
+        return self.cmdcls(*args, **kwargs)
+
+    def __repr__(self):
+        return '<%s %s.%s>' % (type(self).__name__, self.module, self.clsname)
+
+
 class CommandManager():
     def __init__(self, pre_run_hook=None, info_handler=None, error_handler=None):
         self._info_handler = info_handler
@@ -65,13 +107,46 @@ class CommandManager():
                 if utils.is_cmdcls(cmdcls):
                     self.register(cmdcls)
 
+    def load_cmds_from_manifest(self, manifest):
+        """
+        Register commands from `manifest` without importing them
+
+        manifest: Sequence of mappings as returned by `create_manifest`
+        """
+        for item in manifest:
+            self.register(_LazyCommand(**item))
+
+    @staticmethod
+    def create_manifest(*modules):
+        """
+        Import `modules` and describe the commands they contain
+
+        Return a list of dictionaries that map 'module' and 'clsname' to where
+        a command class is defined and any names from `MANIFEST_ATTRS` to the
+        value of that class attribute.  Lists are sorted to make the manifest
+        reproducible.
+        """
+        manifest = {}
+        for modname in modules:
+            mod = import_module(modname)
+            for _,cmdcls in getmembers(mod):
+                if utils.is_cmdcls(cmdcls):
+                    item = {'module': cmdcls.__module__, 'clsname': cmdcls.__name__}
+                    for attr in MANIFEST_ATTRS:
+                        value = getattr(cmdcls, attr)
+                        item[attr] = sorted(value) if attr == 'provides' else value
+                    item['aliases'] = list(item['aliases'])
+                    manifest[(item['module'], item['clsname'])] = item
+        return [item for _,item in sorted(manifest.items())]
+
     def register(self, cmdcls):
         """
         Add new command
 
-        cmdcls: command class (must have CommandMeta as metaclass)
+        cmdcls: command class (must have CommandMeta as metaclass) or command
+                from `load_cmds_from_manifest`
         """
-        if not issubclass(cmdcls, _CommandBase):
+        if not isinstance(cmdcls, _LazyCommand) and not issubclass(cmdcls, _CommandBase):
             raise RuntimeError("{} must have CommandMeta as metaclass".format(cmdcls))
         elif not cmdcls.provides:
             raise RuntimeError('{} does not provide any interfaces'.format(cmdcls))
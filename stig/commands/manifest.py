@@ -0,0 +1,488 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Names, aliases, interfaces, categories and descriptions of all commands
+
+This allows finding commands without importing them (see
+CommandManager.load_cmds_from_manifest).  Run `make manifest` after adding or
+removing commands or changing any of these attributes.
+"""
+
+# flake8: noqa
+
+MODULES = ('stig.commands.cli', 'stig.commands.tui')
+
+_GENERATED = '# Everything below is generated by update()'
+
+
+def update():
+    """Replace COMMANDS in this file with the commands from MODULES"""
+    import pprint
+
+    from .cmdmanager import CommandManager
+    with open(__file__, 'r') as f:
+        head = f.read().rpartition(_GENERATED)[0]
+    commands = CommandManager.create_manifest(*MODULES)
+    with open(__file__, 'w') as f:
+        f.write('%s%s\n\nCOMMANDS = %s\n' % (head, _GENERATED, pprint.pformat(commands, width=100)))
+
+
+# Everything below is generated by update()
+
+COMMANDS = [{'aliases': [],
+  'category': 'configuration',
+  'clsname': 'DumpCmd',
+  'description': 'Generate commands that reproduce current settings, keybindings and tabs',
+  'module': 'stig.commands.cli.config',
+  'name': 'dump',
+  'provides': ['cli']},
+ {'aliases': ['rate', 'rl'],
+  'category': 'configuration',
+  'clsname': 'RateLimitCmd',
+  'description': 'Limit transfer rates per torrent or globally',
+  'module': 'stig.commands.cli.config',
+  'name': 'ratelimit',
+  'provides': ['cli']},
+ {'aliases': ['source'],
+  'category': 'configuration',
+  'clsname': 'RcCmd',
+  'description': 'Run commands in rc file',
+  'module': 'stig.commands.cli.config',
+  'name': 'rc',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'configuration',
+  'clsname': 'ResetCmd',
+  'description': 'Reset settings to their default values',
+  'module': 'stig.commands.cli.config',
+  'name': 'reset',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'configuration',
+  'clsname': 'SetCmd',
+  'description': 'Change or list settings',
+  'module': 'stig.commands.cli.config',
+  'name': 'set',
+  'provides': ['cli']},
+ {'aliases': ['fls', 'lsf'],
+  'category': 'file',
+  'clsname': 'ListFilesCmd',
+  'description': 'List files of torrent(s)',
+  'module': 'stig.commands.cli.file',
+  'name': 'filelist',
+  'provides': ['cli']},
+ {'aliases': ['prio'],
+  'category': 'file',
+  'clsname': 'PriorityCmd',
+  'description': 'Change download priority of files',
+  'module': 'stig.commands.cli.file',
+  'name': 'priority',
+  'provides': ['cli']},
+ {'aliases': ['man'],
+  'category': 'miscellaneous',
+  'clsname': 'HelpCmd',
+  'description': 'List or explain commands and settings',
+  'module': 'stig.commands.cli.misc',
+  'name': 'help',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'miscellaneous',
+  'clsname': 'LogCmd',
+  'description': 'Clear, add or scroll through log messages',
+  'module': 'stig.commands.cli.misc',
+  'name': 'log',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'miscellaneous',
+  'clsname': 'VersionCmd',
+  'description': 'Show stig version',
+  'module': 'stig.commands.cli.misc',
+  'name': 'version',
+  'provides': ['cli']},
+ {'aliases': ['pls', 'lsp'],
+  'category': 'peer',
+  'clsname': 'ListPeersCmd',
+  'description': 'List connected peers of torrent(s)',
+  'module': 'stig.commands.cli.peer',
+  'name': 'peerlist',
+  'provides': ['cli']},
+ {'aliases': ['download', 'get'],
+  'category': 'torrent',
+  'clsname': 'AddTorrentsCmd',
+  'description': 'Download torrents',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'add',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'torrent',
+  'clsname': 'LabelCmd',
+  'description': 'Manipulate torrent labels',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'label',
+  'provides': ['cli']},
+ {'aliases': ['ls'],
+  'category': 'torrent',
+  'clsname': 'ListTorrentsCmd',
+  'description': 'List torrents',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'list',
+  'provides': ['cli']},
+ {'aliases': ['mv'],
+  'category': 'torrent',
+  'clsname': 'MoveTorrentsCmd',
+  'description': "Change torrents' location",
+  'module': 'stig.commands.cli.torrent',
+  'name': 'move',
+  'provides': ['cli']},
+ {'aliases': ['rm', 'delete'],
+  'category': 'torrent',
+  'clsname': 'RemoveTorrentsCmd',
+  'description': 'Remove torrents',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'remove',
+  'provides': ['cli']},
+ {'aliases': ['rn'],
+  'category': 'torrent',
+  'clsname': 'RenameCmd',
+  'description': 'Rename a torrent or one of its files or directories',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'rename',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'torrent',
+  'clsname': 'StartTorrentsCmd',
+  'description': 'Start downloading torrents',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'start',
+  'provides': ['cli']},
+ {'aliases': ['pause'],
+  'category': 'torrent',
+  'clsname': 'StopTorrentsCmd',
+  'description': 'Stop downloading torrents',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'stop',
+  'provides': ['cli']},
+ {'aliases': ['info'],
+  'category': 'torrent',
+  'clsname': 'TorrentDetailsCmd',
+  'description': 'Display detailed torrent information',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'details',
+  'provides': ['cli']},
+ {'aliases': ['uri'],
+  'category': 'torrent',
+  'clsname': 'TorrentMagnetURICmd',
+  'description': 'Display torrent(s) magnet URI',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'magnet',
+  'provides': ['cli']},
+ {'aliases': ['check'],
+  'category': 'torrent',
+  'clsname': 'VerifyTorrentsCmd',
+  'description': 'Verify downloaded torrent data',
+  'module': 'stig.commands.cli.torrent',
+  'name': 'verify',
+  'provides': ['cli']},
+ {'aliases': ['an'],
+  'category': 'tracker',
+  'clsname': 'AnnounceCmd',
+  'description': 'Announce torrents to their trackers now if possible',
+  'module': 'stig.commands.cli.tracker',
+  'name': 'announce',
+  'provides': ['cli']},
+ {'aliases': ['trkls', 'lstrk'],
+  'category': 'tracker',
+  'clsname': 'ListTrackersCmd',
+  'description': 'List tracker(s) of torrent(s)',
+  'module': 'stig.commands.cli.tracker',
+  'name': 'trackerlist',
+  'provides': ['cli']},
+ {'aliases': ['trk'],
+  'category': 'tracker',
+  'clsname': 'TrackerCmd',
+  'description': 'Add/Remove trackers to/from torrents',
+  'module': 'stig.commands.cli.tracker',
+  'name': 'tracker',
+  'provides': ['cli']},
+ {'aliases': [],
+  'category': 'configuration',
+  'clsname': 'DumpCmd',
+  'description': 'Generate commands that reproduce current settings, keybindings and tabs',
+  'module': 'stig.commands.tui.config',
+  'name': 'dump',
+  'provides': ['tui']},
+ {'aliases': ['rate', 'rl'],
+  'category': 'configuration',
+  'clsname': 'RateLimitCmd',
+  'description': 'Limit transfer rates per torrent or globally',
+  'module': 'stig.commands.tui.config',
+  'name': 'ratelimit',
+  'provides': ['tui']},
+ {'aliases': ['source'],
+  'category': 'configuration',
+  'clsname': 'RcCmd',
+  'description': 'Run commands in rc file',
+  'module': 'stig.commands.tui.config',
+  'name': 'rc',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'configuration',
+  'clsname': 'ResetCmd',
+  'description': 'Reset settings to their default values',
+  'module': 'stig.commands.tui.config',
+  'name': 'reset',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'configuration',
+  'clsname': 'SetCmd',
+  'description': 'Change or list settings',
+  'module': 'stig.commands.tui.config',
+  'name': 'set',
+  'provides': ['tui']},
+ {'aliases': ['fls', 'lsf'],
+  'category': 'file',
+  'clsname': 'ListFilesCmd',
+  'description': 'List files of torrent(s)',
+  'module': 'stig.commands.tui.file',
+  'name': 'filelist',
+  'provides': ['tui']},
+ {'aliases': ['prio'],
+  'category': 'file',
+  'clsname': 'PriorityCmd',
+  'description': 'Change download priority of files',
+  'module': 'stig.commands.tui.file',
+  'name': 'priority',
+  'provides': ['tui']},
+ {'aliases': ['man'],
+  'category': 'miscellaneous',
+  'clsname': 'HelpCmd',
+  'description': 'List or explain commands and settings',
+  'module': 'stig.commands.tui.misc',
+  'name': 'help',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'miscellaneous',
+  'clsname': 'LogCmd',
+  'description': 'Clear, add or scroll through log messages',
+  'module': 'stig.commands.tui.misc',
+  'name': 'log',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'miscellaneous',
+  'clsname': 'VersionCmd',
+  'description': 'Show stig version',
+  'module': 'stig.commands.tui.misc',
+  'name': 'version',
+  'provides': ['tui']},
+ {'aliases': ['pls', 'lsp'],
+  'category': 'peer',
+  'clsname': 'ListPeersCmd',
+  'description': 'List connected peers of torrent(s)',
+  'module': 'stig.commands.tui.peer',
+  'name': 'peerlist',
+  'provides': ['tui']},
+ {'aliases': ['download', 'get'],
+  'category': 'torrent',
+  'clsname': 'AddTorrentsCmd',
+  'description': 'Download torrents',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'add',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'torrent',
+  'clsname': 'LabelCmd',
+  'description': 'Manipulate torrent labels',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'label',
+  'provides': ['tui']},
+ {'aliases': ['ls'],
+  'category': 'torrent',
+  'clsname': 'ListTorrentsCmd',
+  'description': 'List torrents',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'list',
+  'provides': ['tui']},
+ {'aliases': ['mv'],
+  'category': 'torrent',
+  'clsname': 'MoveTorrentsCmd',
+  'description': "Change torrents' location",
+  'module': 'stig.commands.tui.torrent',
+  'name': 'move',
+  'provides': ['tui']},
+ {'aliases': ['rm', 'delete'],
+  'category': 'torrent',
+  'clsname': 'RemoveTorrentsCmd',
+  'description': 'Remove torrents',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'remove',
+  'provides': ['tui']},
+ {'aliases': ['rn'],
+  'category': 'torrent',
+  'clsname': 'RenameCmd',
+  'description': 'Rename a torrent or one of its files or directories',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'rename',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'torrent',
+  'clsname': 'StartTorrentsCmd',
+  'description': 'Start downloading torrents',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'start',
+  'provides': ['tui']},
+ {'aliases': ['pause'],
+  'category': 'torrent',
+  'clsname': 'StopTorrentsCmd',
+  'description': 'Stop downloading torrents',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'stop',
+  'provides': ['tui']},
+ {'aliases': ['info'],
+  'category': 'torrent',
+  'clsname': 'TorrentDetailsCmd',
+  'description': 'Display detailed torrent information',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'details',
+  'provides': ['tui']},
+ {'aliases': ['uri'],
+  'category': 'torrent',
+  'clsname': 'TorrentMagnetURICmd',
+  'description': 'Display torrent(s) magnet URI',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'magnet',
+  'provides': ['tui']},
+ {'aliases': ['check'],
+  'category': 'torrent',
+  'clsname': 'VerifyTorrentsCmd',
+  'description': 'Verify downloaded torrent data',
+  'module': 'stig.commands.tui.torrent',
+  'name': 'verify',
+  'provides': ['tui']},
+ {'aliases': ['an'],
+  'category': 'tracker',
+  'clsname': 'AnnounceCmd',
+  'description': 'Announce torrents to their trackers now if possible',
+  'module': 'stig.commands.tui.tracker',
+  'name': 'announce',
+  'provides': ['tui']},
+ {'aliases': ['trkls', 'lstrk'],
+  'category': 'tracker',
+  'clsname': 'ListTrackersCmd',
+  'description': 'List tracker(s) of torrent(s)',
+  'module': 'stig.commands.tui.tracker',
+  'name': 'trackerlist',
+  'provides': ['tui']},
+ {'aliases': ['trk'],
+  'category': 'tracker',
+  'clsname': 'TrackerCmd',
+  'description': 'Add/Remove trackers to/from torrents',
+  'module': 'stig.commands.tui.tracker',
+  'name': 'tracker',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'BindCmd',
+  'description': 'Bind keys to commands or other keys',
+  'module': 'stig.commands.tui.tui',
+  'name': 'bind',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'CollapseCmd',
+  'description': 'Hide the contents of directories in file lists',
+  'module': 'stig.commands.tui.tui',
+  'name': 'collapse',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'ExpandCmd',
+  'description': 'Show the contents of directories in file lists',
+  'module': 'stig.commands.tui.tui',
+  'name': 'expand',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'FindCmd',
+  'description': 'Find text in the content of the focused tab',
+  'module': 'stig.commands.tui.tui',
+  'name': 'find',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'InteractiveCmd',
+  'description': 'Complete partial command with user input from a dialog',
+  'module': 'stig.commands.tui.tui',
+  'name': 'interactive',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'LimitCmd',
+  'description': 'Limit contents of the focused tab by applying more filters',
+  'module': 'stig.commands.tui.tui',
+  'name': 'limit',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'MarkCmd',
+  'description': 'Select torrents or files for an action',
+  'module': 'stig.commands.tui.tui',
+  'name': 'mark',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'QuitCmd',
+  'description': 'Terminate the TUI',
+  'module': 'stig.commands.tui.tui',
+  'name': 'quit',
+  'provides': ['tui']},
+ {'aliases': ['setcmd'],
+  'category': 'tui',
+  'clsname': 'SetCommandCmd',
+  'description': 'Open the command line and insert a command',
+  'module': 'stig.commands.tui.tui',
+  'name': 'setcommand',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'SortCmd',
+  'description': 'Sort lists of torrents/peers/trackers/etc',
+  'module': 'stig.commands.tui.tui',
+  'name': 'sort',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'TUICmd',
+  'description': 'Show or hide parts of the text user interface',
+  'module': 'stig.commands.tui.tui',
+  'name': 'tui',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'TabCmd',
+  'description': 'Open, close and focus tabs',
+  'module': 'stig.commands.tui.tui',
+  'name': 'tab',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'UnbindCmd',
+  'description': 'Unbind keys so pressing them has no effect',
+  'module': 'stig.commands.tui.tui',
+  'name': 'unbind',
+  'provides': ['tui']},
+ {'aliases': [],
+  'category': 'tui',
+  'clsname': 'UnmarkCmd',
+  'description': 'Deselect torrents or files for an action',
+  'module': 'stig.commands.tui.tui',
+  'name': 'unmark',
+  'provides': ['tui']}]
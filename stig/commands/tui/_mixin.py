@@ -155,11 +155,11 @@ class select_torrents():
         """
         Return IDs of marked items in the current or previous tab
 
-        This relies on the widget having a `marked` attribute.
+        This relies on the widget having a `marked_torrent_ids` attribute.
         """
         widget = self._get_current_or_previous_tab()
-        if hasattr(widget, 'marked'):
-            tids = tuple(twidget.torrent_id for twidget in widget.marked)
+        if hasattr(widget, 'marked_torrent_ids'):
+            tids = tuple(widget.marked_torrent_ids)
             if tids:
                 return set(tids)
 
@@ -286,8 +286,8 @@ class select_files():
         from ...tui.tuiobjects import tabs
         focused_widget = tabs.focus
         # Get marked file IDs
-        if hasattr(focused_widget, 'marked'):
-            fids = tuple(fwidget.id for fwidget in focused_widget.marked)
+        if hasattr(focused_widget, 'marked_ids'):
+            fids = tuple(focused_widget.marked_ids)
             if fids:
                 log.debug('Found marked files: %r', fids)
                 return fids
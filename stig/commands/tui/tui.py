@@ -634,6 +634,55 @@ class UnmarkCmd(metaclass=CommandMeta):
                 widget.focus_position += 1
 
 
+class ExpandCmd(metaclass=CommandMeta):
+    name = 'expand'
+    provides = {'tui'}
+    category = 'tui'
+    description = 'Show the contents of directories in file lists'
+    usage = ('expand [<OPTIONS>]',)
+    argspecs = (
+        {'names': ('--toggle','-t'), 'action': 'store_true',
+         'description': 'Collapse if expanded, expand if collapsed'},
+        {'names': ('--all','-a'), 'action': 'store_true',
+         'description': 'Expand or toggle all directories'},
+    )
+    more_sections = {
+        'NOTES': (('Directories with many files are collapsed initially.  Their '
+                   'contents are only loaded when they are expanded.'),),
+    }
+
+    def run(self, toggle, all):
+        from ...tui.tuiobjects import tabs
+        widget = tabs.focus
+        if not hasattr(widget, 'expand'):
+            raise CmdError('Nothing to expand here.')
+        else:
+            widget.expand(toggle=toggle, all=all)
+
+
+class CollapseCmd(metaclass=CommandMeta):
+    name = 'collapse'
+    provides = {'tui'}
+    category = 'tui'
+    description = 'Hide the contents of directories in file lists'
+    usage = ('collapse [<OPTIONS>]',)
+    argspecs = (
+        {'names': ('--toggle','-t'), 'action': 'store_true',
+         'description': 'Expand if collapsed, collapse if expanded'},
+        {'names': ('--all','-a'), 'action': 'store_true',
+         'description': 'Collapse or toggle all directories'},
+    )
+    more_sections = ExpandCmd.more_sections
+
+    def run(self, toggle, all):
+        from ...tui.tuiobjects import tabs
+        widget = tabs.focus
+        if not hasattr(widget, 'collapse'):
+            raise CmdError('Nothing to collapse here.')
+        else:
+            widget.collapse(toggle=toggle, all=all)
+
+
 class QuitCmd(metaclass=CommandMeta):
     name = 'quit'
     provides = {'tui'}
@@ -734,8 +783,8 @@ class LimitCmd(metaclass=CommandMeta):
             elif isinstance(widget, PeerListWidget):
                 return candidates.peer_filter(args.curarg, None)
             elif isinstance(widget, TrackerListWidget):
-                torrent_filter = '|'.join('id=%s' % (itemw.torrent_id,)
-                                          for itemw in widget.items)
+                torrent_filter = '|'.join('id=%s' % (tracker['tid'],)
+                                          for tracker in widget.items)
                 return candidates.tracker_filter(args.curarg, torrent_filter)
             elif isinstance(widget, SettingListWidget):
                 return candidates.setting_filter(args.curarg)
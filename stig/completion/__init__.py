@@ -13,8 +13,6 @@ import re
 from collections import abc
 from typing import Pattern
 
-from natsort import humansorted
-
 
 class Categories(abc.Sequence):
     """Iterable over non-empty Candidates objects with selection tracking"""
@@ -118,6 +116,7 @@ class Candidates(abc.Sequence):
                        for cand in candidates)
         cands_deduped = (cand for cand in dict.fromkeys(cands_typed))
         cands_noempty = (cand for cand in cands_deduped if cand != '')
+        from natsort import humansorted
         cands_sorted = humansorted(cands_noempty)
         self._candidates = tuple(cands_sorted)
         self._matches = self._candidates
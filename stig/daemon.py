@@ -0,0 +1,224 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+"""
+Run CLI commands in a long-lived process
+
+`serve` keeps the connection to the Transmission daemon and all caches and
+executes commands it gets from clients over a Unix socket.  `run_client` sends
+commands to it and prints the output.
+
+Each message is a JSON object on a single line.  Clients send one request:
+
+    {"commands": [["ls", "-s", "name"], "&", ["start", "foo"]], "cwd": "/home/me"}
+
+The server replies with any number of {"stdout": "..."} and {"stderr": "..."}
+messages and finally with {"exit": <exit code>}.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+
+from . import __appname__
+
+from .logging import make_logger  # isort:skip
+log = make_logger(__name__)
+
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                              '%s-%d.sock' % (__appname__, os.getuid()))
+
+
+class DaemonError(Exception):
+    pass
+
+
+def run_client(commands, path=DEFAULT_SOCKET):
+    """
+    Send `commands` to daemon listening at `path` and print its output
+
+    Return the exit code of the commands.
+    """
+    import socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError as e:
+            print('Unable to connect to %s daemon at %s: %s' % (__appname__, path, e.strerror or e),
+                  file=sys.stderr)
+            return 1
+
+        request = {'commands': commands, 'cwd': os.getcwd()}
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+
+        exit_code = 1
+        with sock.makefile('r', encoding='utf-8') as responses:
+            for line in responses:
+                msg = json.loads(line)
+                if 'stdout' in msg:
+                    sys.stdout.write(msg['stdout'])
+                    sys.stdout.flush()
+                elif 'stderr' in msg:
+                    sys.stderr.write(msg['stderr'])
+                    sys.stderr.flush()
+                elif 'exit' in msg:
+                    exit_code = msg['exit']
+        return exit_code
+
+
+class _ClientStream(io.TextIOBase):
+    """Text stream that sends everything written to it to a client"""
+
+    def __init__(self, writer, name):
+        self._writer = writer
+        self._name = name
+
+    def write(self, string):
+        if string and not self._writer.is_closing():
+            self._writer.write(json.dumps({self._name: string}).encode('utf-8') + b'\n')
+        return len(string)
+
+    def isatty(self):
+        return False
+
+
+class _CurrentStream(io.TextIOBase):
+    """Text stream that writes to whatever sys.stdout or sys.stderr is at the moment"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def write(self, string):
+        return getattr(sys, self._name).write(string)
+
+    def flush(self):
+        getattr(sys, self._name).flush()
+
+
+def _redirect_logging():
+    # Logging handlers keep the stream they were created with, but log
+    # messages of commands must go to the client
+    import logging
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            for name in ('stdout', 'stderr'):
+                if handler.stream is getattr(sys, name):
+                    handler.setStream(_CurrentStream(name))
+
+
+async def _check_socket(path):
+    # Refuse to replace the socket of a running daemon, but remove stale
+    # sockets of daemons that didn't exit properly
+    import asyncio
+    import stat
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise DaemonError('Not a socket: %s' % path)
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except OSError:
+        log.debug('Removing stale socket: %s', path)
+        os.unlink(path)
+    else:
+        writer.close()
+        raise DaemonError('Already running: %s' % path)
+
+
+async def serve(run_commands, path=DEFAULT_SOCKET, stop=None):
+    """
+    Execute commands from clients connecting to `path`
+
+    run_commands: Coroutine function that gets a command chain and returns
+                  whether it succeeded (e.g. CommandManager.run_async)
+    stop: asyncio.Event that stops the daemon; SIGINT and SIGTERM stop the
+          daemon if this is None
+
+    Commands are executed one after another because their output is captured
+    by replacing sys.stdout and sys.stderr.
+
+    Raise DaemonError if `path` can't be used.
+    """
+    import asyncio
+    import contextlib
+    import signal
+
+    lock = asyncio.Lock()
+    daemon_cwd = os.getcwd()
+
+    async def handle_client(reader, writer):
+        try:
+            request = json.loads(await reader.readline())
+            commands = request['commands']
+            cwd = request.get('cwd', daemon_cwd)
+        except (ValueError, KeyError, TypeError) as e:
+            log.debug('Invalid request: %r', e)
+            writer.close()
+            return
+
+        stdout = _ClientStream(writer, 'stdout')
+        stderr = _ClientStream(writer, 'stderr')
+        async with lock:
+            log.debug('Running commands from client: %r', commands)
+            success = False
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    os.chdir(cwd)
+                    success = await run_commands(commands)
+                except OSError as e:
+                    print('%s: %s' % (cwd, e.strerror), file=sys.stderr)
+                    success = False
+                finally:
+                    os.chdir(daemon_cwd)
+        try:
+            writer.write(json.dumps({'exit': 0 if success else 1}).encode('utf-8') + b'\n')
+            await writer.drain()
+        except ConnectionError as e:
+            log.debug('Client is gone: %r', e)
+        finally:
+            writer.close()
+
+    await _check_socket(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _redirect_logging()
+
+    # Only our user may connect
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(handle_client, path=path)
+    finally:
+        os.umask(old_umask)
+    log.debug('Listening on %s', path)
+
+    loop = asyncio.get_event_loop()
+    signals = ()
+    if stop is None:
+        stop = asyncio.Event()
+        signals = (signal.SIGINT, signal.SIGTERM)
+        for sig in signals:
+            loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+        server.close()
+        await server.wait_closed()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        log.debug('Stopped listening on %s', path)
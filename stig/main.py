@@ -34,7 +34,9 @@ logging.redirect_level('INFO', sys.stdout)
 
 
 def run():
-    cmdmgr.load_cmds_from_module('stig.commands.cli', 'stig.commands.tui')
+    # Commands are imported when they are needed
+    from .commands import manifest
+    cmdmgr.load_cmds_from_manifest(manifest.COMMANDS)
 
     from . import hooks  # noqa: F401
     from .commands import CmdError
@@ -51,7 +53,9 @@ def run():
             sys.exit(1)
 
     # Decide if we run as a TUI or CLI
-    if cliargs['tui']:
+    if cliargs['daemon'] or cliargs['batch']:
+        cmdmgr.active_interface = 'cli'
+    elif cliargs['tui']:
         cmdmgr.active_interface = 'tui'
     elif cliargs['notui']:
         cmdmgr.active_interface = 'cli'
@@ -83,10 +87,33 @@ def run():
 
         return True
 
+    def run_batch():
+        from . import batch
+        if cliargs['batch_status'] is None:
+            return batch.run(cmdmgr.run_sync, sys.stdin, sys.stderr)
+        try:
+            with open(cliargs['batch_status'], 'w') as status:
+                return batch.run(cmdmgr.run_sync, sys.stdin, status)
+        except OSError as e:
+            log.error('%s: %s' % (cliargs['batch_status'], e.strerror))
+            return False
+
     exit_code = 0
 
     # Run commands either in CLI or TUI mode
-    if cmdmgr.active_interface == 'cli':
+    if cliargs['daemon']:
+        from . import daemon
+        try:
+            if not run_commands():
+                exit_code = 1
+            else:
+                path = cliargs['socket'] or daemon.DEFAULT_SOCKET
+                asyncio.get_event_loop().run_until_complete(daemon.serve(cmdmgr.run_async, path))
+        except daemon.DaemonError as e:
+            log.error(e)
+            exit_code = 1
+
+    elif cmdmgr.active_interface == 'cli':
         # Exit when pipe is closed (e.g. `stig help | head -1`)
         import signal
         signal.signal(signal.SIGPIPE, signal.SIG_DFL)
@@ -94,6 +121,8 @@ def run():
         try:
             if not run_commands():
                 exit_code = 1
+            elif cliargs['batch'] and not run_batch():
+                exit_code = 1
         except KeyboardInterrupt:
             log.debug('Caught SIGINT')
 
@@ -141,6 +141,12 @@ def init_defaults(localcfg):
                  setter=lambda v: setattr(objects.srvapi.rpc, 'proxy', v),
                  default='',
                  description='SOCKS5, SOCKS4 or HTTP proxy URL to tunnel RPC communication through')
+    localcfg.add('connect.max-requests',
+                 Int.partial(min=1),
+                 getter=lambda: objects.srvapi.rpc.max_requests,
+                 setter=lambda v: setattr(objects.srvapi.rpc, 'max_requests', v),
+                 default=4,
+                 description='Maximum number of concurrent requests to the Transmission RPC interface')
 
     localcfg.add('columns.torrents',
                  Tuple.partial(options=torrent.COLUMNS, aliases=torrent.ALIASES),
@@ -207,6 +213,11 @@ def init_defaults(localcfg):
                  Bytes.partial(min=0),
                  default='10GB',
                  description='Minimum amount of free space before highlighting the display')
+    localcfg.add('tui.fps',
+                 Float.partial(min=1),
+                 default=30,
+                 description=('Maximum number of screen redraws per second; '
+                              'changes in between are combined into one redraw'))
     localcfg.add('tui.log.height',
                  Int.partial(min=1),
                  default=10,
@@ -220,6 +231,26 @@ def init_defaults(localcfg):
                  Float.partial(min=0.1),
                  default=5,
                  description='Interval in seconds between TUI updates')
+    localcfg.add('tui.poll.background',
+                 Bool.partial(),
+                 default='on',
+                 description=('Whether to update tabs that are not focused; if disabled, '
+                              'they are updated when they get focus again'))
+    localcfg.add('tui.poll.resync',
+                 Float.partial(min=0),
+                 getter=lambda: objects.srvapi.torrent.resync_interval,
+                 setter=lambda v: setattr(objects.srvapi.torrent, 'resync_interval', v),
+                 default=60,
+                 description=('Interval in seconds between requests for all torrents; '
+                              'in between, only recently active torrents are requested '
+                              '(0 means always request all torrents)'))
+    localcfg.add('tui.poll.thread',
+                 Bool.partial(),
+                 getter=lambda: objects.srvapi.torrent.worker_thread,
+                 setter=lambda v: setattr(objects.srvapi.torrent, 'worker_thread', v),
+                 default='on',
+                 description=('Whether to create large values (e.g. file trees of torrents '
+                              'with many files) in a separate thread to keep the UI responsive'))
     localcfg.add('tui.theme',
                  Path.partial(base=os.path.dirname(DEFAULT_RCFILE)),
                  default=DEFAULT_THEME_FILE,
@@ -558,6 +589,10 @@ DEFAULT_KEYMAP = (
      'description': 'Mark or unmark focused file or directory'},
     {'context': 'file', 'key': 'alt-space', 'action': 'mark --toggle --all',
      'description': 'Mark or unmark all files'},
+    {'context': 'file', 'key': 'enter',     'action': 'expand --toggle',
+     'description': 'Show or hide the contents of focused directory'},
+    {'context': 'file', 'key': 'alt-enter', 'action': 'expand --toggle --all',
+     'description': 'Show or hide the contents of all directories'},
 
     # Tracker list actions
     {'context': 'trackerlist', 'key': 's e',   'action': 'sort --add error',
@@ -14,6 +14,7 @@ from functools import partial
 
 from ..objects import localcfg, srvapi
 from . import tuiobjects
+from .main import redraw
 from .views.file import TUICOLUMNS as FILE_COLUMNS
 from .views.file_list import FileListWidget
 from .views.peer_list import PeerListWidget
@@ -67,6 +68,18 @@ def _set_poll_interval(settings, name, value):
 localcfg.on_change(_set_poll_interval, name='tui.poll')
 
 
+def _set_fps(settings, name, value):
+    redraw.fps = value
+localcfg.on_change(_set_fps, name='tui.fps')
+redraw.fps = localcfg['tui.fps']
+
+
+def _set_poll_background(settings, name, value):
+    tuiobjects.tabs.pause_hidden = not value
+localcfg.on_change(_set_poll_background, name='tui.poll.background')
+_set_poll_background(localcfg, name='tui.poll.background', value=localcfg['tui.poll.background'])
+
+
 def _set_cli_history_dir(settings, name, value):
     tuiobjects.cli.original_widget.history_file = os.path.join(value.full_path, 'commands')
 localcfg.on_change(_set_cli_history_dir, name='tui.cli.history-dir')
@@ -0,0 +1,283 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+import collections
+from bisect import bisect_left, bisect_right
+
+import urwid
+
+
+class ItemWalker(urwid.ListWalker):
+    """
+    List walker that only creates widgets for displayed items
+
+    Items are stored as data (e.g. Torrent objects) that is mapped to item IDs.
+    `ids` specifies which items are displayed in which order.  If `reset` is
+    called with sort keys, `insert` uses them to find the position of a new
+    item.
+
+    Widgets are created when the ListBox needs them.  If `uniform` is True, at
+    most `max_widgets` widgets are kept and the least recently displayed widget
+    is reused for another item.  If `uniform` is False, widgets are never
+    reused because the ListBox needs the height of each widget for scrolling.
+
+    Widgets that are not displayed are not updated until they are displayed.
+
+    create_widget: Callable that gets an item ID and data and returns a widget
+    reuse_widget: Callable that gets a widget, its current item ID, another item
+                  ID and that item's data and updates the widget
+    discard_widget: Callable that gets an item ID and its widget after the item
+                    was removed
+    uniform: Whether all widgets have the same height
+    """
+    def __init__(self, create_widget, reuse_widget, discard_widget, uniform=True):
+        self._create_widget = create_widget
+        self._reuse_widget = reuse_widget
+        self._discard_widget = discard_widget
+        self.uniform = uniform
+        self.max_widgets = None
+        self._data = {}
+        self._ids = []
+        self._keys = None     # Sort keys in the same order as `_ids` or None
+        self._displayed = {}  # Map displayed IDs to sort keys
+        self._widgets = collections.OrderedDict()  # Least recently displayed first
+        self._stale = {}  # Map IDs of outdated widgets to changed keys
+        self.focus = 0
+
+    @property
+    def data(self):
+        """Dictionary that maps item IDs to data of all items (including hidden ones)"""
+        return self._data
+
+    def update(self, data_dict, changed_keys=None):
+        """
+        Replace all items with `data_dict`
+
+        changed_keys: Dictionary that maps item IDs to keys that changed in
+                      their data (see `ItemWidgetBase.update`) or `None`
+
+        Return set of IDs of new items.
+        """
+        old_data = self._data
+        self._data = data_dict
+        removed_ids = old_data.keys() - data_dict.keys()
+        added_ids = data_dict.keys() - old_data.keys()
+
+        widgets = self._widgets
+        stale = self._stale
+        for id in removed_ids:
+            stale.pop(id, None)
+            widget = widgets.pop(id, None)
+            if widget is not None:
+                self._discard_widget(id, widget)
+        self._remove_many(removed_ids)
+
+        for id in widgets:
+            keys = changed_keys.get(id) if changed_keys is not None else None
+            if id in stale:
+                stale_keys = stale[id]
+                if stale_keys is None or keys is None:
+                    stale[id] = None
+                else:
+                    stale[id] = stale_keys | keys
+            elif keys is None or keys:
+                stale[id] = keys
+
+        self._modified()
+        return added_ids
+
+    def refresh(self):
+        """Update all widgets when they are displayed the next time"""
+        for id in self._widgets:
+            self._stale[id] = None
+        self._modified()
+
+    def clear(self):
+        """Remove all items"""
+        for id,widget in self._widgets.items():
+            self._discard_widget(id, widget)
+        self._widgets.clear()
+        self._stale.clear()
+        self._data = {}
+        self.ids = []
+
+    @property
+    def ids(self):
+        """List of displayed item IDs"""
+        return self._ids
+
+    @ids.setter
+    def ids(self, ids):
+        self.reset(ids)
+
+    def reset(self, ids, keys=None):
+        """
+        Display items in the order of `ids`
+
+        keys: Sort keys of `ids` in the same order or `None` if the items are
+              not sorted
+        """
+        # Keep focus on the same item if possible
+        focus_id = self.focus_id
+        self._ids = ids
+        self._keys = keys
+        if keys is None:
+            self._displayed = dict.fromkeys(ids)
+        else:
+            self._displayed = dict(zip(ids, keys))
+        if focus_id is not None and focus_id in self._displayed:
+            self.focus = ids.index(focus_id)
+        self.focus = max(0, min(self.focus, len(ids) - 1))
+        self._modified()
+
+    def __contains__(self, id):
+        return id in self._displayed
+
+    def get_key(self, id):
+        """Return sort key of displayed item `id`"""
+        return self._displayed[id]
+
+    def insert(self, id, key=None):
+        """
+        Display item `id` and return its position
+
+        If the items are sorted, `id` is inserted at the position of `key`,
+        otherwise it is appended.
+        """
+        ids = self._ids
+        if self._keys is None:
+            pos = len(ids)
+        else:
+            pos = bisect_right(self._keys, key)
+            self._keys.insert(pos, key)
+        ids.insert(pos, id)
+        self._displayed[id] = key
+        if pos <= self.focus and len(ids) > 1:
+            self.focus += 1
+        self._modified()
+        return pos
+
+    def remove(self, id):
+        """Stop displaying item `id`"""
+        key = self._displayed.pop(id)
+        ids = self._ids
+        keys = self._keys
+        if keys is None:
+            pos = ids.index(id)
+        else:
+            pos = bisect_left(keys, key)
+            if pos >= len(ids) or ids[pos] != id:
+                # Other items have the same key
+                try:
+                    pos = ids.index(id, pos)
+                except ValueError:
+                    # Keys can't be compared consistently
+                    pos = ids.index(id)
+            del keys[pos]
+        del ids[pos]
+        if pos < self.focus or self.focus >= len(ids) > 0:
+            self.focus -= 1
+        self._modified()
+
+    def move(self, id, key):
+        """Move displayed item `id` to the position of `key`"""
+        focused = id == self.focus_id
+        self.remove(id)
+        pos = self.insert(id, key)
+        if focused:
+            self.focus = pos
+
+    def _remove_many(self, ids):
+        ids = [id for id in ids if id in self._displayed]
+        if len(ids) <= 16:
+            for id in ids:
+                self.remove(id)
+        else:
+            ids = set(ids)
+            if self._keys is None:
+                self.reset([id for id in self._ids if id not in ids])
+            else:
+                pairs = [(id, key) for id,key in zip(self._ids, self._keys) if id not in ids]
+                self.reset([id for id,_ in pairs], [key for _,key in pairs])
+
+    @property
+    def focus_id(self):
+        """ID of the focused item or `None`"""
+        ids = self._ids
+        if 0 <= self.focus < len(ids):
+            return ids[self.focus]
+
+    @property
+    def widgets(self):
+        """Existing widgets"""
+        return tuple(self._widgets.values())
+
+    def get_widget(self, id):
+        """Return existing widget for item `id` or `None`"""
+        return self._widgets.get(id)
+
+    def _get_widget(self, id):
+        widgets = self._widgets
+        widget = widgets.get(id)
+        if widget is not None:
+            widgets.move_to_end(id)
+            if id in self._stale:
+                widget.update(self._data[id], self._stale.pop(id))
+        else:
+            data = self._data[id]
+            max_widgets = self.max_widgets
+            old_id = None
+            if self.uniform and max_widgets is not None and len(widgets) >= max_widgets:
+                # Reuse least recently displayed widget unless it is focused
+                focus_id = self.focus_id
+                for old_id in widgets:
+                    if old_id != focus_id:
+                        break
+                else:
+                    old_id = None
+
+            if old_id is not None:
+                widget = widgets.pop(old_id)
+                self._stale.pop(old_id, None)
+                self._reuse_widget(widget, old_id, id, data)
+            else:
+                widget = self._create_widget(id, data)
+            widgets[id] = widget
+        return widget
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, position):
+        if position < 0:
+            raise IndexError(position)
+        return self._get_widget(self._ids[position])
+
+    def next_position(self, position):
+        if position >= len(self._ids) - 1:
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self._ids) - 1, -1, -1)
+        return range(len(self._ids))
+
+    def set_focus(self, position):
+        if not 0 <= position < len(self._ids):
+            raise IndexError(position)
+        self.focus = position
+        self._modified()
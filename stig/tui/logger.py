@@ -11,6 +11,7 @@
 
 import asyncio
 import logging
+import threading
 import time
 
 import urwid
@@ -28,9 +29,14 @@ class UILogRecordHandler(logging.Handler):
     def __init__(self, logwidget):
         super().__init__()
         self._logwidget = logwidget
+        self._loop = asyncio.get_event_loop()
 
     def emit(self, record):
-        self._logwidget.add(record)
+        if threading.current_thread() is threading.main_thread():
+            self._logwidget.add(record)
+        else:
+            # Widgets must only be changed by the thread that runs the loop
+            self._loop.call_soon_threadsafe(self._logwidget.add, record)
 
 
 class LogWidget(urwid.WidgetWrap):
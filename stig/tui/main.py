@@ -62,6 +62,7 @@ def run(command_runner):
     finally:
         tuiobjects.urwidscreen.tty_signal_keys(*old)
         tuiobjects.logwidget.disable()
+        log.debug('Redraws: %d requested, %d performed', redraw.requested, redraw.performed)
 
     return True
 
@@ -78,7 +79,7 @@ def redraw_screen(func):
         try:
             return func(self, *args, **kwargs)
         finally:
-            asyncio.get_event_loop().call_soon(_redraw_screen)
+            redraw.request()
 
     return wrapper
 
@@ -89,3 +90,73 @@ def _redraw_screen():
     except (AssertionError, RuntimeError):
         # catches trying to redraw the screen before urwidloop has started
         pass
+
+
+class RedrawScheduler():
+    """
+    Coalesce redraw requests into at most one redraw per frame
+
+    draw: Callable that redraws the screen
+    fps: Maximum number of redraws per second
+
+    Any number of calls to `request` between two frames result in a single
+    call to `draw`.  `requested` and `performed` count calls to `request` and
+    `draw`.
+    """
+
+    def __init__(self, draw=_redraw_screen, fps=30):
+        self._draw_func = draw
+        self._handle = None
+        self._last_draw = None
+        self.fps = fps
+        self.requested = 0
+        self.performed = 0
+
+    @property
+    def fps(self):
+        """Maximum number of redraws per second"""
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps):
+        fps = float(fps)
+        if fps <= 0:
+            raise ValueError('Frame rate must be positive: %r' % (fps,))
+        self._fps = fps
+
+    @property
+    def pending(self):
+        """Whether a redraw is scheduled"""
+        return self._handle is not None
+
+    def request(self):
+        """Schedule redraw unless one is already pending"""
+        self.requested += 1
+        if self._handle is None:
+            loop = asyncio.get_event_loop()
+            if self._last_draw is None:
+                delay = 0
+            else:
+                delay = max(0, self._last_draw + 1 / self._fps - loop.time())
+            if delay <= 0:
+                self._handle = loop.call_soon(self._draw)
+            else:
+                self._handle = loop.call_later(delay, self._draw)
+
+    def cancel(self):
+        """Cancel pending redraw"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _draw(self):
+        self._handle = None
+        self._last_draw = asyncio.get_event_loop().time()
+        self.performed += 1
+        self._draw_func()
+
+    def __repr__(self):
+        return '<%s fps=%s requested=%d performed=%d>' % (
+            type(self).__name__, self._fps, self.requested, self.performed)
+
+redraw = RedrawScheduler()
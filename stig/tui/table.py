@@ -52,6 +52,14 @@ class Table():
             member.add(colname, cellwidget, options=cellcls.width, removable=True)
         self._members[member_id] = member
 
+    def unregister(self, member_id):
+        """Remove row that was added with register()"""
+        del self._members[member_id]
+
+    def move(self, member_id, new_member_id):
+        """Make row available as `new_member_id` instead of `member_id`"""
+        self._members[new_member_id] = self._members.pop(member_id)
+
     def get_row(self, member_id):
         """Return a row, i.e. a Group(cls=Columns) object created by register()"""
         return self._members[member_id]
@@ -99,6 +99,7 @@ class Tabs(urwid.Widget):
             self._tabbar = tabbar
 
         self._ids = []
+        self._pause_hidden = False
         self._focus_history = []
         self._info = defaultdict(lambda: {})
         self._contents = urwid.MonitoredFocusList()
@@ -252,6 +253,7 @@ class Tabs(urwid.Widget):
         self._contents.insert(newpos, widget)
         if focus:
             self.focus_position = newpos
+        self._update_paused()
         return this_id
 
     @redraw_screen
@@ -323,6 +325,7 @@ class Tabs(urwid.Widget):
         fh = self._focus_history
         while tabid in fh:
             fh.remove(tabid)
+        self._update_paused()
 
     def clear(self):
         """Remove all tabs"""
@@ -380,6 +383,7 @@ class Tabs(urwid.Widget):
         i = self.get_index(position)
         if i is not None:
             self._contents[i] = widget
+            self._update_paused()
         else:
             raise RuntimeError('Tabs is empty')
 
@@ -448,6 +452,7 @@ class Tabs(urwid.Widget):
         if 0 <= position < len(self._contents):
             self._tabbar.base_widget.focus = position
             self._contents.focus = position
+            self._update_paused()
         else:
             raise IndexError('No tab at position: {!r}'.format(position))
 
@@ -477,6 +482,7 @@ class Tabs(urwid.Widget):
         if 0 <= i < len(self._contents):
             self._tabbar.base_widget.focus = i
             self._contents.focus = i
+            self._update_paused()
         else:
             raise IndexError('No tab with ID: {}'.format(tabid))
 
@@ -487,6 +493,32 @@ class Tabs(urwid.Widget):
         if len(fh) >= 2:
             return fh[-2]
 
+    @property
+    def pause_hidden(self):
+        """
+        Whether content widgets of unfocused tabs are paused
+
+        Content widgets that have `pause` and `resume` methods are paused when
+        their tab loses focus and resumed when it gets focus again.
+        """
+        return self._pause_hidden
+
+    @pause_hidden.setter
+    def pause_hidden(self, pause_hidden):
+        self._pause_hidden = bool(pause_hidden)
+        self._update_paused()
+
+    def _update_paused(self):
+        focus = self.focus
+        for widget in self._contents:
+            if widget is not None:
+                if self._pause_hidden and widget is not focus:
+                    method = getattr(widget, 'pause', None)
+                else:
+                    method = getattr(widget, 'resume', None)
+                if method is not None:
+                    method()
+
     @property
     def ids(self):
         """Yields all tab IDs"""
@@ -229,18 +229,26 @@ class ListBox_patched(urwid.ListBox):
             flow_size = (maxcol,)
 
             body = self.body
-            if hasattr(body, 'positions'):
-                # For body[pos], pos can be anything, not just an int.  In that
-                # case, the positions() method returns an interable of valid
-                # positions.
-                positions = tuple(self.body.positions())
-                focus_index = positions.index(focus_pos)
-                widgets_above_focus = (body[pos] for pos in positions[:focus_index])
+            if getattr(body, 'uniform', False):
+                # All widgets have the same height
+                if getattr(body, 'indexed', True):
+                    focus_index = focus_pos
+                else:
+                    # Positions are not indexes
+                    focus_index = tuple(body.positions()).index(focus_pos)
+                rows_above_focus = focus_index * self._item_rows(flow_size)
             else:
-                # Treat body like a normal list
-                widgets_above_focus = (w for w in body[:focus_pos])
-
-            rows_above_focus = sum(w.rows(flow_size) for w in widgets_above_focus)
+                if hasattr(body, 'positions'):
+                    # For body[pos], pos can be anything, not just an int.  In
+                    # that case, the positions() method returns an interable of
+                    # valid positions.
+                    positions = tuple(self.body.positions())
+                    focus_index = positions.index(focus_pos)
+                    widgets_above_focus = (body[pos] for pos in positions[:focus_index])
+                else:
+                    # Treat body like a normal list
+                    widgets_above_focus = (w for w in body[:focus_pos])
+                rows_above_focus = sum(w.rows(flow_size) for w in widgets_above_focus)
             rows_above_top = rows_above_focus - offset_rows
             return rows_above_top
 
@@ -248,10 +256,17 @@ class ListBox_patched(urwid.ListBox):
         if self._rows_max is None:
             flow_size = (size[0],)
             body = self.body
-            if hasattr(body, 'positions'):
+            if getattr(body, 'uniform', False):
+                # Don't create widgets for items that are not displayed
+                self._rows_max = len(body) * self._item_rows(flow_size)
+            elif hasattr(body, 'positions'):
                 self._rows_max = sum(body[pos].rows(flow_size) for pos in body.positions())
             else:
                 self._rows_max = sum(w.rows(flow_size) for w in self.body)
         return self._rows_max
 
+    def _item_rows(self, flow_size):
+        focus_widget = self.body.get_focus()[0]
+        return focus_widget.rows(flow_size) if focus_widget is not None else 0
+
 _patched_classes['ListBox'] = ListBox_patched
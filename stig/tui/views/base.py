@@ -15,6 +15,7 @@ import urwid
 
 from ..main import redraw_screen
 from urwid import ScrollBar
+from ..itemwalker import ItemWalker
 from ..table import ColumnHeaderWidget, Table
 from ..tuiobjects import bottombar
 
@@ -82,6 +83,10 @@ class CellWidgetBase(urwid.WidgetWrap):
     width = ('weight', 100)
     align = 'right'
 
+    # Whether the displayed text depends on the current time and must be
+    # updated even if `needed_keys` didn't change
+    volatile = False
+
     def __init__(self):
         self.value = None
         self.text = urwid.Text('', wrap=self.wrap, align=self.align)
@@ -136,9 +141,21 @@ class ItemWidgetBase(urwid.WidgetWrap):
         # Initialize cell widgets
         self.update(data)
 
-    def update(self, data):
+    def update(self, data, changed_keys=None):
+        """
+        Update cell widgets
+
+        changed_keys: Keys with values that changed in `data` or `None` to
+                      update all cells; cells with `needed_keys` that didn't
+                      change are not updated
+        """
         for widget in self._cells.widgets:
             if hasattr(widget, 'update'):
+                if changed_keys is not None:
+                    needed_keys = getattr(widget, 'needed_keys', None)
+                    if needed_keys is not None and not widget.volatile \
+                       and changed_keys.isdisjoint(needed_keys):
+                        continue
                 widget.update(data)
         self._data = data
 
@@ -176,6 +193,12 @@ class ListWidgetBase(urwid.WidgetWrap):
     palette_name    = NotImplemented
     focusable_items = False
 
+    # Whether all items have the same height so that widgets can be reused
+    uniform_items = True
+
+    # Number of item widgets that are kept in addition to the displayed ones
+    WIDGET_MARGIN = 20
+
     def __init__(self, srvapi, keymap, columns=None, sort=None, title=None):
         self._srvapi = srvapi
         self._keymap = keymap
@@ -186,10 +209,10 @@ class ListWidgetBase(urwid.WidgetWrap):
             self._ListItemClass = self.ListItemClass
 
         self._data_dict = None
+        self._changed_keys = {}
         self._marked = set()
-
-        self._existing_widgets = set()
-        self._hidden_widgets = set()
+        self._dirty_ids = set()  # IDs of items that may have to be hidden, unhidden or moved
+        self._reorder_needed = True  # Whether all items must be filtered and sorted
 
         self._sort = sort
         self._sort_orig = sort
@@ -200,11 +223,11 @@ class ListWidgetBase(urwid.WidgetWrap):
         self._table = Table(**self.tuicolumns)
         self._table.columns = columns or ()
 
-        if self.focusable_items:
-            walker = urwid.SimpleFocusListWalker([])
-        else:
-            walker = urwid.SimpleListWalker([])
-        self._listbox = keymap.wrap(urwid.ListBox, context=self.keymap_context + 'list')(walker)
+        self._walker = ItemWalker(create_widget=self._create_item_widget,
+                                  reuse_widget=self._reuse_item_widget,
+                                  discard_widget=self._discard_item_widget,
+                                  uniform=self.uniform_items)
+        self._listbox = keymap.wrap(urwid.ListBox, context=self.keymap_context + 'list')(self._walker)
 
         listbox_sb = urwid.AttrMap(
             ScrollBar(urwid.AttrMap(self._listbox, self.palette_name)),
@@ -227,24 +250,14 @@ class ListWidgetBase(urwid.WidgetWrap):
         super()._invalidate()
 
     def render(self, size, focus=False):
-        # Remember focused item widget in case items get added or removed
-        focusedw = self.focused_widget
-
         if self._data_dict is not None:
-            self._update_existing_widgets(self._data_dict)
+            self._update_items(self._data_dict)
             self._data_dict = None
 
-        self._hide_or_unhide_widgets()
-        self._sort_widgets()
+        self._update_order()
 
-        # Ensure focus doesn't change when items get added or removed
-        if focusedw is not None and self.focused_widget is not None and \
-           focusedw.id != self.focused_widget.id:
-            focused_id = focusedw.id
-            for i,w in enumerate(self._listbox.body):
-                if w.id == focused_id:
-                    self._listbox.focus_position = i
-                    break
+        # Keep widgets for the displayed rows and some more
+        self._walker.max_widgets = size[1] + self.WIDGET_MARGIN
 
         # Update number of marked items in this list
         bottombar.marked.update(len(self._marked))
@@ -253,88 +266,171 @@ class ListWidgetBase(urwid.WidgetWrap):
         # example when the CLI is open
         return super().render(size, focus=True)
 
-    def _update_existing_widgets(self, data_dict):
-        existing_widgets = self._existing_widgets
-        dead_widgets = []
+    def _create_item_widget(self, id, data):
+        self._table.register(id)
+        widget = self._ListItemClass(data, self._table.get_row(id))
+        if id in self._marked:
+            widget.is_marked = True
+        return widget
 
-        for w in existing_widgets:  # w = *ItemWidget instance
-            id = w.id
-            try:
-                # Update existing *ItemWidget instances with new data
-                w.update(data_dict[id])
-                del data_dict[id]
-            except KeyError:
-                # Item no longer exists in data_dict anymore
-                dead_widgets.append(w)
-
-        # Remove dead *ItemWidget instances
-        walker = self._listbox.body
-        marked = self._marked
-        for w in dead_widgets:
-            if w in walker:
-                walker.remove(w)
-            existing_widgets.remove(w)
-            marked.discard(w)  # self._marked may have a reference too
-
-        # Any items that haven't been used to update an existing *ItemWidget instance are new
-        if data_dict:
-            table = self._table
-            ListItemClass = self._ListItemClass
-            for data_id,data in data_dict.items():
-                table.register(data_id)
-                row = table.get_row(data_id)
-                existing_widgets.add(ListItemClass(data, row))
-
-    def _sort_widgets(self):
-        walker = self._listbox.body
-        if self._sort is not None:
+    def _reuse_item_widget(self, widget, old_id, id, data):
+        self._table.move(old_id, id)
+        widget.update(data)
+        widget.is_marked = id in self._marked
+
+    def _discard_item_widget(self, id, widget):
+        self._table.unregister(id)
+
+    def _set_changed_keys(self, changed_keys):
+        """
+        Remember which keys changed in the data passed to the next render
+
+        changed_keys: Dictionary that maps IDs of items to sets of changed keys
+                      or to `None` if any key may have changed
+
+        Changes are combined with previous changes that weren't rendered yet.
+        """
+        pending = self._changed_keys
+        for id,keys in changed_keys.items():
+            if id not in pending:
+                pending[id] = keys
+            else:
+                pending_keys = pending[id]
+                if pending_keys is None or keys is None:
+                    pending[id] = None
+                else:
+                    pending[id] = pending_keys | keys
+
+    def _update_items(self, data_dict):
+        changed_keys = self._changed_keys
+        self._changed_keys = {}
+
+        added_ids = self._walker.update(data_dict, changed_keys)
+        self._marked.intersection_update(data_dict)
+
+        if not self._reorder_needed:
+            # Find items that may have to be hidden, unhidden or moved
+            dirty_ids = self._dirty_ids
+            dirty_ids.update(added_ids)
+            dirty_ids.update(data_dict.keys() - changed_keys.keys())
+            order_keys = self._order_keys
+            for id,keys in changed_keys.items():
+                if keys is None or (keys and (order_keys is None or not keys.isdisjoint(order_keys))):
+                    dirty_ids.add(id)
+
+    @property
+    def _order_keys(self):
+        # Keys that are needed to decide whether an item is hidden and where it
+        # is displayed or `None` if any key may be needed
+        limit_keys = self._limit_keys
+        if self._sort is None:
+            sort_keys = ()
+        else:
+            sort_keys = getattr(self._sort, 'needed_keys', None)
+        if limit_keys is None or sort_keys is None:
+            return None
+        return frozenset(limit_keys).union(sort_keys)
+
+    def _update_order(self):
+        if self._reorder_needed or len(self._dirty_ids) > len(self._walker.data) // 4:
+            self._reorder_items()
+        elif self._dirty_ids:
+            self._reposition_items()
+
+        if self.title_updater is not None:
+            self.title_updater(self.title, ' [%d]' % self.count)
+
+    def _reorder_items(self):
+        # Filter and sort all items
+        walker = self._walker
+        data = walker.data
+        hidden_ids = set(self._limit_items(data))
+        ids = [id for id in data if id not in hidden_ids]
+        if self._sort is None:
+            walker.reset(ids)
+        else:
             try:
-                self._sort.apply(walker,
-                                 item_getter=lambda w: w.data,
-                                 inplace=True)
+                ids = self._sort.apply(ids, item_getter=data.__getitem__)
             except KeyError:
                 # This happens when adding a new sort order that needs
                 # previously unneeded keys (e.g. "started" needs "time-started",
                 # which is normally not used).  The new request is correctly
                 # registered in client.trequestpool, but when the async RPC
                 # request is made, the asyncio loop yields control to the TUI,
-                # which redraws (i.e. sorts) the list with the old widget.data.
+                # which redraws (i.e. sorts) the list with the old data.
                 # (I couldn't figure out why this redraw happens.)  Ignoring the
                 # KeyError fixes this because as soon as the RPC response gets
                 # through, a new redraw is issued and the new sort exists.
-                pass
-
-    def _hide_or_unhide_widgets(self):
-        walker = self._listbox.body
-        existing_widgets = self._existing_widgets
-        hidden_ids = tuple(w.id for w in self._limit_items(existing_widgets))
-        for w in existing_widgets:
-            widget_is_visible = w in walker
-            hide_widget = w.id in hidden_ids
-            if hide_widget and widget_is_visible:
-                walker.remove(w)
-                self._hidden_widgets.add(w)
-            elif not hide_widget and not widget_is_visible:
-                walker.append(w)
+                return
+            get_key = self._sort.get_key
+            walker.reset(ids, [get_key(data[id]) for id in ids])
+        self._dirty_ids.clear()
+        self._reorder_needed = False
+
+    def _reposition_items(self):
+        # Hide, unhide or move items that changed
+        walker = self._walker
+        data = walker.data
+        dirty_items = {id: data[id] for id in self._dirty_ids if id in data}
+        hidden_ids = set(self._limit_items(dirty_items))
+        get_key = self._sort.get_key if self._sort is not None else None
+        try:
+            for id,item in dirty_items.items():
+                if id in hidden_ids:
+                    if id in walker:
+                        walker.remove(id)
+                else:
+                    key = get_key(item) if get_key is not None else None
+                    if id not in walker:
+                        walker.insert(id, key)
+                    elif key != walker.get_key(id):
+                        walker.move(id, key)
+        except KeyError:
+            # See _reorder_items()
+            self._reorder_needed = True
+        else:
+            self._dirty_ids.clear()
 
-        if self.title_updater is not None:
-            self.title_updater(self.title, ' [%d]' % self.count)
+    def _limit_items(self, items):
+        """
+        Yield IDs of hidden items
 
-    def _limit_items(self, existing_widgets):
-        """Iterate over filtered widgets"""
+        items: Dictionary that maps item IDs to data
+        """
         return ()
 
+    @property
+    def _limit_keys(self):
+        """
+        Keys that `_limit_items` needs or `None` if any key may be needed
+
+        Items are only passed to `_limit_items` again if any of these keys
+        changed.
+        """
+        return None
+
     def clear(self):
         """Remove all list items"""
+        self._walker.clear()
         self._table.clear()
-        self._listbox.body[:] = ()
         self._listbox._invalidate()
         self._marked.clear()
+        self._changed_keys.clear()
+        self._dirty_ids.clear()
+        self._reorder_needed = True
 
     def refresh(self):
         """Update list items"""
         raise NotImplementedError
 
+    def pause(self):
+        """Stop receiving updates (e.g. because the list is not visible)"""
+        self._srvapi.treqpool.pause(id(self))
+
+    def resume(self):
+        """Receive updates again after `pause`"""
+        self._srvapi.treqpool.resume(id(self))
+
 
     @property
     def columns(self):
@@ -343,6 +439,8 @@ class ListWidgetBase(urwid.WidgetWrap):
     @columns.setter
     def columns(self, columns):
         self._table.columns = columns
+        # New cells are only updated when their `needed_keys` change
+        self._walker.refresh()
 
     @property
     def sort(self):
@@ -355,6 +453,7 @@ class ListWidgetBase(urwid.WidgetWrap):
             self._sort = self._sort_orig
         else:
             self._sort = sort
+        self._reorder_needed = True
 
     @property
     def count(self):
@@ -366,7 +465,7 @@ class ListWidgetBase(urwid.WidgetWrap):
         if self._data_dict is not None:
             return len(self._data_dict)
         else:
-            return len(self._listbox.body)
+            return len(self._walker)
 
     DEFAULT_TITLE = 'No title'
 
@@ -407,15 +506,16 @@ class ListWidgetBase(urwid.WidgetWrap):
         self._set_mark(False, toggle=toggle, all=all)
 
     @property
-    def marked(self):
-        """Generator that yields ItemWidgetBase descendants"""
+    def marked_ids(self):
+        """Generator that yields IDs of marked items"""
         secondary_filter = self.secondary_filter
         if secondary_filter is None:
             yield from self._marked
         else:
-            for widget in self._marked:
-                if secondary_filter.match(widget.data):
-                    yield widget
+            data = self._walker.data
+            for id in self._marked:
+                if secondary_filter.match(data[id]):
+                    yield id
 
     @property
     def marked_count(self):
@@ -426,19 +526,23 @@ class ListWidgetBase(urwid.WidgetWrap):
         if toggle and self.focused_widget is not None:
             mark = not self.focused_widget.is_marked
 
-        for widget in self._select_items_for_marking(all):
-            widget.is_marked = mark
+        walker = self._walker
+        for id in self._select_items_for_marking(all):
             if mark:
-                self._marked.add(widget)
+                self._marked.add(id)
             else:
-                self._marked.discard(widget)
+                self._marked.discard(id)
+            # Widgets that don't exist yet are marked when they are created
+            widget = walker.get_widget(id)
+            if widget is not None:
+                widget.is_marked = mark
 
     def _select_items_for_marking(self, all):
         if self.focused_widget is not None:
             if all:
-                yield from self._listbox.body
+                yield from self._walker.ids
             else:
-                yield self.focused_widget
+                yield self._walker.focus_id
 
     def refresh_marks(self):
         """
@@ -446,7 +550,7 @@ class ListWidgetBase(urwid.WidgetWrap):
 
         This shouldn't be needed unless the marked character was changed.
         """
-        for widget in self._listbox.body:
+        for widget in self._walker.widgets:
             widget.is_marked = widget.is_marked
 
 
@@ -462,9 +566,10 @@ class ListWidgetBase(urwid.WidgetWrap):
 
     @property
     def items(self):
-        """Yield non-hidden widgets from list"""
-        for item in self._listbox.body:
-            yield item
+        """Yield data of non-hidden items"""
+        data = self._walker.data
+        for id in self._walker.ids:
+            yield data[id]
 
     @property
     def focused_widget(self):
@@ -32,6 +32,7 @@ def mksection(title, width, items):
         def __init__(self):
             value_widgets = {}
             needed_keys = set()
+            slow_keys = set()
             rows = []
             label_width = max(len(item.label) for item in items)
             for item in items:
@@ -41,14 +42,20 @@ def mksection(title, width, items):
                 rows.append(urwid.Columns([('pack', label_w),
                                            ('pack', urwid.Text(': ')),
                                            value_w]))
-                needed_keys.update(item.needed_keys)
+                if item.slow:
+                    slow_keys.update(item.needed_keys)
+                else:
+                    needed_keys.update(item.needed_keys)
             self._value_widgets = value_widgets
             self.needed_keys = needed_keys
+            self.slow_keys = slow_keys
             super().__init__(urwid.Pile(rows))
 
         def update(self, torrent):
             for item,value_w in self._value_widgets.items():
-                value_w.set_text(item.human_readable(torrent))
+                # Slow keys may not be available yet
+                if not item.slow or all(key in torrent for key in item.needed_keys):
+                    value_w.set_text(item.human_readable(torrent))
 
     return Section
 
@@ -89,16 +96,27 @@ class TorrentDetailsWidget(urwid.WidgetWrap):
             'torrentdetails.scrollbar'
         ))
 
-        # Register new request in request pool
+        # Register new request in request pool; values that are expensive to
+        # get are updated less often
         keys = set(('name',)).union(key for w in sections for key in w.needed_keys)
-        self._poller = objects.srvapi.create_poller(objects.srvapi.torrent.torrents, (tid,), keys=keys)
-        self._poller.on_response(self._handle_response)
-        self._poller.on_error(self._handle_error)
+        slow_keys = set(key for w in sections for key in w.slow_keys)
+        self._tid = tid
+        objects.srvapi.treqpool.register(id(self), self._handle_torrents, keys=keys, tfilter=(tid,),
+                                         slow_keys=slow_keys)
+        objects.srvapi.treqpool.poll()
+
+    def pause(self):
+        """Stop receiving updates (e.g. because the widget is not visible)"""
+        objects.srvapi.treqpool.pause(id(self))
+
+    def resume(self):
+        """Receive updates again after `pause`"""
+        objects.srvapi.treqpool.resume(id(self))
 
     @redraw_screen
-    def _handle_response(self, response):
-        if response is not None and response.success:
-            self._torrent = response.torrents[0]
+    def _handle_torrents(self, torrents):
+        if torrents:
+            self._torrent = torrents[0]
             self._content.original_widget = self._grid
             for w in self._sections.values():
                 w.update(self._torrent)
@@ -106,8 +124,8 @@ class TorrentDetailsWidget(urwid.WidgetWrap):
             # Set new tab title if necessary
             if self.title_updater is not None:
                 self.title_updater(self.title)
-        elif response is not None:
-            self._handle_error(*response.msgs)
+        elif objects.srvapi.rpc.connected:
+            self._handle_error('No torrent with ID: %d' % self._tid)
 
     @redraw_screen
     def _handle_error(self, *errors):
@@ -11,7 +11,7 @@
 
 import builtins
 from collections import abc
-from functools import lru_cache
+from operator import itemgetter
 
 import urwid
 import urwidtrees
@@ -28,17 +28,61 @@ from ...logging import make_logger  # isort:skip
 log = make_logger(__name__)
 
 
-class FileTreeDecorator(ArrowTree):
-    """urwidtrees decorator for TorrentFiles and TorrentFileTrees"""
+class _FileNode():
+    """File or directory in a FileTree"""
 
-    def __init__(self, torrents, keymap, table, ffilter):
-        self._filewidgetcls = keymap.wrap(FileItemWidget, context='file')
-        self._table = table
+    __slots__ = ('name', 'content', 'data', 'children', 'collapsed', 'widget', 'tip')
+
+    def __init__(self, name, content, data=None, collapsed=False):
+        self.name = name            # Key of `content` in its parent TorrentFileTree
+        self.content = content      # TorrentFile or TorrentFileTree
+        self.data = data            # TorrentFile or TorrentFileDirectory; None if outdated
+        self.children = None        # List of _FileNodes; None if not created yet
+        self.collapsed = collapsed  # Whether children are hidden
+        self.widget = None          # FileItemWidget; None if never displayed
+        self.tip = None             # Text widget that indicates collapsed state
+
+    @property
+    def nodetype(self):
+        return self.content.nodetype
+
+
+class FileTree(urwidtrees.Tree):
+    """
+    Lazy urwidtrees.Tree of TorrentFiles and TorrentFileDirectories
+
+    Positions are tuples of indexes like in urwidtrees.SimpleTree.
+
+    The children of a directory are only created and sorted when they are
+    needed, e.g. when the directory is expanded.  Directories with more than
+    `expand_max` files are initially collapsed.
+    """
+
+    expand_max = 1000
+
+    def __init__(self, torrents, ffilter=None):
         self._ffilter = ffilter
-        self._widgets = {}
-        self._filtered_counts = {}
-        forest = self._create_file_forest(torrents)
-        super().__init__(forest, indent=2)
+        self._roots = []
+        self._roots_by_tid = {}
+        self.filecount = 0
+        for t in humansorted(torrents, key=lambda t: t['name']):
+            filetree = t['files']
+            if len(filetree) > 0:
+                rootname = next(iter(filetree))
+                content = filetree[rootname]
+                if content.nodetype == 'leaf':
+                    # Single-file torrent
+                    if self._file_is_filtered(content):
+                        continue
+                    node = _FileNode(rootname, content, content)
+                    self.filecount += 1
+                else:
+                    # Torrent with directory structure
+                    node = self._make_directory_node(rootname, content)
+                    self.filecount += self._count_files(content)
+                self._roots.append(node)
+                self._roots_by_tid[t['id']] = node
+        self.root = (0,) if self._roots else None
 
     def _file_is_filtered(self, tfile):
         if self._ffilter is None:
@@ -50,68 +94,194 @@ class FileTreeDecorator(ArrowTree):
             # ffilter is a FileFilter instance
             return not self._ffilter.match(tfile)
 
-    def _create_file_forest(self, torrents):
-        # Create a list of nested trees in SimpleTree format.  But the leaves
-        # are mappings instead of widgets.  Each mapping contains the
-        # information that the `decorate` method needs to create a widget.
+    def _count_files(self, content):
+        if self._ffilter is None:
+            return sum(1 for _ in content.files)
+        else:
+            return sum(1 for f in content.files if not self._file_is_filtered(f))
+
+    def _make_directory_node(self, name, content):
+        data = self._make_directory_data(name, content)
+        return _FileNode(name, content, data, collapsed=len(data['id']) > self.expand_max)
+
+    def _make_directory_data(self, name, content):
+        # Directory name includes the number of filtered files in it (but not
+        # in its subdirectories)
+        filtered_count = 0
+        if self._ffilter is not None:
+            for entry in content.values():
+                if entry.nodetype == 'leaf' and self._file_is_filtered(entry):
+                    filtered_count += 1
+        return TorrentFileDirectory(name, tree=content, filtered_count=filtered_count)
+
+    def _get_data(self, node):
+        if node.data is None:
+            node.data = self._make_directory_data(node.name, node.content)
+        return node.data
+
+    def _get_children(self, node):
+        if node.children is None:
+            children = []
+            if node.nodetype == 'parent':
+                for name,entry in humansorted(node.content.items(), key=itemgetter(0)):
+                    if entry.nodetype == 'leaf':
+                        if not self._file_is_filtered(entry):
+                            children.append(_FileNode(name, entry, entry))
+                    else:
+                        children.append(self._make_directory_node(name, entry))
+            node.children = children
+        return node.children
+
+    def get_node(self, pos):
+        """Return _FileNode at `pos`, creating children of collapsed directories if necessary"""
+        nodes = self._roots
+        for i in pos[:-1]:
+            nodes = self._get_children(nodes[i])
+        return nodes[pos[-1]]
+
+    def child_positions(self, pos):
+        """Yield positions of all children of `pos`, even if it is collapsed"""
+        for i in range(len(self._get_children(self.get_node(pos)))):
+            yield pos + (i,)
+
+    def is_collapsed(self, pos):
+        """Whether the children of directory at `pos` are hidden"""
+        return self.get_node(pos).collapsed
+
+    def set_collapsed(self, pos, collapsed):
+        """Hide or show the children of the directory at `pos`"""
+        node = self.get_node(pos)
+        if node.nodetype == 'parent':
+            node.collapsed = collapsed
+
+    def set_collapsed_all(self, collapsed):
+        """
+        Hide or show the children of all directories
+
+        Expanding all directories creates all nodes.
+        """
+        def expand(node):
+            node.collapsed = False
+            for child in self._get_children(node):
+                if child.nodetype == 'parent':
+                    expand(child)
+
+        if collapsed:
+            for node in self.nodes:
+                if node.nodetype == 'parent':
+                    node.collapsed = True
+        else:
+            for node in self._roots:
+                if node.nodetype == 'parent':
+                    expand(node)
 
-        def create_tree(node, content):
-            if content.nodetype == 'leaf':
-                # Process single file
-                if not self._file_is_filtered(content):
-                    return (content, None)
-                else:
-                    return None
-
-            elif content.nodetype == 'parent':
-                # Recurse into directory entries (files and subdirectories)
-                tree = []
-                filtered_count = 0
-                content_sorted = humansorted(content.items())
-                for k,v in content_sorted:
-                    if v.nodetype == 'leaf':
-                        if not self._file_is_filtered(v):
-                            tree.append((v, None))
-                            nonlocal fcount
-                            fcount += 1
-                        else:
-                            filtered_count += 1
-                    elif v.nodetype == 'parent':
-                        dirnode = TorrentFileDirectory(name=k, tree=v)
-                        tree.append(create_tree(dirnode, v))
-
-                self._filtered_counts[node['id']] = filtered_count
-                node['name'] = TorrentFileDirectory.create_directory_name(node['name'], filtered_count)
-                return (node, tree or None)
-
-        fcount = 0
-        forest = []  # Multiple trees as siblings
-        for t in humansorted(torrents, key=lambda t: t['name']):
-            filetree = t['files']
-            filecount = len(tuple(filetree.files))
-            if filecount > 0:
-                nodetree = None
-                rootnodename = next(iter(filetree.keys()))
-                if len(tuple(filetree.directories)) == 0:
-                    # Single-file torrent
-                    if not self._file_is_filtered(filetree[rootnodename]):
-                        nodetree = (filetree[rootnodename], None)
-                else:
-                    # Torrent with directory structure
-                    # If we don't ignore the topmost node, the torrent itself is
-                    # displayed as a directory.
-                    content = filetree[rootnodename]
-                    rootnode = TorrentFileDirectory(rootnodename, tree=content)
-                    nodetree = create_tree(rootnode, content)
+    def update(self, torrents):
+        """Apply new values from `torrents` to nodes that were created"""
+        for t in torrents:
+            node = self._roots_by_tid.get(t['id'])
+            if node is not None:
+                filetree = t['files']
+                if node.name in filetree:
+                    self._update_node(node, filetree[node.name])
+
+    def _update_node(self, node, content):
+        node.content = content
+        if content.nodetype == 'leaf':
+            node.data = content
+            if node.widget is not None:
+                node.widget.update(content)
+        else:
+            if node.widget is not None:
+                node.data = self._make_directory_data(node.name, content)
+                node.widget.update(node.data)
+            else:
+                # Don't summarize directories that are not displayed
+                node.data = None
+
+            if node.children is not None:
+                for child in node.children:
+                    if child.name in content:
+                        self._update_node(child, content[child.name])
+
+    @property
+    def nodes(self):
+        """Yield all created nodes"""
+        def recurse(node):
+            yield node
+            if node.children is not None:
+                for child in node.children:
+                    yield from recurse(child)
+
+        for node in self._roots:
+            yield from recurse(node)
+
+    # urwidtrees.Tree API
+
+    def __getitem__(self, pos):
+        return self._get_data(self.get_node(pos))
+
+    def parent_position(self, pos):
+        return pos[:-1] if len(pos) > 1 else None
+
+    def first_child_position(self, pos):
+        node = self.get_node(pos)
+        if not node.collapsed and self._get_children(node):
+            return pos + (0,)
+
+    def last_child_position(self, pos):
+        node = self.get_node(pos)
+        if not node.collapsed:
+            children = self._get_children(node)
+            if children:
+                return pos + (len(children) - 1,)
+
+    def next_sibling_position(self, pos):
+        if len(pos) > 1:
+            siblings = self._get_children(self.get_node(pos[:-1]))
+        else:
+            siblings = self._roots
+        if pos[-1] + 1 < len(siblings):
+            return pos[:-1] + (pos[-1] + 1,)
+
+    def prev_sibling_position(self, pos):
+        if pos[-1] > 0:
+            return pos[:-1] + (pos[-1] - 1,)
 
-                if nodetree is not None:
-                    forest.append(nodetree)
+    def depth(self, pos):
+        return len(pos) - 1
 
-        self.filecount = fcount
-        return forest
 
-    @lru_cache(maxsize=1024)
+class FileTreeDecorator(ArrowTree):
+    """urwidtrees decorator for FileTree"""
+
+    # Arrow tip of collapsed directories
+    collapsed_tip_char = '+'
+
+    def __init__(self, torrents, keymap, table, ffilter):
+        self._filewidgetcls = keymap.wrap(FileItemWidget, context='file')
+        self._table = table
+        self._filetree = FileTree(torrents, ffilter)
+        self.filecount = self._filetree.filecount
+        super().__init__(self._filetree, indent=2)
+
+    def _construct_arrow_tip(self, pos):
+        # Indicate collapsed directories with a different arrow tip that is
+        # changed when the directory is expanded or collapsed
+        node = self._filetree.get_node(pos)
+        if node.nodetype == 'leaf':
+            return super()._construct_arrow_tip(pos)
+        node.tip = urwid.Text(self._get_tip_char(node))
+        return len(node.tip.text), urwid.AttrMap(node.tip, self._arrow_tip_att or self._arrow_att)
+
+    def _get_tip_char(self, node):
+        return self.collapsed_tip_char if node.collapsed else self._arrow_tip_char
+
     def decorate(self, pos, data, is_first=True):
+        # Widgets are created only once per node
+        node = self._filetree.get_node(pos)
+        if node.widget is not None:
+            return node.widget
+
         # We can use the tree position as table ID
         self._table.register(pos)
         row = self._table.get_row(pos)
@@ -127,33 +297,65 @@ class FileTreeDecorator(ArrowTree):
 
         # Wrap the whole row in a FileItemWidget with keymapping.  This also
         # applies all the other values besides the name (size, progress, etc).
-        file_widget = self._filewidgetcls(data, row)
-        self._widgets[data['id']] = file_widget
+        file_widget = node.widget = self._filewidgetcls(data, row)
         return file_widget
 
     def update(self, torrents):
-        widgets = self._widgets
-        for t in torrents:
-            # Update file nodes
-            for f in t['files'].files:
-                node_id = f['id']
-                # File might be filtered
-                if node_id in widgets:
-                    widgets[node_id].update(f)
-
-            # Update directory nodes
-            for name,content in t['files'].directories:
-                node_id = content.id
-                if node_id in widgets:
-                    filtered_count = self._filtered_counts[node_id]
-                    data = TorrentFileDirectory(name, tree=content,
-                                                filtered_count=filtered_count)
-                    widgets[node_id].update(data)
+        self._filetree.update(torrents)
+
+    def is_collapsed(self, pos):
+        return self._filetree.is_collapsed(pos)
+
+    def set_collapsed(self, pos, collapsed):
+        self._filetree.set_collapsed(pos, collapsed)
+        self._update_tips()
+
+    def set_collapsed_all(self, collapsed):
+        self._filetree.set_collapsed_all(collapsed)
+        self._update_tips()
+
+    def _update_tips(self):
+        for node in self._filetree.nodes:
+            if node.tip is not None:
+                node.tip.set_text(self._get_tip_char(node))
+
+    def child_positions(self, pos):
+        return self._filetree.child_positions(pos)
 
     @property
     def widgets(self):
         """Yield all file and directory widgets in this tree"""
-        yield from self._widgets.values()
+        for node in self._filetree.nodes:
+            if node.widget is not None:
+                yield node.widget
+
+
+class FileTreeListWalker(urwidtrees.widgets.TreeListWalker):
+    """TreeListWalker that tells ScrollBar that all items have the same height"""
+
+    # The scrollbar can compute the number of rows without creating a widget
+    # for each position
+    uniform = True
+    indexed = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._len = None
+
+    def __len__(self):
+        # The scrollbar asks for this on every render, but the number of
+        # visible positions only changes if the tree changes
+        if self._len is None:
+            self._len = sum(1 for _ in self.positions())
+        return self._len
+
+    def clear_cache(self):
+        self._len = None
+        super().clear_cache()
+
+    def tree_updated(self):
+        """Forget the number of positions after the tree was updated"""
+        self._len = None
 
 
 class FileItemWidget(ItemWidgetBase):
@@ -192,19 +394,18 @@ class FileListWidget(ListWidgetBase):
         self._initialized = False
         self._torrents = None
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, tfilter, keys=('files', 'name')
-        )
-        self._poller.on_response(self._handle_files)
+        self._srvapi.treqpool.register(id(self), self._handle_files,
+                                       keys=('files', 'name'), tfilter=tfilter)
+        self._srvapi.treqpool.poll()
 
-    def _handle_files(self, response):
-        if response is None or not response.torrents:
+    def _handle_files(self, torrents):
+        if not torrents:
             self.clear()
         else:
             if self._initialized:
-                self._update_listitems(response.torrents)
+                self._update_listitems(torrents)
             else:
-                self._init_listitems(response.torrents)
+                self._init_listitems(torrents)
                 self._initialized = True
         self._invalidate()
 
@@ -225,11 +426,12 @@ class FileListWidget(ListWidgetBase):
             ffilter = ffilter & sffilter
 
         self._filetree = FileTreeDecorator(self._torrents, self._keymap, self._table, ffilter)
-        self._listbox.body = urwidtrees.widgets.TreeListWalker(self._filetree)
+        self._listbox.body = FileTreeListWalker(self._filetree)
 
     def _update_listitems(self, torrents=()):
         if torrents:
             self._filetree.update(torrents)
+            self._listbox.body.tree_updated()
             self._torrents = torrents
 
     @property
@@ -270,7 +472,7 @@ class FileListWidget(ListWidgetBase):
         self._marked.clear()
 
     def refresh(self):
-        self._poller.poll()
+        self._srvapi.treqpool.poll()
 
     @property
     def count(self):
@@ -311,15 +513,37 @@ class FileListWidget(ListWidgetBase):
         if focused_widget is not None:
             return focused_widget.torrent_id
 
+    @property
+    def marked_ids(self):
+        """Generator that yields IDs of marked files"""
+        for widget in self._marked_widgets():
+            yield widget.id
+
+    @property
+    def marked_torrent_ids(self):
+        """Generator that yields torrent IDs of marked files"""
+        for widget in self._marked_widgets():
+            yield widget.torrent_id
+
+    def _marked_widgets(self):
+        secondary_filter = self.secondary_filter
+        for widget in self._marked:
+            if secondary_filter is None or secondary_filter.match(widget.data):
+                yield widget
+
 
     def all_children(self, pos):
-        """Yield (position, widget) tuples of all sub-nodes (leaves and parents)"""
+        """
+        Yield (position, widget) tuples of all sub-nodes (leaves and parents)
+
+        Children of collapsed directories are included.
+        """
         ft = self._filetree
         lb = self._listbox
 
         def recurse(subpos):
             widget = lb.body[subpos]
-            if ft.is_leaf(subpos):
+            if widget.nodetype == 'leaf':
                 yield (subpos, widget)
             else:
                 # Yield sub-parent nodes, but not the starting node that was
@@ -327,10 +551,8 @@ class FileListWidget(ListWidgetBase):
                 if subpos != pos:
                     yield (subpos, widget)
 
-                new_subpos = ft.first_child_position(subpos)
-                while new_subpos is not None:
-                    yield from recurse(new_subpos)
-                    new_subpos = ft.next_sibling_position(new_subpos)
+                for childpos in ft.child_positions(subpos):
+                    yield from recurse(childpos)
 
         yield from recurse(pos)
 
@@ -387,6 +609,37 @@ class FileListWidget(ListWidgetBase):
             parwidget.is_marked = all_children_marked(parpos)
             parpos = self._filetree.parent_position(parpos)
 
+    def expand(self, toggle=False, all=False):
+        """Show contents of focused directory or all directories"""
+        self._set_collapsed(False, toggle=toggle, all=all)
+
+    def collapse(self, toggle=False, all=False):
+        """Hide contents of focused directory or all directories"""
+        self._set_collapsed(True, toggle=toggle, all=all)
+
+    def _set_collapsed(self, collapsed, toggle=False, all=False):
+        focused = self.focused_widget
+        if focused is None:
+            return
+        ft = self._filetree
+        focus_pos = self._listbox.focus_position
+        if toggle and focused.nodetype == 'parent':
+            collapsed = not ft.is_collapsed(focus_pos)
+
+        if all:
+            ft.set_collapsed_all(collapsed)
+            if collapsed:
+                # Move focus to the top directory so it doesn't get lost in a
+                # collapsed directory
+                self._listbox.focus_position = focus_pos[:1]
+        elif focused.nodetype == 'parent':
+            ft.set_collapsed(focus_pos, collapsed)
+        else:
+            return
+
+        self._listbox.body.clear_cache()
+        self._listbox._invalidate()
+
     def refresh_marks(self):
         for widget in self._filetree.widgets:
             widget.is_marked = widget.is_marked
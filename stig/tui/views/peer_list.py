@@ -49,18 +49,17 @@ class PeerListWidget(ListWidgetBase):
                 yield from peers
         self._maybe_filter_peers = filter_peers
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, tfilter, keys=('peers', 'name', 'id')
-        )
-        self._poller.on_response(self._handle_peers)
+        self._srvapi.treqpool.register(id(self), self._handle_peers,
+                                       keys=('peers', 'name', 'id'), tfilter=tfilter)
+        self._srvapi.treqpool.poll()
 
-    def _handle_peers(self, response):
-        if response is None or not response.torrents:
+    def _handle_peers(self, torrents):
+        if not torrents:
             self.clear()
         else:
             # Auto-generate title from our filters if not set
             if self._title_name is None:
-                self._title_name = stringify_torrent_filter(self._tfilter, response.torrents)
+                self._title_name = stringify_torrent_filter(self._tfilter, torrents)
                 if self._pfilter:
                     self._title_name += ' %s' % self._pfilter
 
@@ -68,16 +67,16 @@ class PeerListWidget(ListWidgetBase):
             def peers_combined(torrents):
                 for t in torrents:
                     yield from self._maybe_filter_peers(t['peers'])
-            self._data_dict = {p['id']:p for p in peers_combined(response.torrents)}
+            self._data_dict = {p['id']:p for p in peers_combined(torrents)}
         self._invalidate()
 
     def clear(self):
-        for w in self._listbox.body:
-            w.data.clearcache()
+        for p in self._walker.data.values():
+            p.clearcache()
         super().clear()
 
     def refresh(self):
-        self._poller.poll()
+        self._srvapi.treqpool.poll()
 
     @property
     def sort(self):
@@ -86,7 +85,14 @@ class PeerListWidget(ListWidgetBase):
     @sort.setter
     def sort(self, sort):
         ListWidgetBase.sort.fset(self, sort)
-        self._poller.poll()
+        self._srvapi.treqpool.poll()
+
+    @property
+    def marked_torrent_ids(self):
+        """Generator that yields torrent IDs of marked peers"""
+        data = self._walker.data
+        for id in self.marked_ids:
+            yield data[id]['tid']
 
     @property
     def secondary_filter(self):
@@ -98,9 +104,10 @@ class PeerListWidget(ListWidgetBase):
             self._secondary_filter = None
         else:
             self._secondary_filter = PeerFilter(peer_filter)
+        self._reorder_needed = True
         self._invalidate()
 
-    def _limit_items(self, peer_widgets):
+    def _limit_items(self, peers):
         # Combine primary and secondary peer filters
         pfilter = self._pfilter
         spfilter = self._secondary_filter
@@ -110,6 +117,6 @@ class PeerListWidget(ListWidgetBase):
             pfilter = pfilter & spfilter
 
         if pfilter is not None:
-            for pw in peer_widgets:
-                if not pfilter.match(pw.data):
-                    yield pw
+            for pid,p in peers.items():
+                if not pfilter.match(p):
+                    yield pid
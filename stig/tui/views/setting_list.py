@@ -167,6 +167,9 @@ class SettingListWidget(ListWidgetBase):
     palette_name    = 'settinglist'
     focusable_items = True
 
+    # Descriptions can span multiple lines
+    uniform_items   = False
+
     def __init__(self, srvapi, keymap, sort=None, columns=None, title='Settings'):
         super().__init__(srvapi, keymap, columns=columns, sort=sort, title=title)
         self._sort = sort
@@ -201,11 +204,12 @@ class SettingListWidget(ListWidgetBase):
             self._secondary_filter = None
         else:
             self._secondary_filter = SettingFilter(setting_filter)
+        self._reorder_needed = True
         self._invalidate()
 
-    def _limit_items(self, setting_widgets):
+    def _limit_items(self, settings):
         sfilter = self._secondary_filter
         if sfilter is not None:
-            for sw in setting_widgets:
-                if not sfilter.match(sw.data):
-                    yield sw
+            for name,setting in settings.items():
+                if not sfilter.match(setting):
+                    yield name
@@ -354,6 +354,7 @@ TUICOLUMNS['eta'] = Eta
 
 class Created(_COLUMNS['created'], CellWidgetBase):
     style = Style(prefix='torrentlist.created', focusable=True, extras=('header',))
+    volatile = True
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['created'].header),
                            style.attrs('header'))
 
@@ -361,6 +362,7 @@ TUICOLUMNS['created'] = Created
 
 class Added(_COLUMNS['added'], CellWidgetBase):
     style = Style(prefix='torrentlist.added', focusable=True, extras=('header',))
+    volatile = True
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['added'].header),
                            style.attrs('header'))
 
@@ -368,6 +370,7 @@ TUICOLUMNS['added'] = Added
 
 class Started(_COLUMNS['started'], CellWidgetBase):
     style = Style(prefix='torrentlist.started', focusable=True, extras=('header',))
+    volatile = True
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['started'].header),
                            style.attrs('header'))
 
@@ -375,6 +378,7 @@ TUICOLUMNS['started'] = Started
 
 class Active(_COLUMNS['activity'], CellWidgetBase):
     style = Style(prefix='torrentlist.activity', focusable=True, extras=('header',))
+    volatile = True
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['activity'].header),
                            style.attrs('header'))
 
@@ -383,6 +387,7 @@ TUICOLUMNS['activity'] = Active
 class Completed(_COLUMNS['completed'], CellWidgetBase):
     style = Style(prefix='torrentlist.completed', focusable=True,
                   extras=('header',), modes=('highlighted',))
+    volatile = True
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['completed'].header),
                            style.attrs('header'))
 
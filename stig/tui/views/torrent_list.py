@@ -70,7 +70,8 @@ class TorrentListWidget(ListWidgetBase):
             log.debug('Registering keys for %r: %s', self, keys)
             self._srvapi.treqpool.register(self.id,
                                            self._handle_torrents,
-                                           keys=keys, tfilter=self._tfilter)
+                                           keys=keys, tfilter=self._tfilter,
+                                           changed_keys=True)
             self._srvapi.treqpool.poll()
         else:
             log.debug('No need to register a new request')
@@ -84,16 +85,17 @@ class TorrentListWidget(ListWidgetBase):
     #     log.debug('Rendered torrent list in %.3fms', (time.time()-start)*1000)
     #     return canvas
 
-    def _handle_torrents(self, torrents):
+    def _handle_torrents(self, torrents, changed_keys):
         # Auto-generate title from our filters if not set
         if self._title_name is None:
             self._title_name = stringify_torrent_filter(self._tfilter, torrents)
         self._data_dict = {t['id']:t for t in torrents}
+        self._set_changed_keys(changed_keys)
         self._invalidate()
 
     def clear(self):
-        for w in self._listbox.body:
-            w.data.clearcache()
+        for t in self._walker.data.values():
+            t.clearcache()
         super().clear()
 
     def refresh(self):
@@ -105,7 +107,7 @@ class TorrentListWidget(ListWidgetBase):
 
     @sort.setter
     def sort(self, sort):
-        self._srvapi.treqpool.remove(self.id)
+        # Registering again keeps the request paused (see Tabs.pause_hidden)
         ListWidgetBase.sort.fset(self, sort)
         self._register_request()
 
@@ -116,6 +118,11 @@ class TorrentListWidget(ListWidgetBase):
         if focused_widget is not None:
             return focused_widget.torrent_id
 
+    @property
+    def marked_torrent_ids(self):
+        """Generator that yields torrent IDs of marked torrents"""
+        return self.marked_ids
+
     @property
     def secondary_filter(self):
         return self._secondary_filter
@@ -127,11 +134,17 @@ class TorrentListWidget(ListWidgetBase):
         else:
             self._secondary_filter = TorrentFilter(torrent_filter)
         log.debug('Filtering %r torrents', self._secondary_filter)
+        self._reorder_needed = True
         self._register_request()
 
-    def _limit_items(self, torrent_widgets):
+    def _limit_items(self, torrents):
         f = self._secondary_filter
         if f is not None:
-            for tw in torrent_widgets:
-                if not f.match(tw.data):
-                    yield tw
+            matching = self._srvapi.torrent.filter_torrents(f, torrents.values())
+            return torrents.keys() - {t['id'] for t in matching}
+        return ()
+
+    @property
+    def _limit_keys(self):
+        f = self._secondary_filter
+        return f.needed_keys if f is not None else ()
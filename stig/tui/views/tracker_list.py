@@ -56,18 +56,17 @@ class TrackerListWidget(ListWidgetBase):
                 yield from trackers
         self._maybe_filter_trackers = filter_trackers
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, torfilter, keys=('trackers', 'name', 'id')
-        )
-        self._poller.on_response(self._handle_trackers)
+        self._srvapi.treqpool.register(id(self), self._handle_trackers,
+                                       keys=('trackers', 'name', 'id'), tfilter=torfilter)
+        self._srvapi.treqpool.poll()
 
-    def _handle_trackers(self, response):
-        if response is None or not response.torrents:
+    def _handle_trackers(self, torrents):
+        if not torrents:
             self.clear()
         else:
             # Auto-generate title from our filters if not set
             if self._title_name is None:
-                self._title_name = stringify_torrent_filter(self._torfilter, response.torrents)
+                self._title_name = stringify_torrent_filter(self._torfilter, torrents)
                 if self._trkfilter:
                     self._title_name += ' %s' % self._trkfilter
 
@@ -75,11 +74,11 @@ class TrackerListWidget(ListWidgetBase):
             def trackers_combined(torrents):
                 for t in torrents:
                     yield from self._maybe_filter_trackers(t['trackers'])
-            self._data_dict = {trk['id']:trk for trk in trackers_combined(response.torrents)}
+            self._data_dict = {trk['id']:trk for trk in trackers_combined(torrents)}
         self._invalidate()
 
     def refresh(self):
-        self._poller.poll()
+        self._srvapi.treqpool.poll()
 
     @property
     def sort(self):
@@ -88,7 +87,7 @@ class TrackerListWidget(ListWidgetBase):
     @sort.setter
     def sort(self, sort):
         ListWidgetBase.sort.fset(self, sort)
-        self._poller.poll()
+        self._srvapi.treqpool.poll()
 
     @property
     def focused_torrent_id(self):
@@ -98,6 +97,13 @@ class TrackerListWidget(ListWidgetBase):
             return focused_widget.torrent_id
 
 
+    @property
+    def marked_torrent_ids(self):
+        """Generator that yields torrent IDs of marked trackers"""
+        data = self._walker.data
+        for id in self.marked_ids:
+            yield data[id]['tid']
+
     @property
     def secondary_filter(self):
         return self._secondary_filter
@@ -108,9 +114,10 @@ class TrackerListWidget(ListWidgetBase):
             self._secondary_filter = None
         else:
             self._secondary_filter = TrackerFilter(tracker_filter)
+        self._reorder_needed = True
         self._invalidate()
 
-    def _limit_items(self, tracker_widgets):
+    def _limit_items(self, trackers):
         # Combine primary and secondary tracker filters
         trkfilter = self._trkfilter
         strkfilter = self._secondary_filter
@@ -120,9 +127,9 @@ class TrackerListWidget(ListWidgetBase):
             trkfilter = trkfilter & strkfilter
 
         if trkfilter is not None:
-            for tw in tracker_widgets:
-                if not trkfilter.match(tw.data):
-                    log.debug('%r does not match %r', trkfilter, tw.data['domain'])
-                    yield tw
+            for trkid,trk in trackers.items():
+                if not trkfilter.match(trk):
+                    log.debug('%r does not match %r', trkfilter, trk['domain'])
+                    yield trkid
                 else:
-                    log.debug('%r does match %r', trkfilter, tw.data['domain'])
+                    log.debug('%r does match %r', trkfilter, trk['domain'])
@@ -480,6 +480,24 @@ class Option(str, UsertypeMixin):
         return options
 
 
+# Numbers are created in large quantities (e.g. for every value of every
+# torrent), so numbers created with the same arguments share the same
+# (read-only) dictionaries of arguments
+_shared_args = {}
+
+def _share_args(args):
+    # Include types because 1 == 1.0 == True
+    key = tuple((k, type(v), v) for k,v in args.items())
+    try:
+        return _shared_args[key]
+    except KeyError:
+        _shared_args[key] = args
+        return args
+    except TypeError:
+        # Unhashable argument
+        return args
+
+
 class _NumberBase(UsertypeMixin):
     _prefixes_binary = (('Ti', 1024**4), ('Gi', 1024**3), ('Mi', 1024**2), ('Ki', 1024))
     _prefixes_metric = (('T', 1000**4), ('G', 1000**3), ('M', 1000**2), ('k', 1000))
@@ -576,11 +594,6 @@ class _NumberBase(UsertypeMixin):
         except TypeError:
             raise ValueError('Not a %s' % cls.typename)
 
-        if hide_unit:
-            self._str = lambda: self.without_unit
-        else:
-            self._str = lambda: self.with_unit
-
         if prefix == 'binary':
             self._prefixes = self._prefixes_binary
         elif prefix == 'metric':
@@ -591,17 +604,23 @@ class _NumberBase(UsertypeMixin):
             raise ValueError("prefix must be 'binary' or 'metric'")
 
         # Remember arguments so we can copy them if this instance is passed to the same class
-        self._args = {'unit': unit, 'prefix': prefix, 'hide_unit': hide_unit,
-                      'min': min, 'max': max, 'autolimit': autolimit}
+        self._args = _share_args({'unit': unit, 'prefix': prefix, 'hide_unit': hide_unit,
+                                  'min': min, 'max': max, 'autolimit': autolimit})
         return self
 
+    def __init__(self, *value, **kwargs):
+        self._config = _share_args({**self.defaults, **kwargs})
+
     @classmethod
     def _get_syntax(cls, **_):
         prefixes = (p[0] for p in chain(cls._prefixes_binary, cls._prefixes_metric))
         return '<NUMBER>[%s]' % '|'.join(prefixes)
 
     def __str__(self):
-        return self._str()
+        if self._args['hide_unit']:
+            return self.without_unit
+        else:
+            return self.with_unit
 
     @property
     def with_unit(self):
@@ -36,10 +36,7 @@ def _limit_rate_mr(direction, t):
 
 
 def _file_counts(t):
-    files = tuple(t['files'].files)
-    all_files = len(files)
-    wanted_files = sum(1 for f in files if f['is-wanted'])
-    return (all_files, wanted_files)
+    return (t['count-files'], t['count-files-wanted'])
 
 def _files_hr(t):
     return '%d (%d wanted)' % _file_counts(t)
@@ -148,9 +145,17 @@ def _timespan_mr(key, t):
 
 
 class Item():
-    def __init__(self, label, needed_keys, human_readable=None, machine_readable=None):
+    """
+    Labeled value in a details section
+
+    If `slow` is True, the value is expensive to get and changes rarely, so it
+    doesn't have to be updated as often as the other values.
+    """
+
+    def __init__(self, label, needed_keys, human_readable=None, machine_readable=None, slow=False):
         self.label = label
         self.needed_keys = needed_keys
+        self.slow = slow
         if human_readable is None:
             self.human_readable = lambda torrent, key=needed_keys[0]: str(torrent[key])
         else:
@@ -178,9 +183,10 @@ SECTIONS = (
              human_readable=_size_hr,
              machine_readable=_size_mr),
         Item('Files',
-             needed_keys=('files',),
+             needed_keys=('count-files', 'count-files-wanted'),
              human_readable=_files_hr,
-             machine_readable=_files_mr),
+             machine_readable=_files_mr,
+             slow=True),
         Item('Pieces',
              needed_keys=('count-pieces', 'size-piece'),
              human_readable=_pieces_hr,
@@ -30,6 +30,9 @@ class FakeRequestPoller():
     async def fake_response(self):
         self.cb_response(await self.request())
 
+    def poll(self):
+        self.polled = True
+
     async def start(self):
         pass
 
@@ -38,19 +41,28 @@ class FakeRequestPoller():
 
 api_status.RequestPoller = FakeRequestPoller
 
-class FakeTorrentAPI():
+class FakeTorrentRequestPool():
     fake_tlist = ()
+    polled = False
+
+    def register(self, sid, callback, keys=(), tfilter=None):
+        self.cb_torrents = callback
+        self.keys = keys
+        self.tfilter = tfilter
+
+    async def fake_response(self):
+        self.cb_torrents(self.fake_tlist)
 
-    async def torrents(self, *args, **kwargs):
-        return self.fake_tlist
+    def poll(self):
+        self.polled = True
 
 
 class TestStatusAPI(asynctest.TestCase):
     async def setUp(self):
         self.rpc = FakeTransmissionRPC()
-        self.torrent = FakeTorrentAPI()
+        self.treqpool = FakeTorrentRequestPool()
         srvapi = SimpleNamespace(rpc=self.rpc,
-                                 torrent=self.torrent)
+                                 treqpool=self.treqpool)
         self.api = StatusAPI(srvapi, interval=1)
 
         self.rpc.fake_stats = {
@@ -61,18 +73,28 @@ class TestStatusAPI(asynctest.TestCase):
             'torrentCount': 3,
         }
 
-        self.torrent.fake_tlist = SimpleNamespace(
-            torrents=({'status': Status((Status.ISOLATED,)), 'rate-up': 0, 'rate-down': 0},
-                      {'status': Status((Status.DOWNLOAD,)), 'rate-up': 0, 'rate-down': 456},
-                      {'status': Status((Status.DOWNLOAD, Status.UPLOAD)), 'rate-up': 123, 'rate-down': 456}),
+        self.treqpool.fake_tlist = (
+            {'status': Status((Status.ISOLATED,)), 'rate-up': 0, 'rate-down': 0},
+            {'status': Status((Status.DOWNLOAD,)), 'rate-up': 0, 'rate-down': 456},
+            {'status': Status((Status.DOWNLOAD, Status.UPLOAD)), 'rate-up': 123, 'rate-down': 456},
         )
 
+    async def test_registered_with_torrent_request_pool(self):
+        self.assertEqual(set(self.treqpool.keys), {'rate-down', 'rate-up', 'status'})
+        self.assertEqual(self.treqpool.tfilter, None)
+
+    async def test_poll_does_not_poll_torrent_request_pool(self):
+        # The API polls the torrent request pool itself
+        self.api.poll()
+        self.assertEqual(self.api._poller_stats.polled, True)
+        self.assertEqual(self.treqpool.polled, False)
+
     async def test_attributes(self):
         convert.bandwidth.unit = 'byte'
         convert.bandwidth.prefix = 'metric'
 
         await self.api._poller_stats.fake_response()
-        await self.api._poller_tcount.fake_response()
+        await self.treqpool.fake_response()
 
         self.assertEqual(self.api.rate_down, 789)
         self.assertEqual(self.api.rate_up, 0)
@@ -84,9 +106,10 @@ class TestStatusAPI(asynctest.TestCase):
         self.assertEqual(self.api.count.isolated, 1)
 
         self.rpc.fake_stats = None
-        self.torrent.fake_tlist = None
+        self.rpc.connected = False
+        self.treqpool.fake_tlist = ()
         await self.api._poller_stats.fake_response()
-        await self.api._poller_tcount.fake_response()
+        await self.treqpool.fake_response()
 
         self.assertEqual(self.api.rate_down, const.DISCONNECTED)
         self.assertEqual(self.api.rate_up, const.DISCONNECTED)
@@ -106,7 +129,7 @@ class TestStatusAPI(asynctest.TestCase):
         self.assertEqual(cb.calls, 0)
 
         await self.api._poller_stats.fake_response()
-        await self.api._poller_tcount.fake_response()
+        await self.treqpool.fake_response()
         self.assertEqual(cb.calls, 1)
         status = cb.args[0][0]
         self.assertEqual(status.rate_down, 789)
@@ -119,9 +142,10 @@ class TestStatusAPI(asynctest.TestCase):
         self.assertEqual(status.count.isolated, 1)
 
         self.rpc.fake_stats = None
-        self.torrent.fake_tlist = None
+        self.rpc.connected = False
+        self.treqpool.fake_tlist = ()
         await self.api._poller_stats.fake_response()
-        await self.api._poller_tcount.fake_response()
+        await self.treqpool.fake_response()
 
         self.assertEqual(cb.calls, 2)
         status = cb.args[0][0]
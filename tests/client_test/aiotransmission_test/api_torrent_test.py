@@ -1,10 +1,13 @@
+import asyncio
 import os.path
+import unittest
 
 import asynctest
 import resources_aiotransmission as rsrc
 
-from stig.client import MAX_TORRENT_FILE_SIZE
-from stig.client.aiotransmission.api_torrent import TorrentAPI
+from stig.client import MAX_TORRENT_FILE_SIZE, ClientError
+from stig.client.aiotransmission.api_torrent import (TorrentAPI, _ActionBatcher,
+                                                     _TorrentCache)
 from stig.client.aiotransmission.rpc import TransmissionRPC
 from stig.client.aiotransmission.torrent import Torrent
 from stig.client.filters.torrent import TorrentFilter
@@ -27,6 +30,62 @@ class TorrentAPITestCase(asynctest.TestCase):
         await self.daemon.stop()
 
 
+class TestTorrentCacheIndexes(unittest.TestCase):
+    def setUp(self):
+        self.tcache = _TorrentCache()
+        self.tcache.update(({'id': 1, 'name': 'Foo Bar', 'labels': ['tv'], 'downloadDir': '/data/tv'},
+                            {'id': 2, 'name': 'Bar Baz', 'labels': ['tv', 'hd'], 'downloadDir': '/data/tv'},
+                            {'id': 3, 'name': 'baz', 'labels': [], 'downloadDir': '/data/misc'}))
+        # Indexes are not used if they don't exclude most torrents
+        self.tcache.update({'id': tid, 'name': 'Padding %d' % tid, 'labels': [], 'downloadDir': '/other'}
+                           for tid in range(100, 110))
+
+    def assert_filter(self, filter_str, exp_ids, exp_candidate_ids):
+        tfilter = TorrentFilter(filter_str)
+        self.assertEqual(tfilter.candidate_ids(self.tcache), exp_candidate_ids)
+        self.assertEqual(tuple(t['id'] for t in self.tcache.filter(tfilter)), exp_ids)
+        self.assertEqual(tuple(t['id'] for t in tfilter.apply(self.tcache.get())), exp_ids)
+
+    def test_value_index(self):
+        self.assert_filter('label=tv', (1, 2), {1, 2})
+        self.assert_filter('label~h', (2,), {2})
+        self.assert_filter('label=foo', (), set())
+        self.assert_filter('path=/data/misc', (3,), {3})
+        self.assert_filter('path~data', (1, 2, 3), {1, 2, 3})
+
+    def test_trigram_index(self):
+        self.assert_filter('name~bar', (1, 2), {1, 2})
+        self.assert_filter('name~Bar', (1, 2), {1, 2})
+        self.assert_filter('name~r B', (2,), {2})
+        self.assert_filter('name=baz', (3,), {2, 3})
+        self.assert_filter('ar Ba', (2,), {2})
+        self.assert_filter('name~o Baz', (), set())
+        self.assert_filter('name~ba', (1, 2, 3), None)
+
+    def test_combined_filters(self):
+        self.assert_filter('label=tv&name~baz', (2,), {2})
+        self.assert_filter('label=hd|path~misc', (2, 3), {2, 3})
+        self.assert_filter('label=hd|!name~a', (2,), None)
+        self.assert_filter('label=tv&!name~baz', (1,), {1, 2})
+
+    def test_changed_and_removed_torrents(self):
+        self.assert_filter('label=tv', (1, 2), {1, 2})
+        self.assert_filter('name~baz', (2, 3), {2, 3})
+        self.tcache.update(({'id': 1, 'name': 'Baz Foo', 'labels': ['hd']},))
+        self.assert_filter('label=tv', (2,), {2})
+        self.assert_filter('name~baz', (1, 2, 3), {1, 2, 3})
+        self.tcache.remove((2,))
+        self.assert_filter('label=hd', (1,), {1})
+        self.assert_filter('name~baz', (1, 3), {1, 3})
+        self.tcache.update(({'id': 4, 'name': 'Baz', 'labels': ['hd']},))
+        self.assert_filter('label=hd&name~baz', (1, 4), {1, 4})
+
+    def test_torrent_without_needed_key(self):
+        self.tcache.update(({'id': 4, 'name': 'Foo'},))
+        self.assertEqual(TorrentFilter('label=tv').candidate_ids(self.tcache), None)
+        self.assertEqual(TorrentFilter('name~foo').candidate_ids(self.tcache), {1, 4})
+
+
 class TestConnection(TorrentAPITestCase):
     async def test_send_request_with_lost_connection(self):
         assert self.rpc.connected is True
@@ -161,6 +220,142 @@ class TestGettingTorrents(TorrentAPITestCase):
         self.assertEqual(response.errors, ('No matching torrents: =Nope',))
 
 
+class TestIncrementalPolling(TorrentAPITestCase):
+    async def setUp(self):
+        await super().setUp()
+        from aiohttp import web
+
+        def handler(request):
+            if self.daemon.requests[-1]['arguments'].get('ids') == 'recently-active':
+                return web.json_response(rsrc.response_success(
+                    {'torrents': [{'id': 2, 'name': 'Bar!'}], 'removed': [3]}))
+            else:
+                return web.json_response(rsrc.response_torrents(
+                    {'id': 1, 'name': 'Foo'},
+                    {'id': 2, 'name': 'Bar'},
+                    {'id': 3, 'name': 'Baz'}))
+        self.daemon.response = handler
+
+    async def test_first_request_gets_all_torrents(self):
+        response = await self.api.torrents(keys=('name',))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar', 'Baz'))
+
+    async def test_following_requests_get_recently_active_torrents(self):
+        await self.api.torrents(keys=('name',))
+        response = await self.api.torrents(keys=('name',))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), 'recently-active')
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar!'))
+
+    async def test_new_fields_are_requested_for_all_torrents(self):
+        await self.api.torrents(keys=('name',))
+        await self.api.torrents(keys=('name', 'path'))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+
+    async def test_resync_interval_expired(self):
+        await self.api.torrents(keys=('name',))
+        self.api.resync_interval = 0
+        response = await self.api.torrents(keys=('name',))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar', 'Baz'))
+
+    async def test_clearcache_forces_resync(self):
+        await self.api.torrents(keys=('name',))
+        self.api.clearcache()
+        await self.api.torrents(keys=('name',))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), None)
+
+    async def test_filtered_torrents_with_cheap_keys(self):
+        await self.api.torrents(keys=('name',))
+        response = await self.api.torrents('name~Foo', keys=('name',))
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), 'recently-active')
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo',))
+
+    async def test_filtered_torrents_with_expensive_keys(self):
+        await self.api.torrents(keys=('name',))
+        await self.api.torrents('name~Foo', keys=('name', 'files'))
+        for request in self.daemon.requests:
+            if 'files' in request.get('arguments', {}).get('fields', ()):
+                self.assertEqual(request['arguments'].get('ids'), [1])
+        self.assertEqual(self.daemon.requests[-1]['arguments'].get('ids'), [1])
+
+
+class TestStaticFields(TorrentAPITestCase):
+    async def setUp(self):
+        await super().setUp()
+        from aiohttp import web
+        self.activity = {1: 100, 2: 200}
+
+        def handler(request):
+            args = self.daemon.requests[-1]['arguments']
+            tlist = [{'id': tid, 'name': name, 'rateUpload': tid, 'activityDate': self.activity[tid],
+                      'downloadDir': '/path', 'files': [{'name': name + '/file', 'length': 100,
+                                                         'bytesCompleted': self.activity[tid]}],
+                      'fileStats': [{'bytesCompleted': self.activity[tid], 'wanted': True, 'priority': 0}]}
+                     for tid,name in ((1, 'Foo'), (2, 'Bar'))]
+            if isinstance(args.get('ids'), list):
+                tlist = [t for t in tlist if t['id'] in args['ids']]
+            tlist = [{k:v for k,v in t.items() if k in args['fields']} for t in tlist]
+            return web.json_response(rsrc.response_success({'torrents': tlist}))
+        self.daemon.response = handler
+
+    async def test_static_fields_are_requested_once(self):
+        await self.api.torrents((1, 2), keys=('name', 'rate-up'))
+        self.assertIn('name', self.daemon.requests[-1]['arguments']['fields'])
+        response = await self.api.torrents((1, 2), keys=('name', 'rate-up'))
+        self.assertNotIn('name', self.daemon.requests[-1]['arguments']['fields'])
+        self.assertEqual(tuple(t['name'] for t in response.torrents), ('Foo', 'Bar'))
+
+    async def test_static_fields_are_requested_after_activity(self):
+        await self.api.torrents((1, 2), keys=('name', 'rate-up'))
+        self.activity[2] += 1
+        await self.api.torrents((1, 2), keys=('name', 'rate-up'))
+        self.assertEqual(self.daemon.requests[-1]['arguments']['ids'], [2])
+        self.assertIn('name', self.daemon.requests[-1]['arguments']['fields'])
+        self.assertNotIn('rateUpload', self.daemon.requests[-1]['arguments']['fields'])
+
+    async def test_files_are_not_requested_after_activity(self):
+        response = await self.api.torrents((1, 2), keys=('files',))
+        tree = response.torrents[0]['files']
+        self.activity[1] += 1
+        requests_before = len(self.daemon.requests)
+        response = await self.api.torrents((1, 2), keys=('files',))
+        for request in self.daemon.requests[requests_before:]:
+            self.assertNotIn('files', request['arguments']['fields'])
+        self.assertIs(response.torrents[0]['files'], tree)
+        self.assertEqual(tree['Foo']['file']['size-downloaded'], 101)
+
+    async def test_files_are_requested_when_metadata_arrives(self):
+        await self.api.torrents((1, 2), keys=('files',))
+        self.api._tcache.get(2)[0]._raw['files'] = []
+        await self.api.torrents((1, 2), keys=('files',))
+        files_requests = [r['arguments'] for r in self.daemon.requests
+                          if 'files' in r.get('arguments', {}).get('fields', ())]
+        self.assertEqual(files_requests[-1]['ids'], [2])
+
+
+class TestWorkerThread(TorrentAPITestCase):
+    async def setUp(self):
+        await super().setUp()
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo', 'downloadDir': '/path', 'activityDate': 100,
+             'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+             'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Foo/file1'}]},
+        )
+
+    async def test_expensive_values_are_created_before_they_are_needed(self):
+        self.assertEqual(self.api.worker_thread, True)
+        response = await self.api.torrents((1,), keys=('files',))
+        self.assertIn('files', response.torrents[0]._cache)
+        self.assertEqual(tuple(response.torrents[0]['files']['Foo']), ('file1',))
+
+    async def test_expensive_values_are_created_when_they_are_needed(self):
+        self.api.worker_thread = False
+        response = await self.api.torrents((1,), keys=('files',))
+        self.assertNotIn('files', response.torrents[0]._cache)
+        self.assertEqual(tuple(response.torrents[0]['files']['Foo']), ('file1',))
+
+
 class TestManipulatingTorrents(TorrentAPITestCase):
     async def setUp(self):
         await super().setUp()
@@ -256,6 +451,123 @@ class TestManipulatingTorrents(TorrentAPITestCase):
         self.assertEqual(response.errors, ('miss: #2, Bar',))
 
 
+class TestActionBatcher(asynctest.TestCase):
+    def setUp(self):
+        self.batcher = _ActionBatcher(delay=0)
+        self.calls = []
+
+    def make_method(self, name, exception=None):
+        async def method(ids, **kwargs):
+            self.calls.append((name, ids, kwargs))
+            await asyncio.sleep(0)
+            self.calls.append('done')
+            if exception is not None:
+                raise exception
+        method.__name__ = name
+        return method
+
+    async def test_same_arguments_are_merged(self):
+        torrent_set = self.make_method('torrent_set')
+        await asyncio.gather(self.batcher.call(torrent_set, (1, 2), labels=['foo']),
+                             self.batcher.call(torrent_set, (2, 3), labels=['foo']),
+                             self.batcher.call(torrent_set, (4,), labels=['bar']))
+        self.assertEqual(self.calls, [('torrent_set', (1, 2, 3), {'labels': ['foo']}),
+                                      ('torrent_set', (4,), {'labels': ['bar']}),
+                                      'done', 'done'])
+
+    async def test_different_methods_are_not_merged(self):
+        await asyncio.gather(self.batcher.call(self.make_method('torrent_start'), (1,)),
+                             self.batcher.call(self.make_method('torrent_stop'), (2,)))
+        self.assertEqual(self.calls, [('torrent_start', (1,), {}),
+                                      ('torrent_stop', (2,), {}),
+                                      'done', 'done'])
+
+    async def test_requests_for_same_torrents_are_sent_in_order(self):
+        torrent_set = self.make_method('torrent_set')
+        await asyncio.gather(self.batcher.call(torrent_set, (1, 2), labels=['foo']),
+                             self.batcher.call(torrent_set, (2,), labels=['bar']))
+        self.assertEqual(self.calls, [('torrent_set', (1, 2), {'labels': ['foo']}), 'done',
+                                      ('torrent_set', (2,), {'labels': ['bar']}), 'done'])
+
+    async def test_calls_are_not_merged_across_calls_for_same_torrents(self):
+        start = self.make_method('torrent_start')
+        stop = self.make_method('torrent_stop')
+        await asyncio.gather(self.batcher.call(start, (1,)),
+                             self.batcher.call(stop, (1,)),
+                             self.batcher.call(start, (1, 2)),
+                             self.batcher.call(stop, (3,)),
+                             self.batcher.call(start, (4,)))
+        self.assertEqual(self.calls, [('torrent_start', (1,), {}),
+                                      'done',
+                                      ('torrent_stop', (1, 3), {}),
+                                      'done',
+                                      ('torrent_start', (1, 2, 4), {}),
+                                      'done'])
+
+    async def test_cancelled_caller_does_not_affect_other_callers(self):
+        torrent_set = self.make_method('torrent_set')
+        cancelled = asyncio.ensure_future(self.batcher.call(torrent_set, (1,), labels=['foo']))
+        other = asyncio.ensure_future(self.batcher.call(torrent_set, (2,), labels=['foo']))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await other
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.calls, [('torrent_set', (1, 2), {'labels': ['foo']}), 'done'])
+
+    async def test_unbatchable_method_is_called_immediately(self):
+        rename = self.make_method('torrent_rename_path')
+        await asyncio.gather(self.batcher.call(rename, (1,), path='foo', name='bar'),
+                             self.batcher.call(rename, (2,), path='foo', name='bar'))
+        self.assertEqual(self.calls, [('torrent_rename_path', (1,), {'path': 'foo', 'name': 'bar'}),
+                                      ('torrent_rename_path', (2,), {'path': 'foo', 'name': 'bar'}),
+                                      'done', 'done'])
+
+    async def test_exception_is_raised_for_all_callers(self):
+        torrent_set = self.make_method('torrent_set', exception=ClientError('Nope'))
+        results = await asyncio.gather(self.batcher.call(torrent_set, (1,), labels=['foo']),
+                                       self.batcher.call(torrent_set, (2,), labels=['foo']),
+                                       return_exceptions=True)
+        self.assertEqual([str(r) for r in results], ['Nope', 'Nope'])
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_cancelled_requests_raise_for_all_callers(self):
+        async def torrent_start(ids):
+            self.calls.append(('torrent_start', ids))
+            await asyncio.Event().wait()
+        stop = self.make_method('torrent_stop')
+        calls = asyncio.gather(self.batcher.call(torrent_start, (1,)),
+                               self.batcher.call(torrent_start, (2,)),
+                               self.batcher.call(stop, (1,)),
+                               return_exceptions=True)
+        while not self.calls:
+            await asyncio.sleep(0)
+        self.assertEqual(len(self.batcher._send_tasks), 1)
+        for task in self.batcher._send_tasks:
+            task.cancel()
+        results = await calls
+        self.assertEqual([type(r) for r in results], [ClientError] * 3)
+        self.assertEqual(self.calls, [('torrent_start', (1, 2))])
+        self.assertEqual(self.batcher._send_tasks, set())
+
+
+class TestMergingActions(TorrentAPITestCase):
+    async def test_labels_for_many_torrents_are_set_with_one_request(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo', 'labels': []},
+            {'id': 2, 'name': 'Bar', 'labels': ['tv']},
+            {'id': 3, 'name': 'Baz', 'labels': []},
+        )
+        response = await self.api.labels_add(TorrentFilter('all'), ('tv',))
+        self.assertEqual(response.success, True)
+        torrent_sets = [req for req in self.daemon.requests if req['method'] == 'torrent-set']
+        self.assertEqual(torrent_sets, [{'method': 'torrent-set',
+                                         'arguments': {'ids': [1, 3], 'labels': ['tv']}}])
+        # Torrents are not looked up again before the change
+        self.assertEqual([req['method'] for req in self.daemon.requests
+                          if req['method'].startswith('torrent-')],
+                         ['torrent-get', 'torrent-get', 'torrent-set', 'torrent-get'])
+
+
 class TestTorrentBandwidthLimit(TorrentAPITestCase):
     def assert_request(self, expected_request):
         # Because order doesn't matter, replace lists with sets to make requests comparable
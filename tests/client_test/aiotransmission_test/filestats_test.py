@@ -0,0 +1,73 @@
+import unittest
+
+from stig.client.aiotransmission import filestats
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+
+def fstat(completed, wanted=True, priority=0):
+    return {'bytesCompleted': completed, 'wanted': wanted, 'priority': priority}
+
+
+class _TestFileStatsBase():
+    def setUp(self):
+        # Tree order is the reverse of Transmission's order
+        self.stats = self.FileStats(order=(3, 2, 1, 0), lengths=(100, 200, 300, 400))
+        self.stats.update([fstat(0), fstat(0), fstat(0), fstat(0)])
+
+    def test_wrong_number_of_lengths(self):
+        with self.assertRaises(ValueError):
+            self.FileStats(order=(0, 1), lengths=(100,))
+
+    def test_wrong_number_of_fileStats(self):
+        with self.assertRaises(ValueError):
+            self.stats.update([fstat(0)])
+
+    def test_size_total(self):
+        self.assertEqual(self.stats.size_total(0, 4), 1000)
+        self.assertEqual(self.stats.size_total(1, 3), 500)
+        self.assertEqual(self.stats.size_total(3, 4), 400)
+
+    def test_update_returns_changed_positions(self):
+        self.assertEqual(list(self.stats.update([fstat(0), fstat(0), fstat(0), fstat(0)])), [])
+        self.assertEqual(list(self.stats.update([fstat(50), fstat(0), fstat(0, wanted=False), fstat(0)])),
+                         [1, 3])
+        self.assertEqual(list(self.stats.update([fstat(50), fstat(0, priority=1), fstat(0, wanted=False),
+                                                 fstat(0)])),
+                         [2])
+
+    def test_values(self):
+        self.stats.update([fstat(10), fstat(20, priority=1), fstat(30, wanted=False), fstat(40)])
+        self.assertEqual(self.stats.values(0), (40, True, 0))
+        self.assertEqual(self.stats.values(1), (30, False, 0))
+        self.assertEqual(self.stats.values(2), (20, True, 1))
+        self.assertEqual(self.stats.values(3), (10, True, 0))
+
+    def test_size_downloaded(self):
+        self.stats.update([fstat(10), fstat(20), fstat(30), fstat(40)])
+        self.assertEqual(self.stats.size_downloaded(0, 4), 100)
+        self.assertEqual(self.stats.size_downloaded(1, 3), 50)
+        self.stats.update([fstat(10), fstat(25), fstat(30), fstat(40)])
+        self.assertEqual(self.stats.size_downloaded(1, 3), 55)
+        self.assertEqual(self.stats.size_downloaded(3, 4), 10)
+
+    def test_priority(self):
+        self.assertEqual(self.stats.priority(0, 4), 0)
+        self.stats.update([fstat(0), fstat(0, priority=1), fstat(0, priority=1), fstat(0)])
+        self.assertEqual(self.stats.priority(0, 4), None)
+        self.assertEqual(self.stats.priority(1, 3), 1)
+        self.stats.update([fstat(0), fstat(0, priority=1), fstat(0, priority=1, wanted=False), fstat(0)])
+        self.assertEqual(self.stats.priority(1, 3), None)
+        self.assertEqual(self.stats.priority(1, 2), filestats.PRIORITY_OFF)
+
+
+class TestListFileStats(_TestFileStatsBase, unittest.TestCase):
+    FileStats = filestats.ListFileStats
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestNumpyFileStats(_TestFileStatsBase, unittest.TestCase):
+    FileStats = filestats.NumpyFileStats
@@ -0,0 +1,35 @@
+import unittest
+
+from stig.client.aiotransmission import jsoncodec
+
+
+class TestJSONCodec(unittest.TestCase):
+    def test_roundtrip(self):
+        obj = {'method': 'torrent-get',
+               'arguments': {'ids': [1, 2, 3], 'fields': ['name', 'percentDone'],
+                             'name': 'Fööbär', 'ratio': 1.5, 'private': False, 'labels': None}}
+        data = jsoncodec.dumps(obj)
+        self.assertIsInstance(data, (str, bytes))
+        self.assertEqual(jsoncodec.loads(data), obj)
+
+    def test_loads_from_bytes(self):
+        self.assertEqual(jsoncodec.loads('{"name": "Fööbär"}'.encode('utf-8')), {'name': 'Fööbär'})
+
+    def test_malformed_json(self):
+        for data in ('{"foo": }', '[1, 2', ''):
+            with self.assertRaises(jsoncodec.DecodeError):
+                jsoncodec.loads(data)
+
+    def test_subclasses_of_builtin_types(self):
+        class MyTuple(tuple):
+            pass
+
+        class MyFloat(float):
+            pass
+
+        class MyStr(str):
+            pass
+
+        data = jsoncodec.dumps({'fields': MyTuple(('id', 'name')), 'limit': MyFloat(1.5),
+                                'path': MyStr('/foo')})
+        self.assertEqual(jsoncodec.loads(data), {'fields': ['id', 'name'], 'limit': 1.5, 'path': '/foo'})
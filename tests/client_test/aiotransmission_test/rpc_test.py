@@ -1,11 +1,15 @@
 import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
 
 import asynctest
 import resources_aiotransmission as rsrc
 from aiohttp import web
 
 from stig.client import AuthError, ConnectionError, RPCError, TimeoutError
-from stig.client.aiotransmission.rpc import TransmissionRPC
+from stig.client.aiotransmission.rpc import TransmissionRPC, _StreamingDecoder
 
 
 class TestTransmissionRPC(asynctest.ClockedTestCase):
@@ -354,6 +358,70 @@ class TestTransmissionRPC(asynctest.ClockedTestCase):
                                     args=[(self.client,)],
                                     kwargs=[{'error': cm.exception}])
 
+    async def test_concurrent_requests_are_limited(self):
+        await self.client.connect()
+        self.client.max_requests = 2
+
+        active = []
+        max_active = []
+        release = asyncio.Event()
+
+        async def blocking_response(request):
+            active.append(request)
+            max_active.append(len(active))
+            await release.wait()
+            active.remove(request)
+            return web.json_response(rsrc.SESSION_GET_RESPONSE)
+        self.daemon.response = blocking_response
+
+        requests = asyncio.gather(*(self.client.session_get() for _ in range(5)))
+        for _ in range(200):
+            await asyncio.sleep(0)
+            if len(max_active) >= 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(active), 2)
+
+        release.set()
+        await requests
+        self.assertEqual(len(max_active), 5)
+        self.assertEqual(max(max_active), 2)
+
+    async def test_concurrent_requests_connect_only_once(self):
+        self.client.max_requests = 3
+        await asyncio.gather(*(self.client.session_get() for _ in range(3)))
+        self.assert_connected_to(self.daemon.host, self.daemon.port)
+        self.assert_cb_connected_called(calls=1, args=[(self.client,)])
+        self.assert_cb_disconnected_called(calls=0)
+
+    def test_max_requests_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            self.client.max_requests = 0
+
+    @patch('stig.client.aiotransmission.jsoncodec.NAME', 'json')
+    @patch('stig.client.aiotransmission.rpc.STREAM_THRESHOLD', 0)
+    @patch('stig.client.aiotransmission.rpc.STREAM_CHUNK_SIZE', 16)
+    async def test_streaming_response(self):
+        await self.client.connect()
+        torrents = [{'id': i, 'name': 'Torrent %d' % i} for i in range(100)]
+        self.daemon.response = {'result': 'success', 'arguments': {'torrents': torrents}}
+        self.assertEqual(await self.client.torrent_get(), torrents)
+
+        self.daemon.response = '{"result": "success", "arguments": {"torrents": [{"id": 1}, {"id": '
+        with self.assertRaises(RPCError) as cm:
+            await self.client.torrent_get()
+        self.assertTrue(str(cm.exception).startswith('Invalid RPC response: Server sent malformed JSON'))
+
+    @patch('stig.client.aiotransmission.jsoncodec.NAME', 'orjson')
+    @patch('stig.client.aiotransmission.rpc.STREAM_THRESHOLD', 0)
+    async def test_no_streaming_response_with_fast_codec(self):
+        await self.client.connect()
+        torrents = [{'id': i, 'name': 'Torrent %d' % i} for i in range(100)]
+        self.daemon.response = {'result': 'success', 'arguments': {'torrents': torrents}}
+        with patch.object(self.client, '_read_streaming') as read_streaming:
+            self.assertEqual(await self.client.torrent_get(), torrents)
+        read_streaming.assert_not_called()
+
     async def test_timeout_minus_one(self):
         delay = self.client.timeout - 1
         await asyncio.gather(self.advance(delay),
@@ -383,3 +451,37 @@ class TestTransmissionRPC(asynctest.ClockedTestCase):
         self.assert_cb_error_called(calls=1,
                                     args=[(self.client,)],
                                     kwargs=[{'error': cm.exception}])
+
+
+class TestStreamingDecoder(unittest.TestCase):
+    def decode(self, data, chunk_size):
+        decoder = _StreamingDecoder()
+        for i in range(0, len(data), chunk_size):
+            decoder.feed(data[i:i + chunk_size])
+        return decoder.close()
+
+    def test_torrents_are_decoded_in_chunks(self):
+        answer = {'result': 'success',
+                  'arguments': {'torrents': [{'id': i, 'name': 'Törrent "torrents":[ %d' % i,
+                                              'files': [{'name': 'file%d' % j} for j in range(i)]}
+                                             for i in range(50)],
+                                'removed': [3, 4]}}
+        data = json.dumps(answer, ensure_ascii=False).encode('utf-8')
+        for chunk_size in (1, 7, 100, len(data)):
+            self.assertEqual(self.decode(data, chunk_size), answer)
+
+    def test_response_without_torrents(self):
+        answer = {'result': 'success', 'arguments': {'version': '3.00'}}
+        self.assertEqual(self.decode(json.dumps(answer).encode('utf-8'), 5), answer)
+
+    def test_empty_list_of_torrents(self):
+        answer = {'result': 'success', 'arguments': {'torrents': []}}
+        self.assertEqual(self.decode(json.dumps(answer).encode('utf-8'), 5), answer)
+
+    def test_malformed_json(self):
+        for data in (b'{"arguments": {"torrents": [{"id": 1}, {"id": ',
+                     b'{"arguments": {"torrents": [{"id": 1}]}',
+                     b'{"arguments": {"torrents": [{"id": 1 2}]}}',
+                     b'{"arguments": {"torrents": [{"id": "\xff"}]}}'):
+            with self.assertRaises(ValueError):
+                self.decode(data, 5)
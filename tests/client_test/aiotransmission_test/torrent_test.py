@@ -8,6 +8,27 @@ def test_all_dependencies_are_standard_keys():
     assert set(torrent.DEPENDENCIES) == set(TorrentBase.TYPES)
 
 
+def test_static_and_volatile_fields_are_disjoint_dependencies():
+    all_fields = set(field for fields in torrent.DEPENDENCIES.values() for field in fields)
+    assert torrent.STATIC_FIELDS.isdisjoint(torrent.VOLATILE_FIELDS)
+    assert torrent.STATIC_FIELDS | torrent.VOLATILE_FIELDS == all_fields
+
+
+def test_expensive_fields_are_not_needed_by_cheap_keys():
+    assert torrent.EXPENSIVE_FIELDS == {'files', 'fileStats', 'peers'}
+    for key,fields in torrent.DEPENDENCIES.items():
+        if key not in torrent.EXPENSIVE_KEYS:
+            assert torrent.EXPENSIVE_FIELDS.isdisjoint(fields)
+
+
+def test_update_without_static_fields_keeps_static_values():
+    t = torrent.Torrent({'id': 1, 'name': 'foo', 'rateUpload': 100})
+    assert t['rate-up'] == 100
+    t.update({'id': 1, 'rateUpload': 200})
+    assert t['name'] == 'foo'
+    assert t['rate-up'] == 200
+
+
 class Test_is_isolated(unittest.TestCase):
     def test_no_trackers_and_public(self):
         tc = torrent._is_isolated({'isPrivate': False, 'trackerStats': []})
@@ -73,6 +94,109 @@ class TestTorrent(unittest.TestCase):
         self.assertEqual(set(t), {'id', 'name', 'rate-down', 'hash',
                                   'time-created', '%verified'})
 
+    def test_common_strings_are_interned(self):
+        def raw():
+            return {'id': 1, 'downloadDir': ''.join(('/', 'some', '/path')),
+                    'trackerStats': [{'announce': ''.join(('http://', 'foo', '/announce'))}]}
+        t1 = torrent.Torrent(raw())
+        t2 = torrent.Torrent({'id': 2})
+        t2.update(raw())
+        self.assertIs(t1._raw['downloadDir'], t2._raw['downloadDir'])
+        self.assertIs(t1._raw['trackerStats'][0]['announce'],
+                      t2._raw['trackerStats'][0]['announce'])
+
+    def test_update_returns_changed_keys(self):
+        t = torrent.Torrent({'id': 1, 'name': 'foo', 'rateUpload': 100, 'uploadedEver': 0})
+        self.assertEqual((t.version, t.changed_keys), (0, None))
+        self.assertEqual(t['rate-up'], 100)
+        changed = t.update({'id': 1, 'rateUpload': 200, 'uploadedEver': 0})
+        self.assertEqual(changed, {'rate-up', 'status'})
+        self.assertEqual((t.version, t.changed_keys), (1, changed))
+        self.assertEqual(t['rate-up'], 200)
+
+        self.assertEqual(t.update({'id': 1, 'rateUpload': 200}), set())
+        self.assertEqual((t.version, t.changed_keys), (1, changed))
+
+        # Added fields are changes
+        self.assertEqual(t.update({'id': 1, 'percentDone': 0.5}),
+                         {'%downloaded', 'status', 'time-completed'})
+        self.assertEqual(t.version, 2)
+
+    def test_file_counts(self):
+        t = torrent.Torrent({'id': 1, 'name': 'foo', 'wanted': [1, 0, 1]})
+        self.assertEqual((t['count-files'], t['count-files-wanted']), (3, 2))
+        t.update({'id': 1, 'wanted': [0, 0, 0]})
+        self.assertEqual((t['count-files'], t['count-files-wanted']), (3, 0))
+
+    def test_file_counts_without_metadata(self):
+        raw = {'id': 1, 'name': 'foo', 'downloadDir': '/a/path', 'wanted': [],
+               'files': [], 'fileStats': []}
+        t = torrent.Torrent(raw)
+        files = tuple(t['files'].files)
+        self.assertEqual((t['count-files'], t['count-files-wanted']),
+                         (len(files), sum(1 for f in files if f['is-wanted'])))
+        self.assertEqual((t['count-files'], t['count-files-wanted']), (1, 1))
+
+    def test_creating_values_from_snapshot(self):
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path', 'rateUpload': 0,
+               'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+               'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Fake torrent/file1'}]}
+        t = torrent.Torrent(raw)
+        keys, snapshot = t.uncached(('files', 'peers', 'rate-up'))
+        self.assertEqual(keys, ('files', 'rate-up'))
+        values = torrent.Torrent.create_values(keys, snapshot)
+        t.cache_values(values, snapshot)
+        self.assertIs(t['files'], values['files'])
+        self.assertEqual(t.uncached(('files', 'rate-up')), ((), None))
+
+    def test_file_progress_in_files_does_not_create_file_tree_again(self):
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
+               'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+               'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Fake torrent/file1'}]}
+        t = torrent.Torrent(raw)
+        tree = t['files']
+        t.update({'id': 1, 'files': [{'bytesCompleted': 500, 'length': 1000, 'name': 'Fake torrent/file1'}]})
+        self.assertIs(t['files'], tree)
+        t.update({'id': 1, 'files': [{'bytesCompleted': 500, 'length': 1000, 'name': 'Fake torrent/file2'}]})
+        self.assertIsNot(t['files'], tree)
+        self.assertEqual(tuple(t['files']['Fake torrent']), ('file2',))
+
+    def test_file_tree_is_updated_in_place_by_polls(self):
+        # TorrentAPI gets volatile fields first and static fields of recently
+        # active torrents in a second request
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path', 'activityDate': 100,
+               'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True},
+                             {'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+               'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Fake torrent/file1'},
+                         {'bytesCompleted': 0, 'length': 2000, 'name': 'Fake torrent/file2'}]}
+        t = torrent.Torrent(raw)
+        tree = t['files']
+        file1 = tree['Fake torrent']['file1']
+        for progress in (100, 200, 300):
+            t.update({'id': 1, 'downloadDir': '/a/path', 'activityDate': 100 + progress,
+                      'fileStats': [{'bytesCompleted': progress, 'priority': 0, 'wanted': True},
+                                    {'bytesCompleted': 0, 'priority': 1, 'wanted': True}]})
+            t.update({'id': 1, 'name': 'Fake torrent',
+                      'files': [{'bytesCompleted': progress, 'length': 1000, 'name': 'Fake torrent/file1'},
+                                {'bytesCompleted': 0, 'length': 2000, 'name': 'Fake torrent/file2'}]})
+            self.assertIs(t['files'], tree)
+            self.assertIs(tree['Fake torrent']['file1'], file1)
+            self.assertEqual(file1['size-downloaded'], progress)
+            self.assertEqual(tree['Fake torrent'].size_downloaded, progress)
+            self.assertEqual(tree['Fake torrent']['file2']['priority'], 'high')
+
+    def test_creating_values_from_outdated_snapshot(self):
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
+               'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+               'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Fake torrent/file1'}]}
+        t = torrent.Torrent(raw)
+        keys, snapshot = t.uncached(('files',))
+        values = torrent.Torrent.create_values(keys, snapshot)
+        t.update({'id': 1, 'fileStats': [{'bytesCompleted': 500, 'priority': 0, 'wanted': True}]})
+        t.cache_values(values, snapshot)
+        self.assertIsNot(t['files'], values['files'])
+        self.assertEqual(t['files']['Fake torrent']['file1']['size-downloaded'], 500)
+
 class TestTorrentFileTree(unittest.TestCase):
     def test_update(self):
         raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
@@ -100,3 +224,52 @@ class TestTorrentFileTree(unittest.TestCase):
         self.assertEqual(ft['Fake torrent']['file1']['size-downloaded'], 500)
         self.assertEqual(ft['Fake torrent']['subdir']['file2']['%downloaded'], 10)
         self.assertEqual(ft['Fake torrent']['subdir']['file2']['size-downloaded'], 200)
+
+    def test_directories_with_unsorted_files(self):
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
+               'fileStats': [{'bytesCompleted': 10, 'priority': 0, 'wanted': True},
+                             {'bytesCompleted': 20, 'priority': 1, 'wanted': True},
+                             {'bytesCompleted': 30, 'priority': 0, 'wanted': True},
+                             {'bytesCompleted': 40, 'priority': 1, 'wanted': True}],
+               'files': [{'bytesCompleted': 10, 'length': 100, 'name': 'Fake torrent/a/file1'},
+                         {'bytesCompleted': 20, 'length': 200, 'name': 'Fake torrent/b/file2'},
+                         {'bytesCompleted': 30, 'length': 300, 'name': 'Fake torrent/a/file3'},
+                         {'bytesCompleted': 40, 'length': 400, 'name': 'Fake torrent/b/file4'}]}
+        ft = torrent.TorrentFileTree.create(raw)
+        self.assertEqual(ft['Fake torrent']['a'].id, (torrent.TorrentFileID(1, 0), torrent.TorrentFileID(1, 2)))
+        self.assertEqual(ft['Fake torrent']['a'].size_total, 400)
+        self.assertEqual(ft['Fake torrent']['a'].size_downloaded, 40)
+        self.assertEqual(ft['Fake torrent']['a'].priority, 'normal')
+        self.assertEqual(ft['Fake torrent']['b'].size_total, 600)
+        self.assertEqual(ft['Fake torrent']['b'].size_downloaded, 60)
+        self.assertEqual(ft['Fake torrent']['b'].priority, 'high')
+        self.assertEqual(ft['Fake torrent'].size_total, 1000)
+        self.assertEqual(ft['Fake torrent'].priority, '')
+        self.assertEqual([f['name'] for f in ft['Fake torrent'].files], ['file1', 'file3', 'file2', 'file4'])
+        self.assertEqual(ft['Fake torrent']['b']['file4']['path-relative'], 'Fake torrent/b/file4')
+
+        raw['fileStats'][3] = {'bytesCompleted': 45, 'priority': 1, 'wanted': False}
+        ft.update(raw)
+        self.assertEqual(ft['Fake torrent']['b']['file4']['size-downloaded'], 45)
+        self.assertEqual(ft['Fake torrent']['b']['file4']['priority'], 'off')
+        self.assertEqual(ft['Fake torrent']['b'].size_downloaded, 65)
+        self.assertEqual(ft['Fake torrent']['b'].priority, '')
+
+    def test_torrent_updates_cached_file_tree(self):
+        raw = {'id': 1, 'name': 'Fake torrent', 'downloadDir': '/a/path',
+               'fileStats': [{'bytesCompleted': 0, 'priority': 0, 'wanted': True}],
+               'files': [{'bytesCompleted': 0, 'length': 1000, 'name': 'Fake torrent/file1'}]}
+        t = torrent.Torrent(raw)
+        ft = t['files']
+        t.update({'id': 1, 'fileStats': [{'bytesCompleted': 500, 'priority': 0, 'wanted': True}]})
+        self.assertIs(t['files'], ft)
+        self.assertEqual(ft['Fake torrent']['file1']['size-downloaded'], 500)
+
+        t.update({'id': 1, 'downloadDir': '/other/path'})
+        self.assertIs(t['files'], ft)
+        self.assertEqual(ft['Fake torrent'].location, '/other/path')
+        self.assertEqual(ft['Fake torrent']['file1']['path-absolute'], '/other/path/Fake torrent/file1')
+
+        t.update({'id': 1, 'files': [{'bytesCompleted': 500, 'length': 1000, 'name': 'Fake torrent/file2'}]})
+        self.assertIsNot(t['files'], ft)
+        self.assertEqual(tuple(t['files']['Fake torrent']), ('file2',))
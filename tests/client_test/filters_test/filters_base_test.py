@@ -574,3 +574,46 @@ class TestFilterChain_apply(unittest.TestCase):
             self.assertEqual(self.f('!mod3').match(item), item['v'] % 3 != 0)
             self.assertEqual(self.f('n_abs>0').match(item), abs(item['v']) > 0)
             self.assertEqual(self.f('n_abs!>0').match(item), abs(item['v']) <= 0)
+
+
+class TestFilterChain_compile(unittest.TestCase):
+    def setUp(self):
+        class FooFilter(Filter):
+            BOOLEAN_FILTERS = {'positive': BoolFilterSpec(lambda i: i['v'] >= 0, needed_keys=('v',))}
+            COMPARATIVE_FILTERS = {'v': CmpFilterSpec(value_type=int, needed_keys=('v',)),
+                                   's': CmpFilterSpec(value_type=str, needed_keys=('s',)),
+                                   'v_abs': CmpFilterSpec(value_type=int, value_getter=lambda i: abs(i['v']))}
+            DEFAULT_FILTER = 's'
+
+        class FooFilterChain(FilterChain):
+            filterclass = FooFilter
+
+        self.f = FooFilterChain
+        self.items = tuple({'v': i, 's': 'item%d' % i} for i in range(-5, 6))
+
+    def do(self, filter_str, exp_values):
+        self.assertEqual(tuple(item['v'] for item in self.f(filter_str).apply(self.items)),
+                         exp_values)
+
+    def test_inlined_comparisons(self):
+        self.do('v=3', (3,))
+        self.do('v!=3', (-5, -4, -3, -2, -1, 0, 1, 2, 4, 5))
+        self.do('v>3', (4, 5))
+        self.do('v<=-4', (-5, -4))
+        self.do('v', (-5, -4, -3, -2, -1, 1, 2, 3, 4, 5))
+        self.do('!v', (0,))
+        self.do('s~m-', (-5, -4, -3, -2, -1))
+        self.do('s!~m-', (0, 1, 2, 3, 4, 5))
+        self.do('m5', (5,))
+        self.do('s=~^item[34]$', (3, 4))
+
+    def test_inlined_and_called_filters(self):
+        self.do('positive&v<2|v_abs=5', (-5, 0, 1, 5))
+        self.do('!positive&!v_abs>3|s=item5', (-3, -2, -1, 5))
+
+    def test_compiled_code_is_reused(self):
+        f1 = self.f('v>1|s~4')
+        f2 = self.f('v>3|s~2')
+        self.assertIs(f1._match.__code__, f2._match.__code__)
+        self.assertEqual(tuple(item['v'] for item in f1.apply(self.items)), (-4, 2, 3, 4, 5))
+        self.assertEqual(tuple(item['v'] for item in f2.apply(self.items)), (-2, 2, 4, 5))
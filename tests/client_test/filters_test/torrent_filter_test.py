@@ -273,3 +273,9 @@ class TestTorrentFilter(unittest.TestCase, HelpersMixin):
         self.check_timestamp_filter(TorrentFilter, default_sign=-1,
                                     filter_names=('completed', 'tcmp'),
                                     key='time-completed')
+
+    def test_time_dependent(self):
+        for filter_str in ('added<1d', 'eta>1h', 'completed>2001-01-01'):
+            self.assertTrue(TorrentFilter(filter_str).time_dependent)
+        for filter_str in ('name~foo', 'size>1G', 'eta', 'downloading'):
+            self.assertFalse(TorrentFilter(filter_str).time_dependent)
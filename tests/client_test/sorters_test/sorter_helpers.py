@@ -11,3 +11,4 @@ class TestSorterBase(unittest.TestCase):
         for sort_str in sorter_names:
             sorter = self.sorter_cls((sort_str,))
             self.assertEqual(tuple(item['id'] for item in sorter.apply(items)), exp_ids)
+            self.assertEqual(tuple(item['id'] for item in sorted(items, key=sorter.get_key)), exp_ids)
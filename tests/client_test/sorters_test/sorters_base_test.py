@@ -17,7 +17,9 @@ class TestSorterBase(unittest.TestCase):
 
     def assert_sorted(self, items, sortstrings, exp_id_order):
         items = sorted(items, key=lambda _: random.random())
-        items_sorted = self.sortercls(sortstrings).apply(items)
+        sorter = self.sortercls(sortstrings)
+        items_sorted = sorter.apply(items)
+        self.assertEqual(sorted(items, key=sorter.get_key), items_sorted)
         if exp_id_order == 'unsorted':
             self.assertEqual(tuple(i['id'] for i in items_sorted),
                              tuple(i['id'] for i in items))
@@ -174,3 +176,70 @@ class TestSorterBase(unittest.TestCase):
 
         srted = self.sortercls(('!bar',)).apply(items, item_getter=item_getter)
         self.assertEqual(tuple(obj.id for obj in srted), (1, 2, 3))
+
+
+class VersionedItem(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        self.changed_keys = None
+
+    def change(self, **values):
+        self.update(values)
+        self.version += 1
+        self.changed_keys = frozenset(values)
+
+
+class TestSorterBaseKeyCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def get_foo(item):
+            self.calls.append(item['id'])
+            return item['foo']
+
+        class TestSorter(SorterBase):
+            SORTSPECS = {'foo' : SortSpec(get_foo, description='Some description')}
+            needed_keys = ('foo',)
+        self.sorter = TestSorter(('foo',))
+
+    def test_key_is_cached(self):
+        items = [VersionedItem(id=1, foo='b'), VersionedItem(id=2, foo='a')]
+        self.assertEqual([i['id'] for i in self.sorter.apply(items)], [2, 1])
+        self.assertEqual(self.calls, [1, 2])
+        self.assertEqual([i['id'] for i in self.sorter.apply(items)], [2, 1])
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_key_is_kept_if_unneeded_keys_changed(self):
+        items = [VersionedItem(id=1, foo='b', bar=1), VersionedItem(id=2, foo='a', bar=2)]
+        self.sorter.apply(items)
+        items[0].change(bar=3)
+        self.assertEqual([i['id'] for i in self.sorter.apply(items)], [2, 1])
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_key_is_updated_if_needed_keys_changed(self):
+        items = [VersionedItem(id=1, foo='b'), VersionedItem(id=2, foo='a')]
+        self.sorter.apply(items)
+        items[0].change(foo='0')
+        self.assertEqual([i['id'] for i in self.sorter.apply(items)], [1, 2])
+        self.assertEqual(self.calls, [1, 2, 1])
+
+    def test_key_is_updated_if_version_skipped(self):
+        items = [VersionedItem(id=1, foo='b', bar=1), VersionedItem(id=2, foo='a', bar=2)]
+        self.sorter.apply(items)
+        items[0].change(foo='0')
+        items[0].change(bar=3)
+        self.assertEqual([i['id'] for i in self.sorter.apply(items)], [1, 2])
+        self.assertEqual(self.calls, [1, 2, 1])
+
+    def test_keys_of_removed_items_are_forgotten(self):
+        items = [VersionedItem(id=1, foo='b'), VersionedItem(id=2, foo='a')]
+        self.sorter.apply(items)
+        self.sorter.apply(items[:1])
+        self.assertEqual(len(self.sorter._key_cache), 1)
+
+    def test_unversioned_items_are_not_cached(self):
+        items = [{'id': 1, 'foo': 'b'}, {'id': 2, 'foo': 'a'}]
+        self.sorter.apply(items)
+        self.sorter.apply(items)
+        self.assertEqual(self.calls, [1, 2, 1, 2])
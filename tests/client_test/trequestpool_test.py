@@ -1,11 +1,13 @@
 import asyncio
+import unittest
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import asynctest
 
 from stig.client.aiotransmission.torrent import Torrent
 from stig.client.filters.torrent import TorrentFilter
-from stig.client.trequestpool import TorrentRequestPool
+from stig.client.trequestpool import TorrentRequestPool, _FilterCache
 from stig.client.utils import Response
 
 FAKE_TORRENTS = (
@@ -20,6 +22,7 @@ class FakeTorrentAPI():
         self.calls = 0
         self.arg_torrents = None
         self.arg_keys = None
+        self.requests = []
         self.exc = None
         self.tlist = FAKE_TORRENTS
         self.delay = 0
@@ -30,20 +33,29 @@ class FakeTorrentAPI():
         self.calls += 1
         self.arg_torrents = torrents
         self.arg_keys = keys
+        self.requests.append((torrents, set(keys)))
         if self.exc is None:
+            if isinstance(torrents, tuple):
+                return Response(success=True, torrents=tuple(t for t in self.tlist
+                                                             if t['id'] in torrents))
             return Response(success=False, torrents=self.tlist)
         else:
             raise self.exc
 
+    def filter_torrents(self, tfilter, torrents):
+        return tuple(tfilter.apply(torrents))
+
 
 class FakeCallback():
     def __init__(self):
         self.calls = 0
         self.args = None
+        self.kwargs = None
 
-    def __call__(self, torrents):
+    def __call__(self, torrents, **kwargs):
         self.calls += 1
         self.args = torrents
+        self.kwargs = kwargs
 
 
 class Subscriber():
@@ -113,9 +125,17 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
         for f in (None, TorrentFilter('all')):
             thelot = Subscriber(f, 'name', 'rate-up')
             self.rp.register('all', thelot.callback, keys=thelot.keys, tfilter=thelot.tfilter)
+            self.api.requests.clear()
             await self.advance(self.rp.interval)
-            self.assert_api_request(tfilter=None,
-                                    keys=(foo + bar + baz + thelot).keys_needed)
+            if f is None:
+                # Keys of filtered subscribers are only requested for matching torrents
+                self.assertEqual(self.api.requests, [
+                    (None, {'name', 'rate-up', 'private'}),
+                    ((1, 2, 3), {'id', 'rate-down', 'size-total'}),
+                ])
+            else:
+                self.assert_api_request(tfilter=None,
+                                        keys=(foo + bar + baz + thelot).keys_needed)
             self.rp.remove('all')
             await self.advance(self.rp.interval)
             self.assert_api_request(tfilter=(foo + bar + baz).tfilter,
@@ -177,6 +197,87 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
 
         await self.rp.stop()
 
+    async def test_expensive_keys_are_only_requested_for_their_subscribers(self):
+        await self.rp.start()
+        tlist = Subscriber(None, 'name', 'rate-down')
+        peers1 = Subscriber((2,), 'name', 'peers')
+        peers2 = Subscriber((2,), 'peers')
+        files = Subscriber('name~baz', 'files')
+        for sid,s in (('tlist', tlist), ('peers1', peers1), ('peers2', peers2), ('files', files)):
+            self.rp.register(sid, s.callback, keys=s.keys, tfilter=s.tfilter)
+        await self.advance(0)
+
+        # One request for cheap keys of all torrents and one for expensive keys
+        # of the torrents that need them
+        self.assertEqual(self.api.requests, [
+            (None, {'id', 'name', 'rate-down'}),
+            ((2, 3), {'peers', 'files'}),
+        ])
+        self.assertEqual(tuple(tlist.callback.args), FAKE_TORRENTS)
+        self.assertEqual(tuple(peers1.callback.args), (FAKE_TORRENTS[1],))
+        self.assertIs(peers1.callback.args, peers2.callback.args)
+        self.assertEqual(tuple(files.callback.args), (FAKE_TORRENTS[2],))
+
+        # Without expensive keys, there is only one request
+        self.rp.remove('peers1')
+        self.rp.remove('peers2')
+        self.rp.remove('files')
+        self.api.requests.clear()
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.requests, [(None, {'name', 'rate-down'})])
+
+        await self.rp.stop()
+
+    async def test_keys_of_filtered_subscribers_are_only_requested_for_matching_torrents(self):
+        await self.rp.start()
+        counts = Subscriber(None, 'rate-down', 'rate-up')
+        tlist = Subscriber('name~ba', 'name', 'size-total', 'rate-down')
+        for sid,s in (('counts', counts), ('tlist', tlist)):
+            self.rp.register(sid, s.callback, keys=s.keys, tfilter=s.tfilter)
+        await self.advance(0)
+
+        self.assertEqual(self.api.requests, [
+            (None, {'name', 'rate-down', 'rate-up'}),
+            ((2, 3), {'size-total'}),
+        ])
+        self.assertEqual(tuple(counts.callback.args), FAKE_TORRENTS)
+        self.assertEqual(tuple(tlist.callback.args), FAKE_TORRENTS[1:])
+
+        # Without a subscriber for all torrents, there is only one request
+        self.rp.remove('counts')
+        self.api.requests.clear()
+        await self.advance(self.rp.interval)
+        self.assertEqual(self.api.requests, [
+            (tlist.tfilter, {'name', 'size-total', 'rate-down'}),
+        ])
+
+        await self.rp.stop()
+
+    async def test_changed_keys(self):
+        self.api.tlist = (Torrent({'id': 1, 'name': 'foo', 'rateDownload': 50, 'rateUpload': 100}),
+                          Torrent({'id': 2, 'name': 'bar', 'rateDownload': 0, 'rateUpload': 0}))
+        await self.rp.start()
+        tlist = Subscriber(None, 'name', 'rate-down')
+        other = Subscriber(None, 'name', 'rate-up')
+        self.rp.register('tlist', tlist.callback, keys=tlist.keys, changed_keys=True)
+        self.rp.register('other', other.callback, keys=other.keys)
+        await self.advance(0)
+        self.assertEqual(tlist.callback.kwargs, {'changed_keys': {1: None, 2: None}})
+        self.assertEqual(other.callback.kwargs, {})
+
+        self.api.tlist[0].update({'id': 1, 'rateDownload': 60, 'rateUpload': 100})
+        await self.advance(self.rp.interval)
+        self.assertEqual(tlist.callback.kwargs, {'changed_keys': {1: {'rate-down', 'status'},
+                                                                  2: set()}})
+
+        # Multiple updates between calls
+        self.api.tlist[0].update({'id': 1, 'rateDownload': 70})
+        self.api.tlist[0].update({'id': 1, 'rateDownload': 80})
+        await self.advance(self.rp.interval)
+        self.assertEqual(tlist.callback.kwargs, {'changed_keys': {1: None, 2: set()}})
+
+        await self.rp.stop()
+
     async def test_raising_fatal_exception(self):
         self.api.exc = RuntimeError('Something is wrong!')
         await self.rp.start()
@@ -231,3 +332,144 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
         self.assertEqual(self.api.calls, apicalls + 1)
 
         await self.rp.stop()
+
+
+class TestFilterCache(unittest.TestCase):
+    def setUp(self):
+        self.tlist = (Torrent({'id': 1, 'name': 'foo', 'rateDownload': 50, 'rateUpload': 100}),
+                      Torrent({'id': 2, 'name': 'bar', 'rateDownload': 0, 'rateUpload': 0}))
+        self.tfilter = TorrentFilter('downloading')
+        self.matched = []
+        match = self.tfilter.match
+
+        def counting_match(t):
+            self.matched.append(t['id'])
+            return match(t)
+        self.tfilter.match = counting_match
+        self.cache = _FilterCache(self.tfilter)
+
+    def test_unchanged_torrents_are_not_matched_again(self):
+        self.assertEqual(self.cache.apply(self.tlist), (self.tlist[0],))
+        self.assertEqual(self.matched, [1, 2])
+        self.assertEqual(self.cache.apply(self.tlist), (self.tlist[0],))
+        self.assertEqual(self.matched, [1, 2])
+
+    def test_torrents_with_changed_needed_keys_are_matched_again(self):
+        self.cache.apply(self.tlist)
+        self.tlist[0].update({'id': 1, 'rateDownload': 0})
+        self.tlist[1].update({'id': 2, 'rateUpload': 10})
+        self.assertEqual(self.cache.apply(self.tlist), ())
+        self.assertEqual(self.matched, [1, 2, 1])
+
+    def test_torrents_that_changed_multiple_times_are_matched_again(self):
+        self.cache.apply(self.tlist)
+        self.tlist[1].update({'id': 2, 'rateUpload': 10})
+        self.tlist[1].update({'id': 2, 'rateUpload': 20})
+        self.assertEqual(self.cache.apply(self.tlist), (self.tlist[0],))
+        self.assertEqual(self.matched, [1, 2, 2])
+
+
+class TestPausedSubscribers(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeTorrentAPI()
+        self.rp = TorrentRequestPool(SimpleNamespace(torrent=self.api))
+        self.foo = Subscriber('name~foo', 'name', 'rate-down')
+        self.bar = Subscriber('name~bar', 'name', 'rate-up')
+        self.rp.register('foo', self.foo.callback, keys=self.foo.keys, tfilter=self.foo.tfilter)
+        self.rp.register('bar', self.bar.callback, keys=self.bar.keys, tfilter=self.bar.tfilter,
+                         changed_keys=True)
+
+    def test_paused_subscribers_are_not_requested(self):
+        self.rp.pause('bar')
+        self.assertTrue(self.rp.is_paused('bar'))
+        self.assertEqual(self.rp.request.keywords['torrents'], self.foo.tfilter)
+        self.assertEqual(self.rp.request.keywords['keys'], set(self.foo.keys_needed))
+
+        self.rp.pause('foo')
+        self.assertEqual(self.rp.request, None)
+        self.assertTrue(self.rp.has_subscribers)
+
+        self.rp.resume('foo')
+        self.rp.resume('bar')
+        self.assertFalse(self.rp.is_paused('bar'))
+        self.assertEqual(self.rp.request.keywords['torrents'], (self.foo + self.bar).tfilter)
+
+    def test_paused_subscribers_are_not_called(self):
+        self.rp.pause('bar')
+        self.rp._handle_torrent_list(Response(success=True, torrents=FAKE_TORRENTS))
+        self.assertEqual(self.foo.callback.calls, 1)
+        self.assertEqual(self.bar.callback.calls, 0)
+
+    def test_resumed_subscribers_catch_up(self):
+        self.rp._handle_torrent_list(Response(success=True, torrents=FAKE_TORRENTS))
+        self.assertEqual(self.bar.callback.kwargs, {'changed_keys': {2: None}})
+        self.rp.pause('bar')
+        self.rp._handle_torrent_list(Response(success=True, torrents=FAKE_TORRENTS))
+        self.assertEqual(self.bar.callback.calls, 1)
+
+        self.rp.resume('bar')
+        self.rp._handle_torrent_list(Response(success=True, torrents=FAKE_TORRENTS))
+        self.assertEqual(self.bar.callback.calls, 2)
+        self.assertEqual(self.bar.callback.args, (FAKE_TORRENTS[1],))
+        self.assertEqual(self.bar.callback.kwargs, {'changed_keys': {2: frozenset()}})
+
+    def test_removed_subscribers_are_not_paused(self):
+        self.rp.pause('bar')
+        self.rp.remove('bar')
+        self.assertFalse(self.rp.is_paused('bar'))
+        self.rp.pause('bar')
+        self.assertFalse(self.rp.is_paused('bar'))
+
+    def test_registering_again_keeps_subscriber_paused(self):
+        self.rp.pause('bar')
+        self.rp.register('bar', self.bar.callback, keys=('name', 'rate-down'), tfilter=self.bar.tfilter,
+                         changed_keys=True)
+        self.assertTrue(self.rp.is_paused('bar'))
+        self.assertEqual(self.rp.request.keywords['torrents'], self.foo.tfilter)
+
+
+class TestSlowKeys(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeTorrentAPI()
+        self.rp = TorrentRequestPool(SimpleNamespace(torrent=self.api), slow_interval=5)
+        self.loop = asyncio.new_event_loop()
+        self.details = Subscriber((2,), 'name', 'rate-down')
+        self.rp.register('details', self.details.callback, keys=self.details.keys,
+                         tfilter=self.details.tfilter, slow_keys=('name', 'count-files', 'peers'))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def request(self, time):
+        self.api.requests.clear()
+        with patch.object(self.loop, 'time', return_value=time):
+            self.loop.run_until_complete(self.rp.request())
+        return [keys for _,keys in self.api.requests]
+
+    def test_slow_keys_are_requested_every_slow_interval(self):
+        self.assertEqual(self.request(0), [{'id', 'name', 'rate-down', 'count-files'}, {'peers'}])
+        self.assertEqual(self.api.requests[1][0], (2,))
+        self.assertEqual(self.request(1), [{'id', 'name', 'rate-down'}])
+        self.assertEqual(self.request(4.9), [{'id', 'name', 'rate-down'}])
+        self.assertEqual(self.request(5), [{'id', 'name', 'rate-down', 'count-files'}, {'peers'}])
+        self.assertEqual(self.request(6), [{'id', 'name', 'rate-down'}])
+
+    def test_polling_requests_slow_keys(self):
+        self.request(0)
+        self.assertEqual(self.request(1), [{'id', 'name', 'rate-down'}])
+        self.rp.poll()
+        self.assertEqual(self.request(2), [{'id', 'name', 'rate-down', 'count-files'}, {'peers'}])
+        self.assertEqual(self.request(3), [{'id', 'name', 'rate-down'}])
+
+    def test_new_subscriber_with_slow_keys(self):
+        self.request(0)
+        self.rp.register('files', FakeCallback(), keys=('name',), tfilter=(2,),
+                         slow_keys=('count-files-wanted',))
+        self.assertEqual(self.request(1), [{'id', 'name', 'rate-down', 'count-files',
+                                            'count-files-wanted'}, {'peers'}])
+
+    def test_slow_keys_of_other_subscribers_are_requested_every_time(self):
+        self.rp.register('peers', FakeCallback(), keys=('name', 'count-files', 'peers'), tfilter=(2,))
+        self.assertEqual(self.rp.request.keywords.get('slow_keys'), None)
+        self.assertEqual(self.request(0), [{'id', 'name', 'rate-down', 'count-files'}, {'peers'}])
+        self.assertEqual(self.request(1), [{'id', 'name', 'rate-down', 'count-files'}, {'peers'}])
@@ -0,0 +1,41 @@
+import json
+import unittest
+from io import StringIO
+
+from stig import batch
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.status = StringIO()
+
+    def run_command(self, cmdline):
+        self.calls.append(cmdline)
+        return {'fail': False, 'tab': None}.get(cmdline.split()[0], True)
+
+    def get_status(self):
+        return [json.loads(line) for line in self.status.getvalue().splitlines()]
+
+    def test_all_commands_succeed(self):
+        success = batch.run(self.run_command, ['ls foo\n', 'start foo ; stop bar\n'], self.status)
+        self.assertIs(success, True)
+        self.assertEqual(self.calls, ['ls foo', 'start foo ; stop bar'])
+        self.assertEqual(self.get_status(), [{'line': 1, 'command': 'ls foo', 'exit': 0},
+                                             {'line': 2, 'command': 'start foo ; stop bar', 'exit': 0}])
+
+    def test_failing_commands_dont_stop_batch(self):
+        success = batch.run(self.run_command, ['fail foo', 'tab ls', 'ls bar'], self.status)
+        self.assertIs(success, False)
+        self.assertEqual(self.calls, ['fail foo', 'tab ls', 'ls bar'])
+        self.assertEqual([s['exit'] for s in self.get_status()], [1, 1, 0])
+
+    def test_empty_lines_and_comments_are_ignored(self):
+        success = batch.run(self.run_command, ['\n', '# ls foo\n', '  ls bar  \n', '   \n'], self.status)
+        self.assertIs(success, True)
+        self.assertEqual(self.calls, ['ls bar'])
+        self.assertEqual(self.get_status(), [{'line': 3, 'command': 'ls bar', 'exit': 0}])
+
+    def test_no_lines(self):
+        self.assertIs(batch.run(self.run_command, [], self.status), True)
+        self.assertEqual(self.status.getvalue(), '')
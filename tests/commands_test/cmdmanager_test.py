@@ -1,7 +1,9 @@
 import asyncio
+import sys
+import types
 
 import asynctest
-from asynctest.mock import call
+from asynctest.mock import call, patch
 from resources_cmd import Callback, make_cmdcls
 
 from stig.commands import CmdError, CommandManager, _CommandBase
@@ -87,6 +89,60 @@ class TestCommandManagerManagement(asynctest.TestCase):
         self.assertIn('interface', str(cm.exception).lower())
 
 
+class TestLazyCommands(asynctest.TestCase):
+    def setUp(self):
+        self.cmd_foo = make_cmdcls(name='foo', aliases=('f',), provides=('cli',))
+        self.cmd_bar = make_cmdcls(name='bar', provides=('cli', 'tui'), run=lambda self: self.retval)
+        self.cmd_bar.retval = 'bar ran'
+        self.module = types.ModuleType('fake_cmds')
+        for cmdcls in (self.cmd_foo, self.cmd_bar):
+            cmdcls.__module__ = self.module.__name__
+            setattr(self.module, cmdcls.__name__, cmdcls)
+        sys.modules[self.module.__name__] = self.module
+        self.manifest = CommandManager.create_manifest(self.module.__name__)
+
+        self.cmdmgr = CommandManager()
+        self.cmdmgr.load_cmds_from_manifest(self.manifest)
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def test_create_manifest(self):
+        self.assertEqual(self.manifest, [
+            {'module': 'fake_cmds', 'clsname': 'BarCommand', 'name': 'bar', 'aliases': [],
+             'provides': ['cli', 'tui'], 'category': 'catfoo', 'description': 'bla'},
+            {'module': 'fake_cmds', 'clsname': 'FooCommand', 'name': 'foo', 'aliases': ['f'],
+             'provides': ['cli'], 'category': 'catfoo', 'description': 'bla'},
+        ])
+
+    def test_manifest_attributes_do_not_import_command(self):
+        with patch('stig.commands.cmdmanager.import_module') as import_module:
+            self.cmdmgr.active_interface = 'cli'
+            foo = self.cmdmgr.get_cmdcls('f')
+            self.assertEqual(foo.name, 'foo')
+            self.assertEqual(foo.names, ['foo', 'f'])
+            self.assertEqual(foo.provides, {'cli'})
+            self.assertEqual(foo.category, 'catfoo')
+            self.assertEqual(foo.description, 'bla')
+            self.assertEqual(self.cmdmgr.get_cmdcls('bar', interface='tui', exclusive=True), None)
+            self.assertEqual(len(tuple(self.cmdmgr.active_commands)), 2)
+        import_module.assert_not_called()
+
+    def test_other_attributes_import_command(self):
+        foo = self.cmdmgr.get_cmdcls('foo', interface='cli')
+        with patch('stig.commands.cmdmanager.import_module', return_value=self.module) as import_module:
+            self.assertEqual(foo.cmdcls, self.cmd_foo)
+            self.assertEqual(foo.run, self.cmd_foo.run)
+        import_module.assert_called_once_with('fake_cmds')
+
+    def test_running_command(self):
+        self.cmdmgr.active_interface = 'tui'
+        with patch('stig.commands.cmdmanager.import_module', return_value=self.module) as import_module:
+            success = self.cmdmgr.run_sync('bar')
+        self.assertEqual(success, True)
+        import_module.assert_called_once_with('fake_cmds')
+
+
 class TestCommandManagerCallsBase(asynctest.ClockedTestCase):
     def setUp(self):
         self.info_handler = Callback()
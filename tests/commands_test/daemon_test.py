@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from stig import daemon
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'stig.sock')
+        self.loop = asyncio.new_event_loop()
+        self.calls = []
+
+    def tearDown(self):
+        self.loop.close()
+        self.tmpdir.cleanup()
+
+    async def run_commands(self, commands):
+        self.calls.append((commands, os.getcwd()))
+        print('output of %s' % commands[0][0])
+        print('complaints', file=sys.stderr)
+        return commands[0][0] != 'fail'
+
+    async def send(self, commands, cwd):
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        writer.write(json.dumps({'commands': commands, 'cwd': cwd}).encode('utf-8') + b'\n')
+        msgs = [json.loads(line) for line in (await reader.read()).decode('utf-8').splitlines()]
+        writer.close()
+        return msgs
+
+    async def wait_for_server(self):
+        while True:
+            try:
+                _, writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                await asyncio.sleep(0.001)
+            else:
+                writer.close()
+                return
+
+    def serve(self, *requests):
+        async def main():
+            stop = asyncio.Event()
+            server = self.loop.create_task(daemon.serve(self.run_commands, path=self.path, stop=stop))
+            await asyncio.wait_for(self.wait_for_server(), timeout=5)
+            try:
+                return [await self.send(*request) for request in requests]
+            finally:
+                stop.set()
+                await server
+        return self.loop.run_until_complete(main())
+
+    def test_output_and_exit_code(self):
+        responses = self.serve(([['ls']], self.tmpdir.name),
+                               ([['fail']], self.tmpdir.name))
+        self.assertEqual(responses[0], [{'stdout': 'output of ls'}, {'stdout': '\n'},
+                                        {'stderr': 'complaints'}, {'stderr': '\n'},
+                                        {'exit': 0}])
+        self.assertEqual(responses[1][-1], {'exit': 1})
+        self.assertEqual(self.calls, [([['ls']], self.tmpdir.name),
+                                      ([['fail']], self.tmpdir.name)])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_nonexisting_cwd(self):
+        cwd = os.getcwd()
+        responses = self.serve(([['ls']], os.path.join(self.tmpdir.name, 'nope')))
+        self.assertEqual(responses[0][-1], {'exit': 1})
+        self.assertEqual(self.calls, [])
+        self.assertEqual(os.getcwd(), cwd)
+
+    def test_stale_socket_is_replaced(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.path)
+        responses = self.serve(([['ls']], self.tmpdir.name))
+        self.assertEqual(responses[0][-1], {'exit': 0})
+
+    def test_running_daemon_is_not_replaced(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.path)
+            sock.listen()
+            with self.assertRaises(daemon.DaemonError):
+                self.loop.run_until_complete(daemon.serve(self.run_commands, path=self.path))
+
+    def test_path_is_not_a_socket(self):
+        open(self.path, 'w').close()
+        with self.assertRaises(daemon.DaemonError):
+            self.loop.run_until_complete(daemon.serve(self.run_commands, path=self.path))
+
+
+class TestClient(unittest.TestCase):
+    def test_no_daemon_running(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('sys.stderr', new_callable=StringIO) as stderr:
+                exit_code = daemon.run_client([['ls']], path=os.path.join(tmpdir, 'stig.sock'))
+        self.assertEqual(exit_code, 1)
+        self.assertIn('Unable to connect', stderr.getvalue())
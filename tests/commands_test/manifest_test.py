@@ -0,0 +1,9 @@
+import unittest
+
+from stig.commands import CommandManager, manifest
+
+
+class TestManifest(unittest.TestCase):
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(CommandManager.create_manifest(*manifest.MODULES), manifest.COMMANDS,
+                         msg='Run "make manifest" to update stig/commands/manifest.py')
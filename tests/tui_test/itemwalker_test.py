@@ -0,0 +1,190 @@
+import unittest
+
+import urwid
+
+from stig.tui.itemwalker import ItemWalker
+
+
+class FakeItemWidget(urwid.Widget):
+    _sizing = frozenset(['flow'])
+
+    def __init__(self, id, data):
+        super().__init__()
+        self.id = id
+        self.text = data
+        self.updates = []
+
+    def update(self, data, changed_keys=None):
+        self.text = data
+        self.updates.append(changed_keys)
+        self._invalidate()
+
+    def rows(self, size, focus=False):
+        return 1
+
+    def render(self, size, focus=False):
+        return urwid.TextCanvas([self.text.ljust(size[0]).encode()], maxcol=size[0])
+
+
+class TestItemWalker(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+        self.reused = []
+        self.discarded = []
+
+        def create_widget(id, data):
+            self.created.append(id)
+            return FakeItemWidget(id, data)
+
+        def reuse_widget(widget, old_id, id, data):
+            self.reused.append((old_id, id))
+            widget.id = id
+            widget.update(data)
+
+        def discard_widget(id, widget):
+            self.discarded.append(id)
+
+        self.walker = ItemWalker(create_widget=create_widget,
+                                 reuse_widget=reuse_widget,
+                                 discard_widget=discard_widget)
+        self.listbox = urwid.ListBox(self.walker)
+
+    def set_items(self, ids, changed_keys=None):
+        data = {id: 'item %d' % id for id in ids}
+        added = self.walker.update(data, changed_keys)
+        self.walker.ids = sorted(set(self.walker.ids).intersection(data) | added)
+
+    def render(self, rows=5):
+        canv = self.listbox.render((20, rows))
+        return [row.decode().rstrip() for row in canv.text]
+
+    def test_only_displayed_widgets_are_created(self):
+        self.set_items(range(1000))
+        self.assertEqual(len(self.walker), 1000)
+        self.assertEqual(self.created, [])
+        self.assertEqual(self.render(), ['item 0', 'item 1', 'item 2', 'item 3', 'item 4'])
+        self.assertEqual(sorted(self.created), [0, 1, 2, 3, 4])
+
+    def test_widgets_are_reused(self):
+        self.walker.max_widgets = 5
+        self.set_items(range(1000))
+        self.render()
+        self.walker.set_focus(500)
+        self.assertEqual(self.render()[0], 'item 500')
+        self.assertEqual(len(self.walker.widgets), 5)
+        self.assertEqual(sorted(id for _,id in self.reused), [500, 501, 502, 503, 504])
+        self.assertEqual(sorted(w.id for w in self.walker.widgets), [500, 501, 502, 503, 504])
+
+    def test_focused_widget_is_not_reused(self):
+        self.walker.max_widgets = 1
+        self.set_items(range(10))
+        focused = self.walker[0]
+        self.walker[1]
+        self.assertEqual(self.reused, [])
+        self.assertEqual(self.walker.get_widget(0), focused)
+        self.assertEqual(len(self.walker.widgets), 2)
+
+        self.walker[2]
+        self.assertEqual(self.reused, [(1, 2)])
+        self.assertEqual(self.walker.get_widget(0), focused)
+
+    def test_updates_are_applied_when_widget_is_displayed(self):
+        self.set_items(range(10))
+        self.render(rows=2)
+        widget = self.walker.get_widget(0)
+        self.assertEqual(widget.updates, [])
+
+        self.walker.update(self.walker.data, {0: frozenset(('foo',)), 1: frozenset()})
+        self.walker.update(self.walker.data, {0: frozenset(('bar',)), 1: frozenset()})
+        self.assertEqual(widget.updates, [])
+        self.render(rows=2)
+        self.assertEqual(widget.updates, [frozenset(('foo', 'bar'))])
+        self.assertEqual(self.walker.get_widget(1).updates, [])
+
+        self.walker.update(self.walker.data, {0: frozenset(('foo',))})
+        self.render(rows=2)
+        self.assertEqual(widget.updates[-1], frozenset(('foo',)))
+        self.assertEqual(self.walker.get_widget(1).updates, [None])
+
+    def test_removed_items_are_discarded(self):
+        self.set_items(range(10))
+        self.render()
+        self.set_items((0, 2, 4, 6, 8))
+        self.assertEqual(sorted(self.discarded), [1, 3])
+        self.assertEqual(self.walker.ids, [0, 2, 4, 6, 8])
+        self.assertEqual(self.render(), ['item 0', 'item 2', 'item 4', 'item 6', 'item 8'])
+
+    def test_focus_stays_on_item(self):
+        self.set_items(range(10))
+        self.walker.set_focus(5)
+        self.walker.ids = list(reversed(self.walker.ids))
+        self.assertEqual(self.walker.focus_id, 5)
+        self.assertEqual(self.walker.focus, 4)
+
+        self.set_items((1, 3, 5, 7, 9))
+        self.assertEqual(self.walker.focus_id, 5)
+        self.assertEqual(self.walker.focus, 2)
+
+        self.set_items((1, 3))
+        self.assertEqual(self.walker.focus_id, 3)
+        self.assertEqual(self.walker.focus, 1)
+
+    def test_clear(self):
+        self.set_items(range(10))
+        self.render()
+        self.walker.clear()
+        self.assertEqual(sorted(self.discarded), [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.walker), 0)
+        self.assertEqual(self.walker.widgets, ())
+        self.assertEqual(self.walker.focus_id, None)
+
+    def test_insert_with_sort_keys(self):
+        self.set_items(range(10))
+        self.walker.reset([0, 2, 4, 6, 8], keys=[0, 2, 4, 6, 8])
+        self.walker.set_focus(2)
+        self.walker.insert(5, key=5)
+        self.walker.insert(1, key=1)
+        self.walker.insert(9, key=9)
+        self.assertEqual(self.walker.ids, [0, 1, 2, 4, 5, 6, 8, 9])
+        self.assertEqual(self.walker.focus_id, 4)
+        self.assertTrue(5 in self.walker)
+        self.assertFalse(3 in self.walker)
+
+    def test_insert_without_sort_keys(self):
+        self.set_items(range(10))
+        self.walker.reset([4, 2, 0])
+        self.walker.insert(3)
+        self.assertEqual(self.walker.ids, [4, 2, 0, 3])
+
+    def test_remove(self):
+        self.set_items(range(10))
+        self.walker.reset([0, 2, 4, 6, 8], keys=[0, 2, 4, 6, 8])
+        self.walker.set_focus(2)
+        self.walker.remove(2)
+        self.assertEqual(self.walker.ids, [0, 4, 6, 8])
+        self.assertEqual(self.walker.focus_id, 4)
+        self.walker.remove(4)
+        self.assertEqual(self.walker.ids, [0, 6, 8])
+        self.assertEqual(self.walker.focus_id, 6)
+        self.walker.remove(8)
+        self.assertEqual(self.walker.focus_id, 6)
+        self.assertEqual(self.walker.get_key(6), 6)
+
+    def test_move(self):
+        self.set_items(range(10))
+        self.walker.reset([0, 2, 4, 6, 8], keys=[0, 2, 4, 6, 8])
+        self.walker.set_focus(1)
+        self.walker.move(2, key=7)
+        self.assertEqual(self.walker.ids, [0, 4, 6, 2, 8])
+        self.assertEqual(self.walker.focus_id, 2)
+        self.walker.move(6, key=-1)
+        self.assertEqual(self.walker.ids, [6, 0, 4, 2, 8])
+        self.assertEqual(self.walker.focus_id, 2)
+
+    def test_remove_with_same_sort_keys(self):
+        self.set_items(range(10))
+        self.walker.reset([0, 1, 2, 3, 4], keys=['a', 'b', 'b', 'b', 'c'])
+        self.walker.remove(3)
+        self.assertEqual(self.walker.ids, [0, 1, 2, 4])
+        self.walker.insert(3, key='b')
+        self.assertEqual(self.walker.ids, [0, 1, 2, 3, 4])
@@ -0,0 +1,55 @@
+import asynctest
+
+from stig.tui.main import RedrawScheduler
+
+
+class TestRedrawScheduler(asynctest.ClockedTestCase):
+    def setUp(self):
+        self.draws = 0
+
+        def draw():
+            self.draws += 1
+        self.redraw = RedrawScheduler(draw=draw, fps=10)
+
+    async def test_requests_are_coalesced(self):
+        for _ in range(5):
+            self.redraw.request()
+        self.assertEqual(self.draws, 0)
+        self.assertTrue(self.redraw.pending)
+        await self.advance(0)
+        self.assertEqual(self.draws, 1)
+        self.assertFalse(self.redraw.pending)
+        self.assertEqual(self.redraw.requested, 5)
+        self.assertEqual(self.redraw.performed, 1)
+
+    async def test_redraws_are_limited_by_fps(self):
+        self.redraw.request()
+        await self.advance(0)
+        self.assertEqual(self.draws, 1)
+
+        self.redraw.request()
+        self.redraw.request()
+        await self.advance(0.05)
+        self.assertEqual(self.draws, 1)
+        await self.advance(0.05)
+        self.assertEqual(self.draws, 2)
+
+        await self.advance(1)
+        self.redraw.request()
+        await self.advance(0)
+        self.assertEqual(self.draws, 3)
+        self.assertEqual(self.redraw.requested, 4)
+        self.assertEqual(self.redraw.performed, 3)
+
+    async def test_cancel(self):
+        self.redraw.request()
+        self.redraw.cancel()
+        await self.advance(1)
+        self.assertEqual(self.draws, 0)
+        self.assertFalse(self.redraw.pending)
+
+    def test_fps_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            self.redraw.fps = 0
+        self.redraw.fps = '60'
+        self.assertEqual(self.redraw.fps, 60)
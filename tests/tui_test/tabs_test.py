@@ -513,3 +513,48 @@ class TestTabsKeyPress(unittest.TestCase):
         self.check(tab_pos=1, content_pos=None, edit_pos=0)
         self.tabs.keypress(self.size, 'left')
         self.check(tab_pos=0, content_pos=0, edit_pos=0)
+
+
+class PausableText(urwid.Text):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.paused = False
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+
+class TestTabsPauseHidden(unittest.TestCase):
+    def setUp(self):
+        self.contents = [PausableText('Tab %d' % i) for i in range(3)]
+        self.tabs = Tabs(*((urwid.Text('Tab%d' % i), w) for i,w in enumerate(self.contents)))
+
+    def paused(self):
+        return [w.paused for w in self.tabs.contents]
+
+    def test_nothing_is_paused_by_default(self):
+        self.assertEqual(self.paused(), [False, False, False])
+
+    def test_hidden_tabs_are_paused(self):
+        self.tabs.pause_hidden = True
+        self.assertEqual(self.tabs.focus_position, 2)
+        self.assertEqual(self.paused(), [True, True, False])
+        self.tabs.focus_position = 0
+        self.assertEqual(self.paused(), [False, True, True])
+        self.tabs.pause_hidden = False
+        self.assertEqual(self.paused(), [False, False, False])
+
+    def test_tabs_loaded_in_background_are_paused(self):
+        self.tabs.pause_hidden = True
+        self.tabs.insert(urwid.Text('Tab3'), PausableText('Tab 3'), focus=False)
+        self.assertEqual(self.paused(), [True, True, False, True])
+        self.tabs.set_content(PausableText('Tab 3'), position=3)
+        self.assertEqual(self.paused(), [True, True, False, True])
+
+    def test_removing_focused_tab_resumes_new_focus(self):
+        self.tabs.pause_hidden = True
+        self.tabs.remove()
+        self.assertEqual(self.paused(), [True, False])
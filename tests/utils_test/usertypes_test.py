@@ -447,6 +447,16 @@ class TestFloat(_TestBase):
         self.assertEqual(n.without_unit, '1M')
         self.assertEqual(n.with_unit, '1Mf')
 
+    def test_arguments_are_shared(self):
+        a = Float(1, unit='f', min=0)
+        b = Float(2, unit='f', min=0)
+        self.assertIs(a._args, b._args)
+        self.assertIs(a._config, b._config)
+
+        c = Float(2, unit='f', min=False)
+        self.assertIsNot(a._args, c._args)
+        self.assertIs(c._args['min'], False)
+
     def test_argument_convert_to(self):
         n = Float(1000, unit='B', convert_to='b')
         self.assertEqual(str(n), '8kb')